@@ -6,6 +6,7 @@ import logging
 
 from AI.prompts import PERSON_SYSTEM, RELATIONSHIP_SYSTEM, YEARLY_SYSTEM, HEALTH_SYSTEM, HEALTH_DAILY_SYSTEM, HEALTH_MONTHLY_SYSTEM, HEALTH_YEARLY_SYSTEM, MONTHLY_SYSTEM, DAILY_SYSTEM, ANCHORS, PROFESSION_SYSTEM
 from AI.settings import settings
+from AI.limits import provider_limited
 from AI.swot import generate_swot_from_interpretation
 
 # replace report imports from core with features:
@@ -21,6 +22,7 @@ from numerology.features.health_report import (
     health_yearly_report,        # NEW
 )
 from numerology.features.profession_report import profession_report
+from numerology.context import TriangleContext
 
 
 from numerology.traits import NUMBER_MEANINGS, F_TRAIT,HEALTH_MEANINGS
@@ -967,11 +969,11 @@ def _summarize_health_report(full: dict) -> dict:
     return summary
 
 
-def _summarize_profession_report(dob: str) -> dict:
+def _summarize_profession_report(dob: str, *, ctx: Optional[TriangleContext] = None) -> dict:
     """
     Build a compact, LLM-ready view of Mulank/Bhagyank-based profession mapping.
     """
-    base = profession_report(dob)  # deterministic JSON from numerology.features.profession_report
+    base = profession_report(dob, ctx=ctx)  # deterministic JSON from numerology.features.profession_report
 
     m = base.get("mulank")
     b = base.get("bhagyank")
@@ -1311,6 +1313,7 @@ def _mock_generate_profession(grounding: dict | str, facts: dict) -> dict:
 
 
 
+@provider_limited("openai")
 def _openai_generate(grounding: str, facts: Dict[str, Any], mode: str = "person") -> Dict[str, Any]:
     """
     Ask OpenAI for a *single* plain-language paragraph under the 'interpretation' key.
@@ -1364,6 +1367,7 @@ def _openai_generate(grounding: str, facts: Dict[str, Any], mode: str = "person"
     return json.loads(text)
 
 
+@provider_limited("ollama")
 def _ollama_generate(grounding: str, facts: Dict[str, Any], mode: str = "person") -> Dict[str, Any]:
     import json, requests
 
@@ -1439,8 +1443,8 @@ def _ollama_generate(grounding: str, facts: Dict[str, Any], mode: str = "person"
 
 # ---------------------------- entry point ----------------------------
 
-def generate_interpretation(dob: str) -> AIInterpretation:
-    report = mystical_triangle_report(dob)
+def generate_interpretation(dob: str, *, ctx: Optional[TriangleContext] = None) -> AIInterpretation:
+    report = mystical_triangle_report(dob, ctx=ctx)
     facts = _summarize_person_report(report)  # ← facts first
     grounding = _compose_grounding_for(       # ← grounding after facts
         "person",
@@ -1522,12 +1526,12 @@ def generate_relationship_interpretation(dob_left: str, dob_right: str) -> AIInt
         return AIInterpretation(**raw)
 
     
-def generate_yearly_interpretation(dob: str, year: int) -> AIInterpretation:
+def generate_yearly_interpretation(dob: str, year: int, *, ctx: Optional[TriangleContext] = None) -> AIInterpretation:
     """
     Build the deterministic combined yearly triangle (DOB ⊕ Year),
     summarize key facts, and ask the AI for a one-paragraph interpretation.
     """
-    report = yearly_triangle_report(dob, year)
+    report = yearly_triangle_report(dob, year, ctx=ctx)
     facts = _summarize_yearly_report(report)
     grounding = _compose_grounding_for(
         "person",  # same base as personal
@@ -1564,12 +1568,12 @@ def generate_yearly_interpretation(dob: str, year: int) -> AIInterpretation:
         return AIInterpretation(**raw)
 
 
-def generate_monthly_interpretation(dob: str, year: int, month: int) -> AIInterpretation:
+def generate_monthly_interpretation(dob: str, year: int, month: int, *, ctx: Optional[TriangleContext] = None) -> AIInterpretation:
     """
     Build the deterministic monthly report (DOB ⊕ Month-Year driver),
     summarize ONE target month, and ask the AI for a short interpretation.
     """
-    monthly = monthly_prediction_report(dob, year)
+    monthly = monthly_prediction_report(dob, year, ctx=ctx)
     facts = _summarize_monthly_report(monthly, month)
     grounding = _compose_grounding_for(
         "person",
@@ -1613,12 +1617,12 @@ def generate_monthly_interpretation(dob: str, year: int, month: int) -> AIInterp
 
     
     
-def generate_daily_interpretation(dob: str, day: Optional[str] = None) -> AIInterpretation:
+def generate_daily_interpretation(dob: str, day: Optional[str] = None, *, ctx: Optional[TriangleContext] = None) -> AIInterpretation:
     """
     Build the deterministic daily report (DOB ⊕ [Today or a specific date]),
     summarize combined facts, and ask the AI for a one-paragraph interpretation.
     """
-    report = daily_triangle_report(dob, right_day=day)
+    report = daily_triangle_report(dob, right_day=day, ctx=ctx)
     facts = _summarize_daily_report(report)
     grounding = _compose_grounding_for(
         "person",
@@ -1657,12 +1661,12 @@ def generate_daily_interpretation(dob: str, day: Optional[str] = None) -> AIInte
 
     
     
-def generate_health_interpretation(dob: str, gender: Optional[str] = None) -> AIInterpretation:
+def generate_health_interpretation(dob: str, gender: Optional[str] = None, *, ctx: Optional[TriangleContext] = None) -> AIInterpretation:
     """
     Build the deterministic health triangle (numerology.features.health),
     then ask the chosen LLM for a plain paragraph (or deterministic mock).
     """
-    report = health_triangle_report(dob, gender=gender)
+    report = health_triangle_report(dob, gender=gender, ctx=ctx)
     facts = _summarize_health_report(report)
     grounding = _compose_grounding_for("health", used_digits=facts.get("_used_digits"),facts=facts,)
 
@@ -1695,11 +1699,13 @@ def generate_health_interpretation(dob: str, gender: Optional[str] = None) -> AI
 
 
 
-def generate_health_daily_interpretation(dob: str, day: Optional[str] = None, gender: Optional[str] = None) -> AIInterpretation:
+def generate_health_daily_interpretation(
+    dob: str, day: Optional[str] = None, gender: Optional[str] = None, *, ctx: Optional[TriangleContext] = None
+) -> AIInterpretation:
     """
     Health interpretation for the combined DAILY triangle (DOB ⊕ Day).
     """
-    report = health_daily_report(dob, day=day, gender=gender)
+    report = health_daily_report(dob, day=day, gender=gender, ctx=ctx)
     facts = _summarize_health_report(report)
     grounding = _compose_grounding_for("health", used_digits=facts.get("_used_digits"),facts=facts,)
 
@@ -1732,12 +1738,14 @@ def generate_health_daily_interpretation(dob: str, day: Optional[str] = None, ge
 
 
 
-def generate_health_monthly_interpretation(dob: str, year: int, gender: Optional[str] = None) -> AIInterpretation:
+def generate_health_monthly_interpretation(
+    dob: str, year: int, gender: Optional[str] = None, *, ctx: Optional[TriangleContext] = None
+) -> AIInterpretation:
     """
     Health interpretation for the combined MONTHLY driver (DOB ⊕ Month-Year driver).
     (This yields a year-scoped health report with month slots inside; we still summarize the whole.)
     """
-    report = health_monthly_report(dob, year, gender=gender)
+    report = health_monthly_report(dob, year, gender=gender, ctx=ctx)
     facts = _summarize_health_report(report)
     grounding = _compose_grounding_for("health", used_digits=facts.get("_used_digits"),facts=facts,)
 
@@ -1770,11 +1778,13 @@ def generate_health_monthly_interpretation(dob: str, year: int, gender: Optional
 
 
 
-def generate_health_yearly_interpretation(dob: str, year: int, gender: Optional[str] = None) -> AIInterpretation:
+def generate_health_yearly_interpretation(
+    dob: str, year: int, gender: Optional[str] = None, *, ctx: Optional[TriangleContext] = None
+) -> AIInterpretation:
     """
     Health interpretation for the combined YEARLY triangle (DOB ⊕ Year-only).
     """
-    report = health_yearly_report(dob, year, gender=gender)
+    report = health_yearly_report(dob, year, gender=gender, ctx=ctx)
     facts = _summarize_health_report(report)
     grounding = _compose_grounding_for("health", used_digits=facts.get("_used_digits"),facts=facts,)
 
@@ -1806,12 +1816,12 @@ def generate_health_yearly_interpretation(dob: str, year: int, gender: Optional[
         return AIInterpretation(**raw)
 
 
-def generate_profession_interpretation(dob: str) -> AIInterpretation:
+def generate_profession_interpretation(dob: str, *, ctx: Optional[TriangleContext] = None) -> AIInterpretation:
     """
     Build the deterministic profession report (Mulank + Bhagyank → PAIRS),
     summarize it, and ask the AI for a career-style interpretation.
     """
-    facts = _summarize_profession_report(dob)
+    facts = _summarize_profession_report(dob, ctx=ctx)
     grounding = _compose_grounding_for(
         "profession",
         used_digits=facts.get("_used_digits"),
@@ -1,6 +1,10 @@
 # AI/ai_api.py  (TOP OF FILE)
 from __future__ import annotations
+import logging
+from concurrent.futures import BrokenExecutor
 from io import BytesIO
+from typing import Any, Dict, Optional, Tuple
+
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 
@@ -23,10 +27,28 @@ from AI.swot import generate_swot_from_interpretation
 from numerology.features.relationship_report import relationship_triangle_report
 from numerology.viz import build_triangle_png_bytes  # if needed anywhere
 from numerology.pdf import build_ai_master_report_pdf ,build_ai_report_pdf
+from numerology.render_pool import PDF_POOL, PoolBusy
 
 
 
 router = APIRouter(prefix="/ai", tags=["AI"])
+logger = logging.getLogger(__name__)
+
+
+# PDF builds (LLM calls + ReportLab + matplotlib) run on the bounded PDF pool,
+# not on the event loop or the shared threadpool. They run in a worker
+# process, so the provider/model used is returned along with the bytes.
+def _report_pdf_job(dob: str) -> Tuple[bytes, Dict[str, Optional[str]]]:
+    return build_ai_report_pdf(dob), get_last_used()
+
+
+def _master_report_pdf_job(kwargs: Dict[str, Any]) -> Tuple[bytes, Dict[str, Optional[str]]]:
+    return build_ai_master_report_pdf(**kwargs), get_last_used()
+
+
+def _pool_unavailable(e: Exception) -> HTTPException:
+    """503 for a full PDF pool (PoolBusy) or a crashed worker (BrokenExecutor; the pool restarts it)."""
+    return HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
 
 
 @router.get("/summary")
@@ -89,7 +111,7 @@ def ai_summary(
 
 
 @router.get("/report.pdf")
-def ai_report_pdf(
+async def ai_report_pdf(
     dob: str = Query(..., description="Date of birth in DD-MM-YYYY", min_length=8, max_length=10)
 ):
     ensure_allowed("single")
@@ -100,13 +122,14 @@ def ai_report_pdf(
       GET /numerology/ai/report.pdf?dob=DD-MM-YYYY
     """
     try:
-        pdf_bytes = build_ai_report_pdf(dob)
+        pdf_bytes, used = await PDF_POOL.run(_report_pdf_job, dob)
+    except (PoolBusy, BrokenExecutor) as e:
+        raise _pool_unavailable(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to build PDF: {e}")
 
     # The PDF builder calls generate_interpretation() internally,
     # so we can expose which provider/model was used.
-    used = get_last_used()
     headers = {
         "Content-Disposition": f'inline; filename="mystical-triangle-{dob}.pdf"',
         "X-AI-Provider": used.get("provider") or "",
@@ -424,7 +447,7 @@ def ai_profession_summary(
 
 
 @router.get("/master-report.pdf", summary="Generate a combined AI PDF report")
-def ai_master_report_pdf(
+async def ai_master_report_pdf(
     dob: str = Query(..., description="Date of birth (DD-MM-YYYY or YYYY-MM-DD)"),
     name: str | None = Query(
         None, description="Optional name to show on the PDF front page"
@@ -468,7 +491,7 @@ def ai_master_report_pdf(
 
     # First try: full master report
     try:
-        pdf_bytes = build_ai_master_report_pdf(
+        pdf_bytes, used = await PDF_POOL.run(_master_report_pdf_job, dict(
             dob=dob,
             name=name,
             mobile=mobile,
@@ -479,17 +502,18 @@ def ai_master_report_pdf(
             month=month,
             gender=gender,
             include_images=include_images,
-        )
+        ))
+    except (PoolBusy, BrokenExecutor) as e:
+        raise _pool_unavailable(e)
     except Exception as e:
         # Log full stacktrace for debugging in console
         logger.exception("build_ai_master_report_pdf failed for dob=%s", dob)
 
         # Optional fallback: simple 1-page AI report so the endpoint still returns *something*
         try:
-            fallback_bytes = build_ai_report_pdf(dob)
-            pdf_bytes = fallback_bytes
+            pdf_bytes, used = await PDF_POOL.run(_report_pdf_job, dob)
             # Expose that we had to fall back, so you can see it from headers
-            used = get_last_used() or {}
+            used = used or {}
             headers = {
                 "Content-Disposition": f'inline; filename="master-report-fallback-{dob}.pdf"',
                 "X-AI-Provider": used.get("provider") or "",
@@ -501,6 +525,8 @@ def ai_master_report_pdf(
                 media_type="application/pdf",
                 headers=headers,
             )
+        except (PoolBusy, BrokenExecutor) as e2:
+            raise _pool_unavailable(e2)
         except Exception as e2:
             # If even fallback fails, bubble up with full context
             raise HTTPException(
@@ -509,7 +535,7 @@ def ai_master_report_pdf(
             )
 
     # Normal success path
-    used = get_last_used() or {}
+    used = used or {}
     headers = {
         "Content-Disposition": f'inline; filename="master-report-{dob}.pdf"',
         "X-AI-Provider": used.get("provider") or "",
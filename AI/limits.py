@@ -0,0 +1,127 @@
+# AI/limits.py
+"""
+Per-provider concurrency limits for LLM calls.
+
+The master PDF generates its sections in parallel (numerology.pdf), and the
+API serves several reports at once from several gunicorn workers, each with
+its own PDF pool processes (numerology.render_pool). Without a shared cap the
+host could open dozens of requests against a provider: OpenAI answers with
+429s and a local Ollama queues them anyway. Every provider call takes a slot
+first:
+
+    @provider_limited("openai")
+    def _openai_generate(...): ...
+
+A provider has `limit` slot files under AI_LIMITS_DIR (default: a temp dir);
+a call holds an exclusive flock on one of them, so the limit holds across
+every process on the host, and the kernel frees the slot if its process
+dies. A per-process semaphore in front keeps threads from polling for slots
+their own process cannot use. Where flock is unavailable (Windows
+development) only that per-process semaphore applies.
+
+Limits come from settings (AI_OPENAI_CONCURRENCY, AI_OLLAMA_CONCURRENCY);
+providers without a limit (mock) run unthrottled. A call that waits longer
+than AI_TIMEOUT for a slot raises TimeoutError (the generators then fall
+back like on any provider error).
+"""
+from __future__ import annotations
+import functools
+import os
+import random
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from AI.settings import settings
+
+try:  # POSIX: host-wide slots
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: per-process limit only
+    fcntl = None
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+LOCK_DIR = Path(os.getenv("AI_LIMITS_DIR") or Path(tempfile.gettempdir()) / "asb-ai-limits")
+_POLL = 0.05   # seconds between sweeps over a provider's slot files
+
+_lock = threading.Lock()
+_slots: Dict[str, "_Slots"] = {}
+
+
+def provider_limit(provider: str) -> Optional[int]:
+    limit = getattr(settings, f"{provider}_concurrency", None)
+    return max(1, int(limit)) if limit is not None else None
+
+
+class _Slots:
+    """At most `limit` holders of a provider's slot at once, host-wide."""
+
+    def __init__(self, provider: str, limit: int):
+        self.provider = provider
+        self.limit = limit
+        self.local = threading.BoundedSemaphore(limit)
+
+    def _lock_file(self, deadline: float) -> int:
+        LOCK_DIR.mkdir(parents=True, exist_ok=True)
+        paths = [LOCK_DIR / f"{self.provider}.{i}.lock" for i in range(self.limit)]
+        while True:
+            first = random.randrange(self.limit)   # spread waiters over the slots
+            for path in paths[first:] + paths[:first]:
+                fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return fd
+                except BlockingIOError:
+                    os.close(fd)
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"No free {self.provider} slot (limit {self.limit})")
+            time.sleep(_POLL)
+
+    @contextmanager
+    def hold(self, timeout: float) -> Iterator[None]:
+        deadline = time.monotonic() + timeout
+        if not self.local.acquire(timeout=timeout):
+            raise TimeoutError(f"No free {self.provider} slot (limit {self.limit})")
+        try:
+            fd = self._lock_file(deadline) if fcntl is not None else None
+            try:
+                yield
+            finally:
+                if fd is not None:
+                    os.close(fd)   # releases the flock
+        finally:
+            self.local.release()
+
+
+def _provider_slots(provider: str) -> Optional[_Slots]:
+    with _lock:
+        slots = _slots.get(provider)
+        if slots is None:
+            limit = provider_limit(provider)
+            if limit is None:
+                return None
+            slots = _slots[provider] = _Slots(provider, limit)
+        return slots
+
+
+def provider_limited(provider: str) -> Callable[[F], F]:
+    """Decorator: at most provider_limit(provider) calls of any decorated function at once, host-wide."""
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            slots = _provider_slots(provider)
+            if slots is None:
+                return fn(*args, **kwargs)
+            with slots.hold(settings.timeout_seconds):
+                return fn(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorate
+
+
+def reset() -> None:
+    """Forget the slots, so changed limits apply (tests)."""
+    with _lock:
+        _slots.clear()
@@ -26,6 +26,16 @@ class Settings(BaseSettings):
     # Connect timeout (just establishing TCP)
     timeout_connect_seconds: int = int(os.getenv("AI_CONNECT_TIMEOUT", "10"))
     max_tokens: int = int(os.getenv("AI_MAX_TOKENS", "400"))
+
+    # --- Concurrency ---
+    # Calls in flight at once per provider on this host: shared by every API worker
+    # and PDF pool process through flock'ed slot files (AI/limits.py, AI_LIMITS_DIR).
+    # Without flock (Windows) the limit is per process.
+    openai_concurrency: int = int(os.getenv("AI_OPENAI_CONCURRENCY", "8"))
+    ollama_concurrency: int = int(os.getenv("AI_OLLAMA_CONCURRENCY", "2"))
+    # Master PDF: sections generated in parallel, and the wall-clock budget for all of them
+    report_workers: int = int(os.getenv("AI_REPORT_WORKERS", "6"))
+    report_deadline_seconds: int = int(os.getenv("AI_REPORT_DEADLINE", "360"))
     language: str = os.getenv("AI_LANG", "en")
 
 settings = Settings()
@@ -6,6 +6,7 @@ import logging
 import requests
 
 from AI.settings import settings
+from AI.limits import provider_limited
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +108,7 @@ def _heuristic_swot(text: str) -> Dict[str, List[str]]:
 # ──────────────────────────────────────────────────────────────
 # LLM-based SWOT: OpenAI
 # ──────────────────────────────────────────────────────────────
+@provider_limited("openai")
 def _openai_swot(text: str) -> Dict[str, List[str]]:
     from openai import OpenAI
 
@@ -168,6 +170,7 @@ def _openai_swot(text: str) -> Dict[str, List[str]]:
 # ──────────────────────────────────────────────────────────────
 # LLM-based SWOT: Ollama
 # ──────────────────────────────────────────────────────────────
+@provider_limited("ollama")
 def _ollama_swot(text: str) -> Dict[str, List[str]]:
     """
     Ask an Ollama model (e.g. llama3) to classify SWOT and return JSON.
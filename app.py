@@ -1,4 +1,6 @@
 # app.py
+import os
+
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -18,6 +20,29 @@ app.add_middleware(
 
 app.include_router(main_router)
 
+# Optional warm-up of the per-triangle signal/polarity caches for all 10,000
+# ABCD triangles: NUMEROLOGY_PRECOMPUTE=all, or a comma-separated list of
+# feature types (e.g. "person,health,profession"). "all" costs roughly 90 MB and
+# several seconds; under deploy/gunicorn.conf.py (preload_app) that is paid once
+# in the master and shared by the workers.
+_precompute = (os.getenv("NUMEROLOGY_PRECOMPUTE") or "").strip()
+if _precompute:
+    from numerology.features.special_numbers import precompute_signal_cache
+    from numerology.traits import precompute_polarity_cache
+
+    precompute_polarity_cache()
+    precompute_signal_cache(
+        None if _precompute.lower() in ("1", "all", "true") else
+        [f.strip() for f in _precompute.split(",") if f.strip()]
+    )
+
+# Map the shared per-ABCD tables now so that, with gunicorn's preload_app, every
+# worker inherits the mapping (see deploy/gunicorn.conf.py).
+from numerology.shared_tables import get_shared_tables
+
+get_shared_tables()
+
+
 @app.get("/", tags=["Health"])
 def health_check():
     return {"ok": True, "service": "ASB API"}
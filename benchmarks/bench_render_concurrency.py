@@ -0,0 +1,86 @@
+# benchmarks/bench_render_concurrency.py
+"""
+JSON latency while PNG renders are in flight: inline rendering vs the render pool.
+
+    python -m benchmarks.bench_render_concurrency [--renders 4] [--seconds 5]
+
+Drives the ASGI app in one event loop (as one uvicorn worker does). For each
+mode, `--renders` clients request triptych PNGs back to back while a probe
+requests a cheap cached JSON report every few ms; prints the probe's p50/p99
+latency, next to an idle baseline. The image cache is off, so every PNG renders:
+  idle     no renders in flight
+  inline   renders run on the event loop (the old handlers)
+  process  renders on the bounded process pool (numerology.render_pool)
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import time
+from typing import List
+
+import httpx
+import numpy as np
+
+from app import app
+from numerology import num_api, render_service
+from numerology.image_cache import ImageCache
+from numerology.render_pool import WorkerPool
+
+PROBE = "/api/numerology/mystical-triangle.report.json"
+RENDER = "/api/numerology/mystical-triangle-triptych.png"
+
+
+async def _renderer(client: httpx.AsyncClient, stop: asyncio.Event, i: int, done: List[int]) -> None:
+    n = 0
+    while not stop.is_set():
+        r = await client.get(RENDER, params={"left": f"{1 + (i + n) % 28:02d}-05-1990", "right": "today"})
+        r.raise_for_status()
+        n += 1
+    done.append(n)
+
+
+async def _probe(client: httpx.AsyncClient, seconds: float) -> np.ndarray:
+    out = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        t0 = time.perf_counter()
+        (await client.get(PROBE, params={"dob": "29-10-2001"})).raise_for_status()
+        out.append(time.perf_counter() - t0)
+        await asyncio.sleep(0.005)
+    return np.array(out) * 1000
+
+
+async def _scenario(renders: int, seconds: float) -> tuple[np.ndarray, int]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get(PROBE, params={"dob": "29-10-2001"})   # warm the report cache
+        if renders:
+            await client.get(RENDER, params={"left": "01-05-1990"})   # start the workers
+        stop, done = asyncio.Event(), []
+        tasks = [asyncio.create_task(_renderer(client, stop, i, done)) for i in range(renders)]
+        await asyncio.sleep(0.2)
+        latencies = await _probe(client, seconds)
+        stop.set()
+        await asyncio.gather(*tasks)
+    return latencies, sum(done)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--renders", type=int, default=4, help="concurrent PNG clients")
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--workers", type=int, default=2, help="render pool processes")
+    args = ap.parse_args()
+
+    num_api.IMAGE_CACHE = ImageCache(0)
+    print(f"{'mode':<9}{'probe p50 ms':>14}{'probe p99 ms':>14}{'probes':>8}{'PNGs':>7}")
+    for mode in ("idle", "inline", "process"):
+        pool = WorkerPool("render", args.workers, 32, "inline" if mode == "idle" else mode, render_service.warm)
+        num_api.RENDER_POOL = pool
+        lat, pngs = asyncio.run(_scenario(0 if mode == "idle" else args.renders, args.seconds))
+        pool.shutdown()
+        print(f"{mode:<9}{np.percentile(lat, 50):>14.2f}{np.percentile(lat, 99):>14.2f}{lat.size:>8}{pngs:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_report_endpoints.py
+"""
+Report endpoints: FastAPI's dict encoding vs pre-encoded bytes (p50/p99).
+
+    python -m benchmarks.bench_report_endpoints [--dobs 300] [--year 2026]
+
+For each report kind, times the handler's work per request:
+  dict     build the report, jsonable_encoder + JSONResponse render (the old path)
+  encoded  build the report, fast_json.dumps (a bytes-cache miss)
+  cached   a template cache hit (same canonical key), echo fields rendered in
+The report store is switched off so "encoded" measures live builds.
+"""
+from __future__ import annotations
+import argparse
+import os
+import time
+from datetime import date, timedelta
+from typing import Callable, List
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+os.environ["NUMEROLOGY_REPORT_STORE"] = "off"
+
+from numerology.fast_json import dumps  # noqa: E402
+from numerology.num_api import _DETERMINISTIC, _encoded, _template  # noqa: E402
+
+
+def _timings(fn: Callable[[tuple], object], calls: List[tuple]) -> np.ndarray:
+    out = np.empty(len(calls))
+    for i, args in enumerate(calls):
+        t0 = time.perf_counter()
+        fn(args)
+        out[i] = time.perf_counter() - t0
+    return out * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--dobs", type=int, default=300)
+    ap.add_argument("--year", type=int, default=date.today().year)
+    args = ap.parse_args()
+
+    first = date(1950, 1, 1)
+    dobs = [(first + timedelta(days=97 * i)).strftime("%d-%m-%Y") for i in range(args.dobs)]
+    kinds = {
+        "single": [(d,) for d in dobs],
+        "profession": [(d,) for d in dobs],
+        "health": [(d, None) for d in dobs],
+        "yearly": [(d, args.year) for d in dobs],
+        "monthly": [(d, args.year) for d in dobs],
+    }
+
+    print(f"{'kind':<12}{'path':<9}{'p50 µs':>10}{'p99 µs':>10}")
+    for kind, calls in kinds.items():
+        build = _DETERMINISTIC[kind].build
+        for a in calls:   # warm the per-triangle memos so every path sees the same state
+            build(*a)
+        paths = {
+            "dict": lambda a: JSONResponse(jsonable_encoder(build(*a))).body,
+            "encoded": lambda a: dumps(build(*a)),
+            "cached": lambda a: _encoded(kind, *a),
+        }
+        _template.cache_clear()
+        for a in calls:
+            _encoded(kind, *a)
+        for name, fn in paths.items():
+            t = _timings(fn, calls)
+            print(f"{kind:<12}{name:<9}{np.percentile(t, 50):>10.1f}{np.percentile(t, 99):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# benchmarks/bench_special_signals.py
+"""
+scan_special_signals: compiled rule tables vs the reference per-rule loop.
+
+    python -m benchmarks.bench_special_signals [--keys 10000] [--repeat 3]
+
+Scans the triangles of the first N ABCD keys for every feature_type and prints
+the per-call cost of both paths (best of --repeat runs).
+"""
+from __future__ import annotations
+import argparse
+import time
+
+from numerology.core import Triangle
+from numerology.reads import build_reads
+from numerology.features.special_numbers import (
+    SPECIAL_RULES,
+    scan_special_signals,
+    _scan_special_signals_reference,
+)
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--keys", type=int, default=10_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    tris = [Triangle.from_abcd(k // 1000, k // 100 % 10, k // 10 % 10, k % 10) for k in range(args.keys)]
+    reads = [build_reads(t) for t in tris]   # as the reports pass them
+    features = sorted({f for r in SPECIAL_RULES for f in r["feature"]})
+
+    print(f"{'feature':<14}{'reference µs':>14}{'compiled µs':>14}{'speedup':>10}")
+    tot_ref = tot_new = 0.0
+    for ft in features:
+        def run(scan):
+            return lambda: [scan(feature_type=ft, final_values=t, final_reads=r) for t, r in zip(tris, reads)]
+        ref = _best(run(_scan_special_signals_reference), args.repeat)
+        new = _best(run(scan_special_signals), args.repeat)
+        tot_ref += ref
+        tot_new += new
+        n = len(tris)
+        print(f"{ft:<14}{ref / n * 1e6:>14.2f}{new / n * 1e6:>14.2f}{ref / new:>9.2f}x")
+    print(f"{'all':<14}{tot_ref / (n * len(features)) * 1e6:>14.2f}"
+          f"{tot_new / (n * len(features)) * 1e6:>14.2f}{tot_ref / tot_new:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# deploy/gunicorn.conf.py
+"""
+    gunicorn -c deploy/gunicorn.conf.py app:app
+
+The app is imported once in the master (preload_app) and the workers are forked
+from it, so the trait tables, compiled rules, any NUMEROLOGY_PRECOMPUTE warm-up
+and the mapped shared tables (python -m numerology.shared_tables) are shared
+copy-on-write instead of rebuilt per worker. Everything loaded so far is
+frozen (gc.freeze) before each fork, so the workers' GC passes do not write to
+(and un-share) those pages; each worker then re-enables its collector.
+
+Rendering runs outside the workers' event loops, on per-worker process pools
+started lazily after the fork (numerology.render_pool). Each worker may add
+NUMEROLOGY_RENDER_WORKERS + NUMEROLOGY_PDF_WORKERS processes (2 + 2 by
+default), so size WEB_CONCURRENCY with that in mind.
+"""
+import gc
+import os
+
+bind = os.getenv("ASB_BIND", "127.0.0.1:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+
+def pre_fork(server, worker):
+    gc.disable()   # nothing collects between the freeze and the fork
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
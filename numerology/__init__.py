@@ -16,11 +16,23 @@ from .features.single_person_report import mystical_triangle_report
 from .features.relationship_report import relationship_triangle_report
 from .traits import F_TRAIT, NUMBER_MEANINGS, COMPOUND_TRAITS, meaning, num_traits
 from .core import year_only_triangle, yearly_combined_triangle
+from .core import CELLS, TRIANGLE_DTYPE, mystical_triangle_values_batch
+from .core import Triangle, as_triangle, dob_triangle
+from .core import (
+    combine_triangles_batch,
+    daily_combined_triangle_range,
+    monthly_combined_triangle_range,
+    yearly_combined_triangle_range,
+)
 
 __all__ = [
     # core
     "mystical_triangle_values_image", "full_reduce", "mystical_triangle_today",
     "combine_two_triangles", "_collect_used_numbers","year_only_triangle", "yearly_combined_triangle",
+    "CELLS", "TRIANGLE_DTYPE", "mystical_triangle_values_batch",
+    "Triangle", "as_triangle", "dob_triangle",
+    "combine_triangles_batch", "daily_combined_triangle_range",
+    "monthly_combined_triangle_range", "yearly_combined_triangle_range",
     # reads
     "build_reads",
     # viz
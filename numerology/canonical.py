@@ -0,0 +1,74 @@
+# numerology/canonical.py
+"""
+Canonical keys for request inputs.
+
+Everything derived from a date of birth depends only on its ABCD digits, and
+everything derived from a target year only on the year's C/D digits; a
+calendar day is just a date. Caches key on these rather than on the raw
+strings, so "29-10-2001", "2001-10-29", "29/10/2001" (and every other DOB with
+the same digits) share one entry, and "today" resolves to the date it means.
+
+Each key maps back to a representative input that produces it, which is what a
+cache builds from on a miss:
+
+    dob_key("29/10/2001") == "2121"      dob_for_key("2121") == "02-01-0201"
+    year_key(2034) == "27"               year_for_key("27") == 207
+    day_key("today") == "2026-10-17"     day_for_key("2026-10-17") == "17-10-2026"
+
+Reports that repeat the raw input back (`dob`, `year`, ...) are cached as
+templates with those fields cut out (fast_json.EchoTemplate).
+"""
+from __future__ import annotations
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from numerology.core import parse_dob, _dob_abcd, _year_cd
+
+
+def is_today(day: Optional[str]) -> bool:
+    """True for a day argument meaning today (omitted, empty or 'today')."""
+    return not day or str(day).strip().lower() == "today"
+
+
+def abcd_key(digits: Iterable[int]) -> str:
+    return "".join(str(d) for d in digits)
+
+
+@lru_cache(maxsize=8192)
+def dob_key(dob_str: str) -> str:
+    """ABCD digits of a DOB string ("DD-MM-YYYY", "YYYY-MM-DD", "/" separators)."""
+    return abcd_key(_dob_abcd(parse_dob(dob_str)))
+
+
+def dob_for_key(key: str) -> str:
+    """A DOB with ABCD `key`: day=A, month=B, year=C*100+D (A and B are never 0)."""
+    a, b, c, d = (int(ch) for ch in key)
+    return f"{a:02d}-{b:02d}-{c * 100 + d:04d}"
+
+
+def year_key(year: int) -> str:
+    """C/D digits of a driver year. Years outside 0..9999 are keyed as themselves."""
+    year = int(year)
+    if not 0 <= year <= 9999:
+        return f"={year}"
+    return abcd_key(_year_cd(year))
+
+
+def year_for_key(key: str) -> int:
+    if key.startswith("="):
+        return int(key[1:])
+    c, d = (int(ch) for ch in key)
+    return c * 100 + d
+
+
+def day_key(day: Optional[str]) -> str:
+    """ISO date of a calendar day; omitted or 'today' resolves to today's date."""
+    if is_today(day):
+        return date.today().isoformat()
+    return parse_dob(str(day)).isoformat()
+
+
+def day_for_key(key: str) -> str:
+    """The day in DD-MM-YYYY, the form day labels use for 'today'."""
+    return date.fromisoformat(key).strftime("%d-%m-%Y")
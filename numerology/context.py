@@ -0,0 +1,137 @@
+# numerology/context.py
+"""
+Request-scoped memo for everything derived from one DOB.
+
+Aggregating callers (profile bulletins, the master PDF) run many feature
+builders for the same person. A TriangleContext is created once per request
+and passed as `ctx=` to each builder so the parsed date, the base triangle,
+the driver/combined triangles and their reads, polarity, specials and traits
+are each computed once. Results are shared between builders: treat them as
+read-only.
+
+It also holds the report's generated (LLM) texts: generated() keys them by
+mode + canonical inputs, so the PDF sections, the SWOT and the profession
+helper share one narrative per mode instead of each asking the provider.
+"""
+from __future__ import annotations
+import threading
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from numerology.core import (
+    Triangle,
+    parse_dob,
+    _collect_used_numbers,
+    _dob_abcd,
+    _month_year_driver,
+    _right_day_triangle,
+    _year_driver,
+)
+from numerology.canonical import is_today
+from numerology.reads import build_reads
+from numerology.traits import num_traits, summarize_polarity
+from numerology.features.special_numbers import scan_special_signals
+
+
+def _day_key(day: Optional[str]) -> str:
+    return "today" if is_today(day) else str(day)
+
+
+class TriangleContext:
+    """Per-request cache of DOB-derived triangles and their artifacts."""
+
+    def __init__(self, dob_str: str, *, base: Optional[Triangle] = None):
+        self.dob_str = dob_str
+        self._memo: Dict[Tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+        self._building: Dict[Tuple[Any, ...], threading.Lock] = {}
+        if base is not None:   # already computed by the caller (e.g. a batch of DOBs at once)
+            self._memo[("base",)] = base
+
+    def _once(self, key: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = build()
+            return value
+
+    # ── inputs ──
+    @property
+    def dob(self) -> date:
+        return self._once(("dob",), lambda: parse_dob(self.dob_str))
+
+    @property
+    def base(self) -> Triangle:
+        """DOB triangle (same as dob_triangle(dob_str))."""
+        return self._once(("base",), lambda: Triangle.from_abcd(*_dob_abcd(self.dob)))
+
+    @property
+    def mulank_bhagyank(self) -> Tuple[int, int]:
+        """(Mulank, Bhagyank) = (A, G) of the DOB triangle."""
+        return self.base.A, self.base.G
+
+    # ── drivers ──
+    def day_driver(self, day: Optional[str] = None) -> Tuple[Triangle, str]:
+        """Calendar-day triangle and its label (None/'today' → today)."""
+        return self._once(("day", _day_key(day)), lambda: _right_day_triangle(day))
+
+    def year_driver(self, year: int) -> Triangle:
+        return self._once(("year", int(year)), lambda: _year_driver(year))
+
+    def month_year_driver(self, year: int) -> Triangle:
+        return self._once(("month_year", int(year)), lambda: _month_year_driver(self.dob.month, year))
+
+    # ── combined (DOB ⊕ driver) ──
+    def daily(self, day: Optional[str] = None) -> Triangle:
+        return self._once(("daily", _day_key(day)), lambda: self.base.combine(self.day_driver(day)[0]))
+
+    def yearly(self, year: int) -> Triangle:
+        return self._once(("yearly", int(year)), lambda: self.base.combine(self.year_driver(year)))
+
+    def monthly(self, year: int) -> Triangle:
+        return self._once(("monthly", int(year)), lambda: self.base.combine(self.month_year_driver(year)))
+
+    # ── per-triangle artifacts ──
+    def reads(self, tri: Triangle) -> Dict[str, int]:
+        return self._once(("reads", tri.cells), lambda: build_reads(tri))
+
+    def polarity(self, tri: Triangle) -> Dict[str, Any]:
+        return self._once(("polarity", tri.cells), lambda: summarize_polarity(tri))
+
+    def signals(self, feature_type: str, tri: Triangle) -> Optional[Dict[str, Any]]:
+        return self._once(
+            ("signals", feature_type, tri.cells),
+            lambda: scan_special_signals(feature_type=feature_type, final_values=tri, final_reads=self.reads(tri)),
+        )
+
+    def used_numbers(self, tri: Triangle) -> List[int]:
+        return self._once(("used", tri.cells), lambda: sorted(_collect_used_numbers(tri)))
+
+    def traits(self, tri: Triangle) -> Dict[int, dict]:
+        return self._once(("traits", tri.cells), lambda: {n: num_traits(n) for n in self.used_numbers(tri)})
+
+    # ── generated texts ──
+    def generated(self, mode: str, inputs: Tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        """
+        build() for (mode, canonical inputs), run once per context. Sections
+        generated in parallel may ask at the same time: the first builds, the
+        others wait for its result. A build that raises is not remembered.
+        """
+        key = ("generated", mode, *inputs)
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+            building = self._building.setdefault(key, threading.Lock())
+        with building:
+            if key not in self._memo:
+                self._memo[key] = build()
+            return self._memo[key]
+
+
+def ensure_context(dob_str: str, ctx: Optional[TriangleContext] = None) -> TriangleContext:
+    """The caller's context for this DOB, or a fresh one when none was passed."""
+    if ctx is None:
+        return TriangleContext(dob_str)
+    if ctx.dob_str != dob_str:
+        raise ValueError(f"TriangleContext is for DOB {ctx.dob_str!r}, not {dob_str!r}")
+    return ctx
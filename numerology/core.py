@@ -1,6 +1,12 @@
 from __future__ import annotations
-from datetime import datetime, date
-from typing import Dict, Tuple, Optional
+from array import array
+import re
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Tuple, Optional, Union
+
+import numpy as np
 
 
 # ── Reducers & parsing helpers ────────────────────────────────────────────────
@@ -10,15 +16,33 @@ def full_reduce(n: int) -> int:
         n = sum(int(d) for d in str(n))
     return n
 
-def parse_dob(dob_str: str) -> date:
-    dob_str = dob_str.strip().replace("/", "-")
-    for fmt in ("%d-%m-%Y", "%Y-%m-%d"):
+# The same field patterns datetime.strptime uses for %d, %m and %Y, so these
+# accept exactly what strptime("%d-%m-%Y") / strptime("%Y-%m-%d") accepted.
+_DAY, _MON, _YEAR = r"(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])", r"(1[0-2]|0[1-9]|[1-9])", r"(\d\d\d\d)"
+_DMY = re.compile(f"{_DAY}-{_MON}-{_YEAR}")
+_YMD = re.compile(f"{_YEAR}-{_MON}-{_DAY}")
+
+
+@lru_cache(maxsize=8192)
+def _parse_date(s: str) -> date:
+    m = _DMY.fullmatch(s)
+    if m:
+        try:
+            return date(int(m[3]), int(m[2]), int(m[1]))
+        except ValueError:
+            pass
+    m = _YMD.fullmatch(s)
+    if m:
         try:
-            return datetime.strptime(dob_str, fmt).date()
+            return date(int(m[1]), int(m[2]), int(m[3]))
         except ValueError:
             pass
     raise ValueError("Use DD-MM-YYYY or YYYY-MM-DD")
 
+
+def parse_dob(dob_str: str) -> date:
+    return _parse_date(dob_str.strip().replace("/", "-"))
+
 def _header_chunks(d: date) -> tuple[str, str, str, str]:
     day = f"{d.day:02d}"
     mon = f"{d.month:02d}"
@@ -26,6 +50,8 @@ def _header_chunks(d: date) -> tuple[str, str, str, str]:
     return day, mon, year[:2], year[2:]
 
 def _collect_used_numbers(vals: Dict[str, Dict[str, int]]) -> set[int]:
+    if isinstance(vals, Triangle):
+        return set(vals.cells)
     used: set[int] = set()
     for section in ("inputs", "layer1", "second_layer", "third_layer"):
         for n in vals[section].values():
@@ -33,51 +59,366 @@ def _collect_used_numbers(vals: Dict[str, Dict[str, int]]) -> set[int]:
     return used
 
 
-# ── Core math ─────────────────────────────────────────────────────────────────
-def mystical_triangle_values_image(dob_str: str) -> Dict[str, Dict[str, int]]:
-    dob = parse_dob(dob_str)
-    day, mon, year = dob.day, dob.month, dob.year
-    year_str = f"{year:04d}"
-
-    # A = full reduce of day
-    A = full_reduce(day)
-    # B = full reduce of month
-    B = full_reduce(mon)
-    # C = full reduce of first 2 digits of year
-    first2 = int(year_str[:2])
-    C = full_reduce(first2)
-    # D = full reduce of last 2 digits of year
-    last2  = int(year_str[2:])
-    D = full_reduce(last2)
-
-    # E,F,G
-    E = full_reduce(A + B)
-    F = full_reduce(C + D)
-    G = full_reduce(E + F)
+# ── Precomputed triangle table ────────────────────────────────────────────────
+# Every triangle is a pure function of its inputs A,B,C,D (each 0..9), so all
+# 10,000 of them are built once at import and kept as 18 bytes per key
+# (cells in CELLS order). The public builders only extract A..D and look up.
+CELLS: Tuple[str, ...] = (
+    "A", "B", "C", "D", "E", "F", "G", "H", "I",
+    "J", "K", "L", "M", "N", "O", "P", "Q", "R",
+)
+_N_CELLS = len(CELLS)
+
+# full_reduce(a + b) for every sum of two digits (0..18)
+_PAIR_REDUCE: Tuple[int, ...] = tuple(full_reduce(n) for n in range(19))
+
+
+def _reduce_pair(a: int, b: int) -> int:
+    s = a + b
+    return _PAIR_REDUCE[s] if 0 <= s <= 18 else full_reduce(s)
+
+
+def _compute_cells(A: int, B: int, C: int, D: int) -> Tuple[int, ...]:
+    """Reference pipeline: A..D → all 18 cells (A..R)."""
+    E = _reduce_pair(A, B)
+    F = _reduce_pair(C, D)
+    G = _reduce_pair(E, F)
 
     # Baseline & clusters
-    I = full_reduce(A + E)
-    J = full_reduce(B + E)
-    H = full_reduce(I + J)
-    K = full_reduce(C + F)
-    L = full_reduce(D + F)
-    M = full_reduce(K + L)
-
-    N = full_reduce(F + G)
-    O = full_reduce(E + G)
-    P = full_reduce(N + O)
-    Q = full_reduce(O + P)
-    R = full_reduce(N + P)
+    I = _reduce_pair(A, E)
+    J = _reduce_pair(B, E)
+    H = _reduce_pair(I, J)
+    K = _reduce_pair(C, F)
+    L = _reduce_pair(D, F)
+    M = _reduce_pair(K, L)
+
+    N = _reduce_pair(F, G)
+    O = _reduce_pair(E, G)
+    P = _reduce_pair(N, O)
+    Q = _reduce_pair(O, P)
+    R = _reduce_pair(N, P)
+    return (A, B, C, D, E, F, G, H, I, J, K, L, M, N, O, P, Q, R)
+
+
+def _build_triangle_table() -> array:
+    table = array("B")
+    for key in range(10_000):
+        table.extend(_compute_cells(key // 1000, key // 100 % 10, key // 10 % 10, key % 10))
+    return table
+
+
+_TRIANGLE_TABLE: array = _build_triangle_table()
+
+
+def _abcd_key(A: int, B: int, C: int, D: int) -> int:
+    return ((A * 10 + B) * 10 + C) * 10 + D
 
+
+def _cells_from_abcd(A: int, B: int, C: int, D: int) -> Tuple[int, ...]:
+    """O(1) table lookup; falls back to the pipeline for inputs outside 0..9."""
+    if 0 <= A <= 9 and 0 <= B <= 9 and 0 <= C <= 9 and 0 <= D <= 9:
+        start = _abcd_key(A, B, C, D) * _N_CELLS
+        return tuple(_TRIANGLE_TABLE[start:start + _N_CELLS])
+    return _compute_cells(A, B, C, D)
+
+
+def _values_from_cells(cells) -> Dict[str, Dict[str, int]]:
+    A, B, C, D, E, F, G, H, I, J, K, L, M, N, O, P, Q, R = cells
     return {
         "inputs": {"A": A, "B": B, "C": C, "D": D},
         "layer1": {"E": E, "F": F, "G": G},
-        "core": {"core_pair": int(f"{E}{F}"), "G": G, "P_outcome": P},
+        "core": {"core_pair": E * 10 + F, "G": G, "P_outcome": P},
         "second_layer": {"H": H, "I": I, "J": J, "K": K, "L": L, "M": M},
         "third_layer": {"N": N, "O": O, "P": P, "Q": Q, "R": R},
     }
 
 
+# ── Triangle value object ─────────────────────────────────────────────────────
+_VALUE_SECTIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("inputs", CELLS[0:4]),
+    ("layer1", CELLS[4:7]),
+    ("second_layer", CELLS[7:13]),
+    ("third_layer", CELLS[13:18]),
+)
+_CELL_INDEX: Dict[str, int] = {c: i for i, c in enumerate(CELLS)}
+_TRIANGLE_BYTES: bytes = _TRIANGLE_TABLE.tobytes()
+
+
+class Triangle:
+    """
+    Immutable triangle: 18 cells (A..R) packed into one bytes string.
+
+      t.G, t[6], t["G"]   → cell value
+      t["inputs"]         → section dict (same access pattern as the nested dict)
+      t.flat              → cached read-only {label: value} view
+      t.to_dict()         → fresh nested dict in the public JSON shape
+    """
+    __slots__ = ("_cells", "_flat")
+
+    def __init__(self, cells: Union[bytes, Iterable[int]]):
+        cells = bytes(cells)
+        if len(cells) != _N_CELLS:
+            raise ValueError(f"Triangle needs {_N_CELLS} cells, got {len(cells)}")
+        object.__setattr__(self, "_cells", cells)
+        object.__setattr__(self, "_flat", None)
+
+    @classmethod
+    def from_abcd(cls, A: int, B: int, C: int, D: int) -> "Triangle":
+        if 0 <= A <= 9 and 0 <= B <= 9 and 0 <= C <= 9 and 0 <= D <= 9:
+            start = _abcd_key(A, B, C, D) * _N_CELLS
+            return cls(_TRIANGLE_BYTES[start:start + _N_CELLS])
+        return cls(_compute_cells(A, B, C, D))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Triangle is immutable")
+
+    @property
+    def cells(self) -> bytes:
+        return self._cells
+
+    @property
+    def abcd_key(self) -> int:
+        """0..9999 index of the A..D inputs (the lookup-table key)."""
+        c = self._cells
+        return _abcd_key(c[0], c[1], c[2], c[3])
+
+    @property
+    def flat(self) -> Mapping[str, int]:
+        flat = self._flat
+        if flat is None:
+            flat = MappingProxyType(dict(zip(CELLS, self._cells)))
+            object.__setattr__(self, "_flat", flat)
+        return flat
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        return _values_from_cells(self._cells)
+
+    def combine(self, other: "Triangle") -> "Triangle":
+        """Cell-wise add + full-reduce (same rule as combine_two_triangles)."""
+        pr = _PAIR_REDUCE
+        return Triangle(bytes(pr[a + b] for a, b in zip(self._cells, other._cells)))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        if isinstance(key, int):
+            return self._cells[key]
+        idx = _CELL_INDEX.get(key)
+        if idx is not None:
+            return self._cells[idx]
+        for name, labels in _VALUE_SECTIONS:
+            if name == key:
+                return {c: self._cells[_CELL_INDEX[c]] for c in labels}
+        if key == "core":
+            c = self._cells
+            return {"core_pair": c[4] * 10 + c[5], "G": c[6], "P_outcome": c[15]}
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._cells)
+
+    def __len__(self) -> int:
+        return _N_CELLS
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Triangle):
+            return self._cells == other._cells
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._cells)
+
+    def __repr__(self) -> str:
+        return f"Triangle({''.join(map(str, self._cells))})"
+
+
+for _i, _c in enumerate(CELLS):
+    setattr(Triangle, _c, property(lambda self, _i=_i: self._cells[_i]))
+del _i, _c
+
+
+def as_triangle(vals: Union[Triangle, Mapping[str, Mapping[str, int]]]) -> Triangle:
+    """Accept a Triangle or the nested values dict; return a Triangle."""
+    if isinstance(vals, Triangle):
+        return vals
+    flat: Dict[str, int] = {}
+    for section, _labels in _VALUE_SECTIONS:
+        flat.update(vals[section])
+    return Triangle(int(flat[c]) for c in CELLS)
+
+
+def _flat_values(vals: Union[Triangle, Mapping[str, Mapping[str, int]]]) -> Mapping[str, int]:
+    """Label → value view of either representation (no copy for a Triangle)."""
+    if isinstance(vals, Triangle):
+        return vals.flat
+    flat: Dict[str, int] = {}
+    for section, _labels in _VALUE_SECTIONS:
+        flat.update(vals.get(section) or {})
+    return flat
+
+
+def _triangle_signature(vals) -> Optional[bytes]:
+    """
+    18-byte A..R signature used as a cache key, or None when `vals` is not a
+    complete, canonically ordered triangle of plain ints (those skip caches).
+    """
+    if isinstance(vals, Triangle):
+        return vals._cells
+    if not all(isinstance(vals.get(section), dict) for section, _labels in _VALUE_SECTIONS):
+        return None
+    flat = _flat_values(vals)
+    if tuple(flat) != CELLS or not all(type(v) is int and 0 <= v <= 255 for v in flat.values()):
+        return None
+    return bytes(flat.values())
+
+
+def _dob_abcd(dob: date) -> Tuple[int, int, int, int]:
+    """A=reduce(day), B=reduce(month), C/D=reduce(first/last two year digits)."""
+    return (
+        full_reduce(dob.day),
+        full_reduce(dob.month),
+        full_reduce(dob.year // 100),
+        full_reduce(dob.year % 100),
+    )
+
+
+def _year_cd(year: int) -> Tuple[int, int]:
+    """C/D for the driver triangles: reduce(first two) and reduce(last two) year digits."""
+    y = f"{int(year):04d}"
+    return full_reduce(int(y[:2])), full_reduce(int(y[2:]))
+
+
+# ── Core math ─────────────────────────────────────────────────────────────────
+def dob_triangle(dob_str: str) -> Triangle:
+    """Triangle for a date of birth (same values as mystical_triangle_values_image)."""
+    return Triangle.from_abcd(*_dob_abcd(parse_dob(dob_str)))
+
+
+def mystical_triangle_values_image(dob_str: str) -> Dict[str, Dict[str, int]]:
+    return dob_triangle(dob_str).to_dict()
+
+
+
+
+# ── Batch (vectorized) triangles ──────────────────────────────────────────────
+# One row per date, one uint8 field per cell (A..R). Same values as the scalar
+# builders, computed with digital-root arithmetic instead of per-value str().
+TRIANGLE_DTYPE = np.dtype([(c, np.uint8) for c in CELLS])
+
+
+# reduce(a + b) for two cell values (sums of two digits never exceed 18)
+_PAIR_REDUCE_U8 = np.array(_PAIR_REDUCE, dtype=np.uint8)
+
+# (E..R cell, left operand, right operand) in pipeline order, as CELLS indexes
+_PIPELINE = tuple(
+    (_CELL_INDEX[out], _CELL_INDEX[a], _CELL_INDEX[b])
+    for out, a, b in (
+        ("E", "A", "B"), ("F", "C", "D"), ("G", "E", "F"),
+        ("I", "A", "E"), ("J", "B", "E"), ("H", "I", "J"),
+        ("K", "C", "F"), ("L", "D", "F"), ("M", "K", "L"),
+        ("N", "F", "G"), ("O", "E", "G"), ("P", "N", "O"),
+        ("Q", "O", "P"), ("R", "N", "P"),
+    )
+)
+
+
+def _digit_root(n: np.ndarray) -> np.ndarray:
+    """Vectorized full_reduce: 1..9 for n > 0, n itself otherwise."""
+    n = np.asarray(n, dtype=np.int64)
+    return np.where(n > 0, 1 + (n - 1) % 9, n)
+
+
+def _triangle_cells_batch(A: np.ndarray, B: np.ndarray, C: np.ndarray, D: np.ndarray) -> np.ndarray:
+    """Inputs A..D (digits 0..9) → TRIANGLE_DTYPE rows; E..R via the digit-root table."""
+    cells = np.empty((np.shape(A)[0], _N_CELLS), dtype=np.uint8)
+    cells[:, 0] = A; cells[:, 1] = B; cells[:, 2] = C; cells[:, 3] = D
+    pr = _PAIR_REDUCE_U8
+    for out, a, b in _PIPELINE:
+        cells[:, out] = pr[cells[:, a] + cells[:, b]]
+    return cells.view(TRIANGLE_DTYPE).reshape(-1)
+
+
+def _ymd_from_dates(dates) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split dates (datetime64, date objects, ISO or DD-MM-YYYY strings) into y/m/d arrays."""
+    try:
+        d64 = np.asarray(dates, dtype="datetime64[D]")
+    except ValueError:
+        d64 = np.array([parse_dob(str(s)) for s in dates], dtype="datetime64[D]")
+    months = d64.astype("datetime64[M]")
+    year = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = months.astype(np.int64) % 12 + 1
+    day = (d64 - months).astype(np.int64) + 1
+    return year, month, day
+
+
+def mystical_triangle_values_batch(
+    dates=None,
+    *,
+    day=None,
+    month=None,
+    year=None,
+) -> np.ndarray:
+    """
+    Vectorized mystical_triangle_values_image for many DOBs at once.
+
+    Pass either `dates` (datetime64 array, datetime.date objects or date strings)
+    or parallel integer arrays `day`, `month`, `year`. Returns a structured array
+    with dtype TRIANGLE_DTYPE (fields A..R), one row per input date.
+    """
+    if dates is not None:
+        year, month, day = _ymd_from_dates(dates)
+    elif day is None or month is None or year is None:
+        raise ValueError("Pass dates=… or all of day=, month=, year=")
+    day = np.asarray(day, dtype=np.int64)
+    month = np.asarray(month, dtype=np.int64)
+    year = np.asarray(year, dtype=np.int64)
+    return _triangle_cells_batch(
+        _digit_root(day),
+        _digit_root(month),
+        _digit_root(year // 100),
+        _digit_root(year % 100),
+    )
+
+
+def _cell_matrix(tris) -> np.ndarray:
+    """(N,) TRIANGLE_DTYPE or (N, 18) ints → (N, 18) uint8 view/copy."""
+    arr = np.ascontiguousarray(tris)
+    if arr.dtype == TRIANGLE_DTYPE:
+        return arr.view(np.uint8).reshape(-1, _N_CELLS)
+    return arr.astype(np.uint8, copy=False).reshape(-1, _N_CELLS)
+
+
+def combine_triangles_batch(base, drivers) -> np.ndarray:
+    """
+    Broadcast combine: (one triangle) ⊕ (N driver triangles) → N combined triangles.
+
+    `base` is a Triangle or values dict; `drivers` is a TRIANGLE_DTYPE array
+    (or an (N, 18) int array). Same add + full-reduce rule as
+    combine_two_triangles, done as one table lookup over the whole array.
+    """
+    base_cells = np.frombuffer(as_triangle(base).cells, dtype=np.uint8)
+    combined = _PAIR_REDUCE_U8[base_cells + _cell_matrix(drivers)]
+    return np.ascontiguousarray(combined).view(TRIANGLE_DTYPE).reshape(-1)
+
+
+def _as_date(d) -> date:
+    return d if isinstance(d, date) else parse_dob(str(d))
+
+
+def _year_range(start_year: int, end_year: int) -> np.ndarray:
+    start_year, end_year = int(start_year), int(end_year)
+    if not (1 <= start_year <= end_year <= 9999):
+        raise ValueError("Year range must satisfy 1 <= start_year <= end_year <= 9999")
+    return np.arange(start_year, end_year + 1, dtype=np.int64)
+
+
+def _year_drivers_batch(years: np.ndarray, B=0) -> np.ndarray:
+    zeros = np.zeros_like(years)
+    return _triangle_cells_batch(zeros, zeros + B, _digit_root(years // 100), _digit_root(years % 100))
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -95,8 +436,7 @@ def combine_two_triangles(vals1: Dict[str, Dict[str, int]],
     Combine two triangles by adding corresponding fields then full-reducing.
     Rebuilds `core` from the combined E/F/P so it is coherent.
     """
-    def add_reduce(a: int, b: int) -> int:
-        return full_reduce(a + b)
+    add_reduce = _reduce_pair
 
     combined = {
         "inputs": {k: add_reduce(vals1["inputs"][k], vals2["inputs"][k]) for k in vals1["inputs"]},
@@ -115,19 +455,23 @@ def combine_two_triangles(vals1: Dict[str, Dict[str, int]],
 
 # --- Right-hand (day) helpers -------------------------------------------------
 
+def _right_day_triangle(day_str: Optional[str]) -> tuple[Triangle, str]:
+    """Triangle form of _resolve_right_day()."""
+    if not day_str or str(day_str).strip().lower() == "today":
+        label = date.today().strftime("%d-%m-%Y")
+        return dob_triangle(label), label
+    # keep the label exactly as provided so UI echoes back what caller sent
+    return dob_triangle(day_str), day_str
+
+
 def _resolve_right_day(day_str: Optional[str]) -> tuple[Dict[str, Dict[str, int]], str]:
     """
     Build the right-hand triangle from a calendar day.
     If day_str is None or 'today' (case-insensitive), use today's date.
     Returns: (right_triangle_values, right_label_string_DD-MM-YYYY)
     """
-    if not day_str or str(day_str).strip().lower() == "today":
-        label = date.today().strftime("%d-%m-%Y")
-        return mystical_triangle_today(), label
-    # accepts DD-MM-YYYY or YYYY-MM-DD (your parse_dob already supports both)
-    vals = mystical_triangle_values_image(day_str)
-    # keep the label exactly as provided so UI echoes back what caller sent
-    return vals, day_str
+    tri, label = _right_day_triangle(day_str)
+    return tri.to_dict(), label
 
 def daily_combined_triangle(dob_str: str, day: Optional[str] = None) -> Dict[str, Dict[str, int]]:
     """
@@ -144,43 +488,25 @@ def daily_combined_triangle(dob_str: str, day: Optional[str] = None) -> Dict[str
 # --- put near your other helpers ---
 def _triangle_from_abcd(A: int, B: int, C: int, D: int) -> Dict[str, Dict[str, int]]:
     """Build a triangle starting from given A,B,C,D using the same pipeline."""
-    E = full_reduce(A + B)
-    F = full_reduce(C + D)
-    G = full_reduce(E + F)
+    return _values_from_cells(_cells_from_abcd(A, B, C, D))
 
-    I = full_reduce(A + E)
-    J = full_reduce(B + E)
-    H = full_reduce(I + J)
+def _year_driver(year: int) -> Triangle:
+    """Triangle form of year_only_triangle()."""
+    return Triangle.from_abcd(0, 0, *_year_cd(year))
 
-    K = full_reduce(C + F)
-    L = full_reduce(D + F)
-    M = full_reduce(K + L)
 
-    N = full_reduce(F + G)
-    O = full_reduce(E + G)
-    P = full_reduce(N + O)
-    Q = full_reduce(O + P)
-    R = full_reduce(N + P)
+def _month_year_driver(month: int, year: int) -> Triangle:
+    """Triangle form of the month-year drivers (A=0, B=reduce(month), C/D from year)."""
+    return Triangle.from_abcd(0, full_reduce(int(month)), *_year_cd(year))
 
-    return {
-        "inputs": {"A": A, "B": B, "C": C, "D": D},
-        "layer1": {"E": E, "F": F, "G": G},
-        "core": {"core_pair": int(f"{E}{F}"), "G": G, "P_outcome": P},
-        "second_layer": {"H": H, "I": I, "J": J, "K": K, "L": L, "M": M},
-        "third_layer": {"N": N, "O": O, "P": P, "Q": Q, "R": R},
-    }
 
 def year_only_triangle(year: int) -> Dict[str, Dict[str, int]]:
     """
     Right-side 'year triangle' used for yearly prediction:
     A=0, B=0; C = reduce(first two digits), D = reduce(last two digits).
     """
-    y = f"{int(year):04d}"
-    A = 0
-    B = 0
-    C = full_reduce(int(y[:2]))
-    D = full_reduce(int(y[2:]))
-    return _triangle_from_abcd(A, B, C, D)
+    C, D = _year_cd(year)
+    return _triangle_from_abcd(0, 0, C, D)
 
 def yearly_combined_triangle(dob_str: str, year: int) -> Dict[str, Dict[str, int]]:
     """
@@ -202,13 +528,9 @@ def month_year_driver_triangle(dob_str: str, year: int) -> dict:
       D = reduce(last two digits of year)
     Then build the full triangle via the same A,B,C,D pipeline.
     """
-    d = parse_dob(dob_str)               # you already have this
-    y = f"{int(year):04d}"
-    A = 0
-    B = full_reduce(d.month)
-    C = full_reduce(int(y[:2]))
-    D = full_reduce(int(y[2:]))
-    return _triangle_from_abcd(A, B, C, D)  # reuse your shared math
+    d = parse_dob(dob_str)
+    C, D = _year_cd(year)
+    return _triangle_from_abcd(0, full_reduce(d.month), C, D)
 
 def monthly_combined_triangle(dob_str: str, year: int) -> dict:
     """Left = DOB triangle; Right = month-year driver; Combined = add+reduce."""
@@ -225,12 +547,36 @@ def month_year_driver_triangle_selected(month: int, year: int) -> Dict[str, Dict
       C = full_reduce(first two digits of year)
       D = full_reduce(last two digits of year)
     """
-    y = f"{int(year):04d}"
-    A = 0
-    B = full_reduce(int(month))
-    C = full_reduce(int(y[:2]))
-    D = full_reduce(int(y[2:]))
-    return _triangle_from_abcd(A, B, C, D)
+    C, D = _year_cd(year)
+    return _triangle_from_abcd(0, full_reduce(int(month)), C, D)
+
+
+# --- Range variants (one DOB against many drivers) ----------------------------
+
+def daily_combined_triangle_range(dob_str: str, start, end) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    DOB ⊕ every calendar day in [start, end] (inclusive; dates or date strings).
+    Returns (days as datetime64[D], combined TRIANGLE_DTYPE array) — row i equals
+    daily_combined_triangle(dob_str, days[i]).
+    """
+    first, last = _as_date(start), _as_date(end)
+    if last < first:
+        raise ValueError("end must not be before start")
+    days = np.arange(np.datetime64(first, "D"), np.datetime64(last, "D") + 1)
+    return days, combine_triangles_batch(dob_triangle(dob_str), mystical_triangle_values_batch(days))
+
+
+def yearly_combined_triangle_range(dob_str: str, start_year: int, end_year: int) -> Tuple[np.ndarray, np.ndarray]:
+    """DOB ⊕ year-only driver for every year in [start_year, end_year]. Returns (years, combined)."""
+    years = _year_range(start_year, end_year)
+    return years, combine_triangles_batch(dob_triangle(dob_str), _year_drivers_batch(years))
+
+
+def monthly_combined_triangle_range(dob_str: str, start_year: int, end_year: int) -> Tuple[np.ndarray, np.ndarray]:
+    """DOB ⊕ month-year driver (B from the DOB month) for every year in range. Returns (years, combined)."""
+    years = _year_range(start_year, end_year)
+    B = full_reduce(parse_dob(dob_str).month)
+    return years, combine_triangles_batch(dob_triangle(dob_str), _year_drivers_batch(years, B))
 
 
 def mulank_bhagyank_from_dob(dob_str: str) -> tuple[int, int]:
@@ -240,7 +586,7 @@ def mulank_bhagyank_from_dob(dob_str: str) -> tuple[int, int]:
       • Bhagyank = G (E+F reduced)
     without modifying mystical_triangle_values_image structure.
     """
-    vals = mystical_triangle_values_image(dob_str)
-    mulank = vals["inputs"]["A"]      # A = mulank
-    bhagyank = vals["layer1"]["G"]    # G = bhagyank
+    cells = _cells_from_abcd(*_dob_abcd(parse_dob(dob_str)))
+    mulank = cells[0]      # A = mulank
+    bhagyank = cells[6]    # G = bhagyank
     return mulank, bhagyank
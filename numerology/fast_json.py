@@ -0,0 +1,124 @@
+# numerology/fast_json.py
+"""
+JSON encoding for API responses.
+
+Report dicts are large and nested. Returned as-is from a handler, FastAPI walks
+them with jsonable_encoder and then encodes with the stdlib json module; the
+handlers instead encode once here and return the bytes in a plain Response.
+orjson is used when installed (optional), otherwise the stdlib encoder with the
+same compact, UTF-8 output Starlette's JSONResponse produces.
+
+EchoTemplate holds an encoded report with the fields that repeat the caller's
+raw input (`dob`, `year`, ...) cut out, so one encoding serves every request
+with the same canonical key (numerology.canonical).
+"""
+from __future__ import annotations
+import json
+import re
+from datetime import date
+from typing import Any, Mapping, Sequence
+
+import numpy as np
+from fastapi import Response
+
+try:  # optional speed-up
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+_ORJSON_OPTS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+
+
+def _default(obj: Any) -> Any:
+    """Stdlib fallback for the few non-JSON types handlers may return."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON; int dict keys become strings (as with json.dumps)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTS)
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON (orjson when installed); malformed input raises ValueError."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_bytes_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def json_response(obj: Any) -> Response:
+    """Encode `obj` once and return it without FastAPI's re-encoding pass."""
+    return json_bytes_response(dumps(obj))
+
+
+# ── echo templates ──
+
+# Placeholder values use private-use characters, which never occur in report text.
+_MARK = "\ue000"
+_SLOT = re.compile(b'"' + _MARK.encode() + rb"(\w+)" + _MARK.encode() + b'"')
+
+
+def _mark(obj: Any, echo: Mapping[str, Any]) -> Any:
+    """Copy of `obj` with every dict entry `name: echo[name]` replaced by a placeholder."""
+    if isinstance(obj, dict):
+        return {
+            k: f"{_MARK}{k}{_MARK}" if k in echo and isinstance(v, (str, int)) and v == echo[k] else _mark(v, echo)
+            for k, v in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_mark(v, echo) for v in obj]
+    return obj
+
+
+class EchoTemplate:
+    """
+    Encoded JSON with named slots: parts[0] slot[0] parts[1] ... parts[-1].
+    render() fills each slot with the encoded value of that name.
+    """
+
+    __slots__ = ("parts", "names")
+
+    def __init__(self, parts: Sequence[bytes], names: Sequence[str]):
+        if len(parts) != len(names) + 1:
+            raise ValueError("EchoTemplate needs one more part than slots")
+        self.parts = tuple(parts)
+        self.names = tuple(names)
+
+    @classmethod
+    def of(cls, obj: Any, echo: Mapping[str, Any]) -> "EchoTemplate":
+        """Template of `obj` with a slot wherever it repeats one of the `echo` values under its name."""
+        pieces = _SLOT.split(dumps(_mark(obj, echo)))
+        names = [n.decode() for n in pieces[1::2]]
+        missing = set(echo) - set(names)
+        if missing:
+            raise ValueError(f"Report does not echo {sorted(missing)}")
+        return cls(pieces[0::2], names)
+
+    @classmethod
+    def after_head(cls, names: Sequence[str], tail: bytes) -> "EchoTemplate":
+        """Template of b'{"<n1>":<n1>,"<n2>":<n2>,' + tail (tail = b'"k":v,...}')."""
+        heads = [b'"' + n.encode() + b'":' for n in names]
+        return cls([b"{" + heads[0]] + [b"," + h for h in heads[1:]] + [b"," + tail], names)
+
+    def render(self, echo: Mapping[str, Any]) -> bytes:
+        if not self.names:
+            return self.parts[0]
+        out = [self.parts[0]]
+        for name, part in zip(self.names, self.parts[1:]):
+            out.append(dumps(echo[name]))
+            out.append(part)
+        return b"".join(out)
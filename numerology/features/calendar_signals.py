@@ -0,0 +1,184 @@
+# numerology/features/calendar_signals.py
+from __future__ import annotations
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from numerology.core import (
+    CELLS,
+    Triangle,
+    daily_combined_triangle_range,
+    _as_date,
+    _cell_matrix,
+    _CELL_INDEX,
+)
+from numerology.features.daily_report import MAX_RANGE_DAYS
+from numerology.features.special_numbers import feature_tags, scan_special_signals
+
+# ───────────── per-triangle signal index (DOB ⊕ Day, feature "daily") ─────────────
+# A day's SPECIAL_RULES tags depend only on its combined triangle, and one year
+# of days only produces a few hundred distinct ones. Each distinct triangle is
+# scanned once and remembered as (bitmask, tags); sweeps just look rows up.
+
+_FEATURE = "daily"
+
+
+def _tag_vocab() -> Mapping[str, int]:
+    return MappingProxyType({t: bit for bit, t in enumerate(feature_tags(_FEATURE))})
+
+
+TAG_BITS: Mapping[str, int] = _tag_vocab()   # read-only: fixed at import, shared by every request
+
+
+def _tag_mask(tags: Iterable[str]) -> int:
+    mask = 0
+    unknown = []
+    for t in tags:
+        bit = TAG_BITS.get(t)
+        if bit is None:
+            unknown.append(t)
+        else:
+            mask |= 1 << bit
+    if unknown:
+        raise ValueError(f"Unknown tags: {unknown}; choose from {sorted(TAG_BITS)}")
+    return mask
+
+
+@lru_cache(maxsize=65536)
+def _signal_entry(cells: bytes) -> Tuple[int, Tuple[str, ...]]:
+    """18-byte combined triangle → (tag bitmask, tags in scan order)."""
+    notes = scan_special_signals(feature_type=_FEATURE, final_values=Triangle(cells))
+    tags = tuple(notes["tags"]) if notes else ()
+    return _tag_mask(tags), tags
+
+
+def _daily_sweep(dob_str: str, start, end) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Tuple[str, ...]]]:
+    """
+    Combined triangles + signals for every day in [start, end].
+    Returns (days datetime64[D], cells (N, 18) uint8, masks (N,) uint64, tags per day).
+    """
+    days, combined = daily_combined_triangle_range(dob_str, start, end)
+    cells = _cell_matrix(combined)
+    uniq, inverse = np.unique(cells, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    entries = [_signal_entry(row.tobytes()) for row in uniq]
+    masks = np.array([m for m, _ in entries], dtype=np.uint64)[inverse]
+    tags = [entries[i][1] for i in inverse.tolist()]
+    return days, cells, masks, tags
+
+
+def special_signal_calendar(dob_str: str, year: int) -> Dict[str, Any]:
+    """
+    Heatmap data: the daily SPECIAL_RULES tags triggered on every day of `year`
+    for this DOB (same tags as the daily report's combined `special_notes`).
+    """
+    year = int(year)
+    days, _, _, tags = _daily_sweep(dob_str, date(year, 1, 1), date(year, 12, 31))
+
+    counts: Dict[str, int] = {}
+    for day_tags in tags:
+        for t in day_tags:
+            counts[t] = counts.get(t, 0) + 1
+
+    return {
+        "type": "special_calendar",
+        "dob": dob_str,
+        "year": year,
+        "feature": _FEATURE,
+        "days": [
+            {"day": d.strftime("%d-%m-%Y"), "tags": list(t)}
+            for d, t in zip(days.tolist(), tags)
+        ],
+        "tag_counts": counts,
+    }
+
+
+# ───────────── "best days" search over a date window ─────────────
+
+CellConstraints = Mapping[str, Union[int, Iterable[int]]]
+
+
+def parse_cell_constraints(spec: Optional[str]) -> Dict[str, Tuple[int, ...]]:
+    """
+    "G=1|9,P=6" → {"G": (1, 9), "P": (6,)}. Empty/None → {}.
+    """
+    out: Dict[str, Tuple[int, ...]] = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        cell, sep, allowed = part.partition("=")
+        cell = cell.strip().upper()
+        if not sep or cell not in _CELL_INDEX:
+            raise ValueError(f"Bad cell constraint '{part}'; use e.g. G=1|9,P=6 with cells A..R")
+        try:
+            out[cell] = tuple(int(v) for v in allowed.split("|") if v.strip())
+        except ValueError:
+            raise ValueError(f"Bad cell constraint '{part}'; values must be digits 0..9")
+    return out
+
+
+def best_days(
+    dob_str: str,
+    start,
+    end,
+    *,
+    cells: Optional[CellConstraints] = None,
+    exclude_tags: Iterable[str] = (),
+    require_tags: Iterable[str] = (),
+    top_k: int = 10,
+) -> Dict[str, Any]:
+    """
+    Days in [start, end] whose COMBINED daily triangle (DOB ⊕ Day) satisfies
+    `cells` (cell → allowed value(s)), carries none of `exclude_tags` and all of
+    `require_tags`. Ranked by fewest special tags, then earliest date.
+    """
+    first, last = _as_date(start), _as_date(end)
+    if (last - first).days + 1 > MAX_RANGE_DAYS:
+        raise ValueError(f"Range too long; at most {MAX_RANGE_DAYS} days per request")
+    if top_k < 1:
+        raise ValueError("top_k must be >= 1")
+
+    wanted: Dict[str, Tuple[int, ...]] = {}
+    for cell, allowed in (cells or {}).items():
+        if cell not in _CELL_INDEX:
+            raise ValueError(f"Unknown cell '{cell}'; choose from {''.join(CELLS)}")
+        wanted[cell] = (int(allowed),) if isinstance(allowed, int) else tuple(int(v) for v in allowed)
+    exclude_tags, require_tags = list(exclude_tags), list(require_tags)
+    excl = np.uint64(_tag_mask(exclude_tags))
+    req = np.uint64(_tag_mask(require_tags))
+
+    days, mat, masks, tags = _daily_sweep(dob_str, first, last)
+
+    ok = ((masks & excl) == 0) & ((masks & req) == req)
+    for cell, allowed in wanted.items():
+        ok &= np.isin(mat[:, _CELL_INDEX[cell]], allowed)
+    idx = np.flatnonzero(ok)
+
+    n_tags = np.fromiter((len(tags[i]) for i in idx), dtype=np.int64, count=idx.size)
+    ranked = idx[np.argsort(n_tags, kind="stable")][:top_k]   # idx is already chronological
+
+    day_list = days.tolist()
+    return {
+        "type": "best_days",
+        "dob": dob_str,
+        "start": first.strftime("%d-%m-%Y"),
+        "end": last.strftime("%d-%m-%Y"),
+        "criteria": {
+            "cells": {c: list(v) for c, v in wanted.items()},
+            "exclude_tags": exclude_tags,
+            "require_tags": require_tags,
+        },
+        "matches": int(idx.size),
+        "days": [
+            {
+                "day": day_list[i].strftime("%d-%m-%Y"),
+                "tags": list(tags[i]),
+                "values": dict(zip(CELLS, mat[i].tolist())),
+            }
+            for i in ranked.tolist()
+        ],
+    }
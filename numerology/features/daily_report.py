@@ -1,26 +1,27 @@
 # numerology/features/daily_report.py
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 from datetime import date
 
+from numerology.context import TriangleContext, ensure_context
 from numerology.core import (
-    mystical_triangle_values_image,
-    mystical_triangle_today,
-    combine_two_triangles,
-    _collect_used_numbers,
-    _resolve_right_day,
+    Triangle,
+    daily_combined_triangle_range,
+    _as_date,
+    _cell_matrix,
+    _flat_values,
 )
 from numerology.reads import build_reads
-from numerology.traits import meaning, num_traits, F_TRAIT
+from numerology.traits import meaning, F_TRAIT
 
 # 🔹 NEW: imports for specials + polarity
 from numerology.features.special_numbers import scan_special_signals
 from numerology.traits import summarize_polarity
 
 
-def _panel_core(vals: Dict[str, Dict[str, int]]) -> dict:
-    e = vals["layer1"]["E"]; f = vals["layer1"]["F"]; g = vals["layer1"]["G"]
-    p = vals["third_layer"]["P"]
+def _panel_core(vals: Triangle) -> dict:
+    e = vals.E; f = vals.F; g = vals.G
+    p = vals.P
     return {
         "EF_pair": int(f"{e}{f}"),
         "E": {"value": e, "meaning": meaning(e)},
@@ -51,9 +52,7 @@ _QUICK_TAGS = {
 
 
 def _build_time_slots(vals: Dict[str, Dict[str, int]]) -> List[dict]:
-    flat = {}
-    for sec in ("inputs", "layer1", "second_layer", "third_layer"):
-        flat.update(vals.get(sec, {}))
+    flat = _flat_values(vals)
 
     slots = []
     for band in _DAILY_BANDS:
@@ -74,48 +73,50 @@ def _build_time_slots(vals: Dict[str, Dict[str, int]]) -> List[dict]:
     return slots
 
 
-def daily_triangle_report(dob_str: str, right_day: Optional[str] = None) -> Dict[str, Any]:
+def daily_triangle_report(
+    dob_str: str,
+    right_day: Optional[str] = None,
+    *,
+    ctx: Optional[TriangleContext] = None,
+) -> Dict[str, Any]:
     """
     Daily report (DOB ⊕ Day):
       Left   = DOB triangle (normal mystical build)
       Right  = If right_day omitted/'today' → today's date triangle; else → the given date
       Combo  = combine_two_triangles(Left, Right)
     """
+    ctx = ensure_context(dob_str, ctx)
+
     # Left (DOB)
-    left = mystical_triangle_values_image(dob_str)
+    left = ctx.base
 
     # Right (calendar day: today or manually provided)
-    right, right_label = _resolve_right_day(right_day)  # new
+    right, right_label = ctx.day_driver(right_day)
 
     # Combined
-    combo = combine_two_triangles(left, right)
+    combo = ctx.daily(right_day)
 
     # Deterministic reads
-    left_reads = build_reads(left)
-    right_reads = build_reads(right)
-    combo_reads = build_reads(combo)
+    left_reads = ctx.reads(left)
+    right_reads = ctx.reads(right)
+    combo_reads = ctx.reads(combo)
 
     # Traits across the combined (active) panel
-    used_nums = sorted(_collect_used_numbers(combo))
-    traits_map = {n: num_traits(n) for n in used_nums}
+    traits_map = ctx.traits(combo)
 
     # Back-compat: keep "today" but set it to the chosen right date
     chosen_day_str = right_label
 
     right_panel = {
         "date": chosen_day_str,
-        "values": right,
+        "values": right.to_dict(),
         "reads": right_reads,
         "core": _panel_core(right),
     }
 
     # 🔹 NEW: compute polarity + scan specials (feature-aware = "daily")
-    polarity = summarize_polarity(combo)
-    special_notes = scan_special_signals(
-        feature_type="daily",
-        final_values=combo,
-        final_reads=combo_reads,
-    )
+    polarity = ctx.polarity(combo)
+    special_notes = ctx.signals("daily", combo)
 
     return {
         "type": "daily",
@@ -124,14 +125,14 @@ def daily_triangle_report(dob_str: str, right_day: Optional[str] = None) -> Dict
         "today": chosen_day_str,
         "panels": {
             "left_dob": {
-                "values": left,
+                "values": left.to_dict(),
                 "reads": left_reads,
                 "core": _panel_core(left),
             },
             "right_day": right_panel,         # New, correct key
             "right_today": right_panel,       # Back-compat alias (same data)
             "combined": {
-                "values": combo,
+                "values": combo.to_dict(),
                 "reads": combo_reads,
                 "core": _panel_core(combo),
                 "time_slots": _build_time_slots(combo),
@@ -144,3 +145,52 @@ def daily_triangle_report(dob_str: str, right_day: Optional[str] = None) -> Dict
             "priority": "Use the COMBINED panel for the day. G is the core driver; EF shows style; P is the day’s outcome.",
         },
     }
+
+
+# ── Date-range forecast (one combined panel per day) ──────────────────────────
+RANGE_FIELDS = ("values", "reads", "core", "time_slots", "polarity", "special_notes")
+MAX_RANGE_DAYS = 20 * 366
+
+
+def iter_daily_range(
+    dob_str: str,
+    start: str | date,
+    end: str | date,
+    *,
+    fields: Optional[Iterable[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the COMBINED daily panel (DOB ⊕ Day) for every day in [start, end].
+
+    The DOB triangle is built once and all day-combined triangles come from one
+    vectorized pass; records are produced lazily so callers can stream them.
+    `fields` limits each record to a subset of RANGE_FIELDS ("day" is always set).
+    """
+    wanted = set(RANGE_FIELDS if fields is None else fields)
+    unknown = wanted - set(RANGE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {sorted(unknown)}; choose from {list(RANGE_FIELDS)}")
+    first, last = _as_date(start), _as_date(end)
+    if (last - first).days + 1 > MAX_RANGE_DAYS:
+        raise ValueError(f"Range too long; at most {MAX_RANGE_DAYS} days per request")
+
+    days, combined = daily_combined_triangle_range(dob_str, first, last)
+    for day, cells in zip(days.tolist(), _cell_matrix(combined)):
+        combo = Triangle(cells.tobytes())
+        record: Dict[str, Any] = {"day": day.strftime("%d-%m-%Y")}
+        if "values" in wanted:
+            record["values"] = combo.to_dict()
+        reads = build_reads(combo) if ("reads" in wanted or "special_notes" in wanted) else None
+        if "reads" in wanted:
+            record["reads"] = reads
+        if "core" in wanted:
+            record["core"] = _panel_core(combo)
+        if "time_slots" in wanted:
+            record["time_slots"] = _build_time_slots(combo)
+        if "polarity" in wanted:
+            record["polarity"] = summarize_polarity(combo)
+        if "special_notes" in wanted:
+            notes = scan_special_signals(feature_type="daily", final_values=combo, final_reads=reads)
+            if notes:
+                record["special_notes"] = notes
+        yield record
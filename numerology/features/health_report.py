@@ -1,32 +1,23 @@
 from __future__ import annotations
 from typing import Any, Dict, List, Tuple, Set, Optional
 
-# ⬇️ added imports for combined triangles
-from numerology.core import (
-    mystical_triangle_values_image,
-    _collect_used_numbers,
-    daily_combined_triangle,
-    monthly_combined_triangle,
-    yearly_combined_triangle,
-)
+from numerology.context import TriangleContext, ensure_context
+from numerology.core import Triangle, as_triangle
 
-from numerology.reads import build_reads
-from numerology.traits import num_traits, COMPOUND_TRAITS, F_TRAIT
+from numerology.traits import COMPOUND_TRAITS, F_TRAIT
 from numerology.traits import (
     HEALTH_MEANINGS, ELEMENT_TABLE, TRIPLE_ROWS, CANCER_TRIPLES,
     HEART_ATTACK_COMPOUNDS, NERVOUS_ISSUE_READS, MENTAL_DISORDER_TRIPLE,
     CRITICAL_NINE_PAIRS,
 )
 
-# 🔹 NEW imports for special scanner and polarity
-from numerology.features.special_numbers import scan_special_signals
-from numerology.traits import summarize_polarity
-
 #-------------------------------
 #  Helper function for health.py
 #-------------------------------
 def _values_flat(vals: Dict[str, Dict[str, int]]) -> Dict[str, int]:
     """Flatten the triangle dict to a single label->value map."""
+    if isinstance(vals, Triangle):
+        return vals.flat
     out: Dict[str, int] = {}
     for section in ("inputs", "layer1", "second_layer", "third_layer"):
         out.update({k: int(v) for k, v in vals[section].items()})
@@ -148,6 +139,11 @@ def _element_summary(used_nums: List[int]) -> Dict[str, Any]:
     return table
 
 
+def _is_female(gender: Optional[str]) -> bool:
+    """The only way `gender` affects a health report (breast-note heuristic)."""
+    return bool(gender) and gender.lower().startswith("f")
+
+
 # ────────────────────────────────────────────────────────────────────────────
 # NEW: Shared builder used by single / daily / monthly / yearly
 # ────────────────────────────────────────────────────────────────────────────
@@ -157,25 +153,25 @@ def _build_health_report_from_values(
     *,
     gender: Optional[str] = None,
     context: Optional[Dict[str, Any]] = None,
+    ctx: Optional[TriangleContext] = None,
 ) -> Dict[str, Any]:
     """
     EXACT same logic as your previous health_triangle_report(), but parameterized
-    to accept a pre-computed triangle 'vals' (e.g., combined triangle).
+    to accept a pre-computed triangle 'vals' (e.g., combined triangle) — either
+    a Triangle or the nested values dict.
     """
+    tri = as_triangle(vals)
+    ctx = ensure_context(dob_str, ctx)
     flat = _values_flat(vals)
-    used_nums = sorted(_collect_used_numbers(vals))
-    traits = {n: num_traits(n) for n in used_nums}
+    used_nums = ctx.used_numbers(tri)
+    traits = ctx.traits(tri)
 
-    reads = build_reads(vals)
+    reads = ctx.reads(tri)
     triples = _scan_triples(flat)
 
     # 🔹 NEW additions
-    polarity = summarize_polarity(vals)
-    special_notes = scan_special_signals(
-        feature_type="health",
-        final_values=vals,
-        final_reads=reads,
-    )
+    polarity = ctx.polarity(tri)
+    special_notes = ctx.signals("health", tri)
 
     # Core references
     E = flat["E"]; F = flat["F"]; G = flat["G"]
@@ -230,7 +226,7 @@ def _build_health_report_from_values(
 
     # Breast cancer heuristic
     breast_note = None
-    if gender and gender.lower().startswith("f") and flat.get("A") == 4 and flat.get("B") == 7:
+    if _is_female(gender) and flat.get("A") == 4 and flat.get("B") == 7:
         breast_note = "Higher tendency for breast-related issues (A=4, B=7)."
 
     # Abdominal block logic (I,J,K,L)
@@ -241,7 +237,7 @@ def _build_health_report_from_values(
 
     payload = {
         "dob": dob_str,
-        "values": vals,
+        "values": vals.to_dict() if isinstance(vals, Triangle) else vals,
         "triples": triples,
         "reads": reads,
         "reads_traits": {c: COMPOUND_TRAITS[c] for c in sorted({v for v in reads.values() if v in COMPOUND_TRAITS})},
@@ -268,39 +264,47 @@ def _build_health_report_from_values(
 # ────────────────────────────────────────────────────────────────────────────
 # ORIGINAL API (unchanged behavior)
 # ────────────────────────────────────────────────────────────────────────────
-def health_triangle_report(dob_str: str, *, gender: str | None = None) -> Dict[str, Any]:
-    vals = mystical_triangle_values_image(dob_str)
-    return _build_health_report_from_values(dob_str, vals, gender=gender, context={"mode": "single"})
+def health_triangle_report(
+    dob_str: str, *, gender: str | None = None, ctx: Optional[TriangleContext] = None
+) -> Dict[str, Any]:
+    ctx = ensure_context(dob_str, ctx)
+    return _build_health_report_from_values(dob_str, ctx.base, gender=gender, context={"mode": "single"}, ctx=ctx)
 
 
 # ────────────────────────────────────────────────────────────────────────────
 # NEW convenience wrappers: daily / monthly / yearly via COMBINED triangles
 # ────────────────────────────────────────────────────────────────────────────
 def health_daily_report(
-    dob_str: str, *, day: Optional[str] = None, gender: Optional[str] = None
+    dob_str: str, *, day: Optional[str] = None, gender: Optional[str] = None,
+    ctx: Optional[TriangleContext] = None,
 ) -> Dict[str, Any]:
-    combo_vals = daily_combined_triangle(dob_str, day=day)
+    ctx = ensure_context(dob_str, ctx)
     return _build_health_report_from_values(
-        dob_str, combo_vals, gender=gender,
-        context={"mode": "daily", "day": day or "today", "note": "Combined: DOB ⊕ Day"}
+        dob_str, ctx.daily(day), gender=gender,
+        context={"mode": "daily", "day": day or "today", "note": "Combined: DOB ⊕ Day"},
+        ctx=ctx,
     )
 
 
 def health_monthly_report(
-    dob_str: str, year: int, *, gender: Optional[str] = None
+    dob_str: str, year: int, *, gender: Optional[str] = None,
+    ctx: Optional[TriangleContext] = None,
 ) -> Dict[str, Any]:
-    combo_vals = monthly_combined_triangle(dob_str, year)
+    ctx = ensure_context(dob_str, ctx)
     return _build_health_report_from_values(
-        dob_str, combo_vals, gender=gender,
-        context={"mode": "monthly", "year": year, "note": "Combined: DOB ⊕ Month-Year driver"}
+        dob_str, ctx.monthly(year), gender=gender,
+        context={"mode": "monthly", "year": year, "note": "Combined: DOB ⊕ Month-Year driver"},
+        ctx=ctx,
     )
 
 
 def health_yearly_report(
-    dob_str: str, year: int, *, gender: Optional[str] = None
+    dob_str: str, year: int, *, gender: Optional[str] = None,
+    ctx: Optional[TriangleContext] = None,
 ) -> Dict[str, Any]:
-    combo_vals = yearly_combined_triangle(dob_str, year)
+    ctx = ensure_context(dob_str, ctx)
     return _build_health_report_from_values(
-        dob_str, combo_vals, gender=gender,
-        context={"mode": "yearly", "year": year, "note": "Combined: DOB ⊕ Year-only"}
+        dob_str, ctx.yearly(year), gender=gender,
+        context={"mode": "yearly", "year": year, "note": "Combined: DOB ⊕ Year-only"},
+        ctx=ctx,
     )
@@ -1,19 +1,10 @@
 # numerology/features/monthly_report.py
 from __future__ import annotations
-from typing import Dict, Any
-
-from numerology.core import (
-    mystical_triangle_values_image,
-    month_year_driver_triangle,   # A=0, B=month(M.M), C/D from year
-    monthly_combined_triangle,    # combine(left, driver)
-    _collect_used_numbers,
-)
-from numerology.traits import meaning, num_traits
+from typing import Dict, Any, Optional
 
-# 🔹 NEW imports
-from numerology.reads import build_reads
-from numerology.traits import summarize_polarity
-from numerology.features.special_numbers import scan_special_signals
+from numerology.context import TriangleContext, ensure_context
+from numerology.core import Triangle
+from numerology.traits import meaning, num_traits
 
 
 # Month → triangle-position mapping (as per your screenshot)
@@ -26,10 +17,10 @@ _MONTH_POS: Dict[int, str] = {
 }
 
 
-def _panel_core(vals: Dict[str, Dict[str, int]]) -> dict:
+def _panel_core(vals: Triangle) -> dict:
     """Small core section for UI/consumers (EF, G, P with meanings)."""
-    e = vals["layer1"]["E"]; f = vals["layer1"]["F"]; g = vals["layer1"]["G"]
-    p = vals["third_layer"]["P"]
+    e = vals.E; f = vals.F; g = vals.G
+    p = vals.P
     return {
         "EF_core": {
             "value": int(f"{e}{f}"),
@@ -42,18 +33,19 @@ def _panel_core(vals: Dict[str, Dict[str, int]]) -> dict:
     }
 
 
-def _extract_value(vals: Dict[str, Dict[str, int]], pos: str) -> int | None:
-    """Fetch a position's value from the triangle dict."""
-    if pos in ("E", "F", "G"):
-        return vals["layer1"].get(pos)
-    if pos in ("H", "I", "J", "K", "L", "M"):
-        return vals["second_layer"].get(pos)
-    if pos in ("N", "O", "P", "Q", "R"):
-        return vals["third_layer"].get(pos)
+def _extract_value(vals: Triangle, pos: str) -> int | None:
+    """Fetch a position's value from the triangle (E..R only)."""
+    if pos in ("E", "F", "G", "H", "I", "J", "K", "L", "M", "N", "O", "P", "Q", "R"):
+        return vals[pos]
     return None
 
 
-def monthly_prediction_report(dob_str: str, year: int) -> Dict[str, Any]:
+def monthly_prediction_report(
+    dob_str: str,
+    year: int,
+    *,
+    ctx: Optional[TriangleContext] = None,
+) -> Dict[str, Any]:
     """
     Deterministic monthly report for a given DOB and target year.
 
@@ -68,9 +60,10 @@ def monthly_prediction_report(dob_str: str, year: int) -> Dict[str, Any]:
       Sept–Oct: N, O
       Nov–Dec: Q, R
     """
-    left = mystical_triangle_values_image(dob_str)
-    right = month_year_driver_triangle(dob_str, year)
-    combo = monthly_combined_triangle(dob_str, year)
+    ctx = ensure_context(dob_str, ctx)
+    left = ctx.base
+    right = ctx.month_year_driver(year)        # A=0, B=month(M.M), C/D from year
+    combo = ctx.monthly(year)
 
     # Build per-month view from the COMBINED triangle
     months: Dict[str, Any] = {}
@@ -85,34 +78,28 @@ def monthly_prediction_report(dob_str: str, year: int) -> Dict[str, Any]:
         }
 
     # Traits used anywhere in the combined triangle
-    used_nums = sorted(_collect_used_numbers(combo))
-    traits_map = {n: num_traits(n) for n in used_nums}
+    traits_map = ctx.traits(combo)
 
     # Core glance from combined
-    E = combo["layer1"]["E"]; F = combo["layer1"]["F"]; G = combo["layer1"]["G"]
-    P = combo["third_layer"]["P"]; EF = int(f"{E}{F}")
+    E = combo.E; F = combo.F; G = combo.G
+    P = combo.P; EF = int(f"{E}{F}")
 
     # 🔹 NEW: compute reads (for scanner), polarity, and special notes (feature-aware="monthly")
-    combo_reads = build_reads(combo)
-    polarity = summarize_polarity(combo)
-    special_notes = scan_special_signals(
-        feature_type="monthly",
-        final_values=combo,
-        final_reads=combo_reads,
-    )
+    polarity = ctx.polarity(combo)
+    special_notes = ctx.signals("monthly", combo)
 
     return {
         "dob": dob_str,
         "year": year,
         "panels": {
-            "left_dob":   {"values": left,  "interpretations": {"core": _panel_core(left)}},
+            "left_dob":   {"values": left.to_dict(),  "interpretations": {"core": _panel_core(left)}},
             "right_driver": {
-                "values": right,
+                "values": right.to_dict(),
                 "interpretations": {"core": _panel_core(right)},
                 "note": "Monthly driver: A=0, B=M.M (from DOB), C/D from target year.",
             },
             "combined":   {
-                "values": combo,
+                "values": combo.to_dict(),
                 "interpretations": {"core": _panel_core(combo)},
                 "note": "Active pattern for months in this year (DOB ⊕ driver).",
                 "polarity": polarity,                                   # 🔹 NEW
@@ -1,9 +1,9 @@
 # numerology/features/profession_report.py
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from numerology.core import mulank_bhagyank_from_dob
+from numerology.context import TriangleContext, ensure_context
 from numerology.profession_traits import (
     PAIRS as PROFESSION_PAIRS,
     star_meaning,
@@ -52,7 +52,7 @@ def _build_pair_profession_block(mulank: int, bhagyank: int) -> Dict[str, Any]:
 
 
 
-def profession_report(dob_str: str) -> Dict[str, Any]:
+def profession_report(dob_str: str, *, ctx: Optional[TriangleContext] = None) -> Dict[str, Any]:
     """
     Deterministic profession report driven ONLY by:
       • Mulank (A)
@@ -61,7 +61,7 @@ def profession_report(dob_str: str) -> Dict[str, Any]:
 
     No AI and no personality traits here.
     """
-    mulank, bhagyank = mulank_bhagyank_from_dob(dob_str)
+    mulank, bhagyank = ensure_context(dob_str, ctx).mulank_bhagyank
     pair_profession = _build_pair_profession_block(mulank, bhagyank)
 
     return {
@@ -233,7 +233,8 @@ def build_profile_bulletins(
 ) -> Dict[str, Any]:
     """
     Builds compact bulletin summaries by calling existing report functions.
-    Does NOT alter existing logic; only aggregates.
+    Does NOT alter existing logic; only aggregates. All builders share one
+    TriangleContext, so the DOB is parsed and each triangle derived once.
     """
     # Lazy imports to avoid circular imports
     from numerology.features.single_person_report import mystical_triangle_report
@@ -247,27 +248,29 @@ def build_profile_bulletins(
         health_monthly_report,
         health_yearly_report,
     )
+    from numerology.context import TriangleContext
 
+    ctx = TriangleContext(dob)
     y = _safe_int(year, date.today().year)
     m = _safe_int(month, date.today().month)
     d = (day or "today").strip() or "today"
 
     # Core reports (existing)
-    personality_r = mystical_triangle_report(dob)
-    profession_r = profession_report(dob)
+    personality_r = mystical_triangle_report(dob, ctx=ctx)
+    profession_r = profession_report(dob, ctx=ctx)
 
     # Time cycles (existing)
-    yearly_r = yearly_triangle_report(dob, y)
-    monthly_r = monthly_prediction_report(dob, y)  # your monthly is year-driver
+    yearly_r = yearly_triangle_report(dob, y, ctx=ctx)
+    monthly_r = monthly_prediction_report(dob, y, ctx=ctx)  # your monthly is year-driver
 
     # daily_triangle_report in your project is DOB-only; it likely uses today internally
-    daily_r = daily_triangle_report(dob)
+    daily_r = daily_triangle_report(dob, ctx=ctx)
 
     # Health (existing)
-    health_generic = health_triangle_report(dob, gender=gender)
-    health_d = health_daily_report(dob, day=d, gender=gender)
-    health_m = health_monthly_report(dob, y, gender=gender)
-    health_y = health_yearly_report(dob, y, gender=gender)
+    health_generic = health_triangle_report(dob, gender=gender, ctx=ctx)
+    health_d = health_daily_report(dob, day=d, gender=gender, ctx=ctx)
+    health_m = health_monthly_report(dob, y, gender=gender, ctx=ctx)
+    health_y = health_yearly_report(dob, y, gender=gender, ctx=ctx)
 
     # Summaries
     personality = _summarize_personality(personality_r if isinstance(personality_r, dict) else {})
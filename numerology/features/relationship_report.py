@@ -1,7 +1,7 @@
 # numerology/features/relationship_report.py
 from __future__ import annotations
 from typing import Any, Dict, Tuple, List
-from numerology.core import mystical_triangle_values_image, combine_two_triangles, _collect_used_numbers
+from numerology.core import Triangle, dob_triangle, _collect_used_numbers, _flat_values
 from numerology.reads import build_reads
 from numerology.traits import meaning, COMPOUND_TRAITS, F_TRAIT, num_traits
 from numerology.traits import COMPOUND_ALERTS, ALERT_TAG_ORDER, element_of, DEFAULT_ELEMENT_PRESET
@@ -22,6 +22,8 @@ def _reads_contains(reads: Dict[str, int], targets: List[int]) -> bool:
 
 
 def _any_digit_is(values: Dict[str, Any], target: int) -> bool:
+    if isinstance(values, Triangle):
+        return target in values.cells
     for section in ("inputs", "layer1", "second_layer", "third_layer"):
         block = values.get(section, {})
         if isinstance(block, dict):
@@ -36,7 +38,7 @@ def _bond_assessment(vals_combined: Dict[str, Any], reads: Dict[str, int]) -> Di
     lucky_any_9 = _any_digit_is(vals_combined, 9)
     qr_val = reads.get("QR")
     qr_linked = qr_val in MIRROR_PAIRS
-    g_is_9 = vals_combined.get("layer1", {}).get("G") == 9
+    g_is_9 = _flat_values(vals_combined).get("G") == 9
 
     score = 0
     if has_27_link: score += 2
@@ -94,17 +96,13 @@ def _elements_summary(vals_combined: Dict[str, Any], preset: str | None = None)
     counts = {"water": 0, "wood": 0, "fire": 0, "earth": 0, "metal": 0}
     detail: Dict[str, List[Tuple[str, int]]] = {k: [] for k in counts}
 
-    for section in ("inputs", "layer1", "second_layer", "third_layer"):
-        block = vals_combined.get(section, {})
-        if not isinstance(block, dict):
+    for k, v in _flat_values(vals_combined).items():
+        if not isinstance(v, int) or v < 1 or v > 9:
             continue
-        for k, v in block.items():
-            if not isinstance(v, int) or v < 1 or v > 9:
-                continue
-            el = element_of(v, preset=preset)
-            if el in counts:
-                counts[el] += 1
-                detail[el].append((k, v))
+        el = element_of(v, preset=preset)
+        if el in counts:
+            counts[el] += 1
+            detail[el].append((k, v))
 
     dominant = max(counts, key=lambda e: counts[e]) if counts else None
     return {
@@ -117,14 +115,14 @@ def _elements_summary(vals_combined: Dict[str, Any], preset: str | None = None)
 
 # ───────────────────────── main function ─────────────────────────
 def relationship_triangle_report(dob_left: str, dob_right: str) -> Dict[str, Any]:
-    vL = mystical_triangle_values_image(dob_left)
-    vR = mystical_triangle_values_image(dob_right)
-    vals_combined = combine_two_triangles(vL, vR)
+    vL = dob_triangle(dob_left)
+    vR = dob_triangle(dob_right)
+    vals_combined = vL.combine(vR)
 
-    E = vals_combined["layer1"]["E"]
-    F = vals_combined["layer1"]["F"]
-    G = vals_combined["layer1"]["G"]
-    P = vals_combined["third_layer"]["P"]
+    E = vals_combined.E
+    F = vals_combined.F
+    G = vals_combined.G
+    P = vals_combined.P
 
     used_nums = sorted(_collect_used_numbers(vals_combined))
     traits = {n: num_traits(n) for n in used_nums}
@@ -162,45 +160,45 @@ def relationship_triangle_report(dob_left: str, dob_right: str) -> Dict[str, Any
         "relations": {
             "Hidden potential (H/I)": {
                 "values": (
-                    vals_combined["second_layer"]["H"],
-                    vals_combined["second_layer"]["I"],
+                    vals_combined.H,
+                    vals_combined.I,
                 ),
                 "meaning": "Subconscious compatibility / blind spots.",
-                "H_details_ref": vals_combined["second_layer"]["H"],
-                "I_details_ref": vals_combined["second_layer"]["I"],
+                "H_details_ref": vals_combined.H,
+                "I_details_ref": vals_combined.I,
             },
             "Family ties (J/K)": {
                 "values": (
-                    vals_combined["second_layer"]["J"],
-                    vals_combined["second_layer"]["K"],
+                    vals_combined.J,
+                    vals_combined.K,
                 ),
                 "meaning": "Maternal & paternal patterning that colors the bond.",
-                "J_details_ref": vals_combined["second_layer"]["J"],
-                "K_details_ref": vals_combined["second_layer"]["K"],
+                "J_details_ref": vals_combined.J,
+                "K_details_ref": vals_combined.K,
             },
             "Outlook & growth (L/M)": {
                 "values": (
-                    vals_combined["second_layer"]["L"],
-                    vals_combined["second_layer"]["M"],
+                    vals_combined.L,
+                    vals_combined.M,
                 ),
                 "meaning": "How you appear outwardly and how you research/grow together.",
-                "L_details_ref": vals_combined["second_layer"]["L"],
-                "M_details_ref": vals_combined["second_layer"]["M"],
+                "L_details_ref": vals_combined.L,
+                "M_details_ref": vals_combined.M,
             },
         },
         "upper_cluster": {
             "N,O,Q,R": {
                 "values": (
-                    vals_combined["third_layer"]["N"],
-                    vals_combined["third_layer"]["O"],
-                    vals_combined["third_layer"]["Q"],
-                    vals_combined["third_layer"]["R"],
+                    vals_combined.N,
+                    vals_combined.O,
+                    vals_combined.Q,
+                    vals_combined.R,
                 ),
                 "meaning": "Evolutionary arc: balance, shared vision, growth, resilience.",
-                "N_details_ref": vals_combined["third_layer"]["N"],
-                "O_details_ref": vals_combined["third_layer"]["O"],
-                "Q_details_ref": vals_combined["third_layer"]["Q"],
-                "R_details_ref": vals_combined["third_layer"]["R"],
+                "N_details_ref": vals_combined.N,
+                "O_details_ref": vals_combined.O,
+                "Q_details_ref": vals_combined.Q,
+                "R_details_ref": vals_combined.R,
             }
         }
     }
@@ -219,7 +217,7 @@ def relationship_triangle_report(dob_left: str, dob_right: str) -> Dict[str, Any
 
     return {
         "relationship": f"{dob_left} + {dob_right}",
-        "values": vals_combined,
+        "values": vals_combined.to_dict(),
         "reads": reads,
         "reads_explained": reads_explained,
         "reads_traits": reads_traits,
@@ -1,37 +1,22 @@
 # numerology/features/single_person_report.py
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from numerology.core import (
-    mystical_triangle_values_image,
-    _collect_used_numbers,
-    mulank_bhagyank_from_dob,        # 🔹 NEW
-)
-from numerology.reads import build_reads
-from numerology.traits import meaning, num_traits, COMPOUND_TRAITS, F_TRAIT
-# 🔹 NEW imports
-from numerology.traits import summarize_polarity
-from numerology.features.special_numbers import scan_special_signals
+from numerology.context import TriangleContext, ensure_context
+from numerology.traits import meaning, COMPOUND_TRAITS, F_TRAIT
 from numerology.mulank_bhagyank_traits import PAIR_MEANINGS  # 🔹 NEW
 
 
 # ── Report ────────────────────────────────────────────────────────────────────
-def mystical_triangle_report(dob_str: str) -> Dict:
-    vals = mystical_triangle_values_image(dob_str)
-    A, B, C, D = [vals["inputs"][k] for k in ("A", "B", "C", "D")]
-    E, F, G = [vals["layer1"][k] for k in ("E", "F", "G")]
-    H = vals["second_layer"]["H"]; I = vals["second_layer"]["I"]
-    J = vals["second_layer"]["J"]; K = vals["second_layer"]["K"]
-    L = vals["second_layer"]["L"]; M = vals["second_layer"]["M"]
-    N = vals["third_layer"]["N"];  O = vals["third_layer"]["O"]
-    P = vals["third_layer"]["P"];  Q = vals["third_layer"]["Q"]
-    R = vals["third_layer"]["R"]
+def mystical_triangle_report(dob_str: str, *, ctx: Optional[TriangleContext] = None) -> Dict:
+    ctx = ensure_context(dob_str, ctx)
+    vals = ctx.base
+    A, B, C, D, E, F, G, H, I, J, K, L, M, N, O, P, Q, R = vals.cells
 
     # Build a deduped traits map for all numbers that appear in this triangle
-    used_nums = sorted(_collect_used_numbers(vals))
-    traits = {n: num_traits(n) for n in used_nums}
+    traits = ctx.traits(vals)
 
     core_pair = int(f"{E}{F}")
-    reads = build_reads(vals)
+    reads = ctx.reads(vals)
     used_codes = sorted({v for v in reads.values() if v in COMPOUND_TRAITS})
     reads_traits = {c: COMPOUND_TRAITS[c] for c in used_codes}
     reads_explained = {
@@ -39,8 +24,8 @@ def mystical_triangle_report(dob_str: str) -> Dict:
         for k, v in reads.items()
     }
 
-    # 🔹 NEW: derive Mulank & Bhagyank + combined meaning
-    mulank, bhagyank = mulank_bhagyank_from_dob(dob_str)
+    # 🔹 NEW: derive Mulank & Bhagyank + combined meaning (Mulank = A, Bhagyank = G)
+    mulank, bhagyank = A, G
     pair_key = (mulank, bhagyank)
     pair_meaning = PAIR_MEANINGS.get(pair_key, None)
 
@@ -80,12 +65,8 @@ def mystical_triangle_report(dob_str: str) -> Dict:
     }
 
     # 🔹 NEW: polarity + special notes for single-person feature
-    polarity = summarize_polarity(vals)
-    special_notes = scan_special_signals(
-        feature_type="person",
-        final_values=vals,
-        final_reads=reads,
-    )
+    polarity = ctx.polarity(vals)
+    special_notes = ctx.signals("person", vals)
 
     # Add-on info without removing existing structure:
     report: Dict[str, Any] = {
@@ -97,7 +78,7 @@ def mystical_triangle_report(dob_str: str) -> Dict:
             "pair_key": f"{mulank}-{bhagyank}",
             "pair_meaning": pair_meaning,
         },
-        "values": vals,
+        "values": vals.to_dict(),
         "reads": reads,
         "reads_explained": reads_explained,
         "reads_traits": reads_traits,
@@ -1,7 +1,9 @@
 # numerology/features/special_numbers.py
 from __future__ import annotations
 
-from typing import Dict, Any, List, Tuple, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Tuple, Optional
+from numerology.core import CELLS, Triangle, _triangle_signature
 from numerology.reads import build_reads
 
 # ───────────────── helpers ─────────────────
@@ -94,6 +96,8 @@ def _betrayal_flags(flat: Dict[str, int]) -> Tuple[bool, bool]:
 
 
 def _values_flat(vals: Dict[str, Dict[str, int]]) -> Dict[str, int]:
+    if isinstance(vals, Triangle):
+        return vals.flat
     out: Dict[str, int] = {}
     for sec in ("inputs", "layer1", "second_layer", "third_layer"):
         for k, v in (vals.get(sec) or {}).items():
@@ -111,20 +115,22 @@ def _digits_on_side(flat: Dict[str, int], side: str) -> List[int]:
     return [int(flat[k]) for k in flat if k in pos]
 
 
+_TRIPLE_ROWS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("ABC", ("A", "B", "C")),
+    ("BCD", ("B", "C", "D")),
+    ("AEG", ("A", "E", "G")),
+    ("DFG", ("D", "F", "G")),
+    ("EGN", ("E", "G", "N")),
+    ("FGO", ("F", "G", "O")),
+    ("HIJ", ("H", "I", "J")),
+    ("KLM", ("K", "L", "M")),
+    ("NOP", ("N", "O", "P")),
+)
+
+
 def _scan_triples(flat: Dict[str, int]) -> Dict[str, str]:
-    rows: List[Tuple[str, Tuple[str, ...]]] = [
-        ("ABC", ("A", "B", "C")),
-        ("BCD", ("B", "C", "D")),
-        ("AEG", ("A", "E", "G")),
-        ("DFG", ("D", "F", "G")),
-        ("EGN", ("E", "G", "N")),
-        ("FGO", ("F", "G", "O")),
-        ("HIJ", ("H", "I", "J")),
-        ("KLM", ("K", "L", "M")),
-        ("NOP", ("N", "O", "P")),
-    ]
     found: Dict[str, str] = {}
-    for name, cols in rows:
+    for name, cols in _TRIPLE_ROWS:
         found[name] = "".join(str(flat[c]) for c in cols if c in flat)
     return found
 
@@ -426,6 +432,272 @@ def _evaluate_18_windows(read_values: List[int]) -> Optional[Dict[str, Any]]:
     }
 
 
+def feature_tags(feature_type: str) -> Tuple[str, ...]:
+    """Every tag scan_special_signals can report for `feature_type`, in rule order."""
+    tags: List[str] = []
+    for rule in SPECIAL_RULES:
+        if feature_type not in rule.get("feature", []):
+            continue
+        tags += rule.get("tags", [])
+        if rule.get("betrayal_pattern"):
+            tags += ["betrayal_front", "betrayal_back"]   # direction tags added by the scan
+    if feature_type in ("yearly", "monthly"):
+        tags.append("downfall_18")                       # _evaluate_18_windows
+    return tuple(dict.fromkeys(tags))
+
+
+# ───────────── compiled rule tables (one per feature_type) ─────────────
+# Each feature_type's rules are compiled once into predicate tables that map an
+# observed value straight to the bitmask of rules it satisfies: read value →
+# rules, left/right digit → rules, triple key → digits → rules, plus masks for
+# the sandwich/pairing/leader/betrayal patterns and each rule's ready tags and
+# notes. A scan is then one pass over the cells, a few dozen dict lookups and a
+# walk over the matched rules. Tables are rebuilt when SPECIAL_RULES is
+# replaced or grows (rules are added with +=), together with the memo below;
+# after editing a rule in place, call recompile_rules().
+
+_COMPILED_RULES: Dict[str, Dict[str, Any]] = {}
+_COMPILED_FOR: List[Tuple[int, int]] = [(0, -1)]
+
+_TRIPLE_NAMES = tuple(name for name, _ in _TRIPLE_ROWS)
+_TRIPLE_IDX = tuple((name, tuple(CELLS.index(c) for c in cols)) for name, cols in _TRIPLE_ROWS)
+_LEFT_IDX = tuple(i for i, c in enumerate(CELLS) if c in LEFT_POS)
+_RIGHT_IDX = tuple(i for i, c in enumerate(CELLS) if c in RIGHT_POS)
+_DIGIT_STR = tuple(str(i) for i in range(256))
+
+
+def _compile_feature(feature_type: str) -> Dict[str, Any]:
+    rules = [r for r in SPECIAL_RULES if feature_type in r.get("feature", [])]
+    by_read: Dict[Any, int] = {}
+    by_left: Dict[Any, int] = {}
+    by_right: Dict[Any, int] = {}
+    by_triple: Dict[str, Dict[Any, int]] = {}
+    by_sandwich: Dict[str, int] = {}
+    pairing = leader = betrayal = 0
+
+    def _add(table: Dict, key, bit: int) -> None:
+        table[key] = table.get(key, 0) | bit
+
+    out = []
+    for i, rule in enumerate(rules):
+        bit = 1 << i
+        for v in rule.get("reads_any", ()):
+            _add(by_read, v, bit)
+        for d in rule.get("left_digits_any", ()):
+            _add(by_left, d, bit)
+        for d in rule.get("right_digits_any", ()):
+            _add(by_right, d, bit)
+        keys = rule.get("triples_keys") or _TRIPLE_NAMES
+        if "triples_any" in rule:
+            for k in keys:
+                for s in rule["triples_any"]:
+                    _add(by_triple.setdefault(k, {}), s, bit)
+        if rule.get("triples_sandwich"):
+            for k in keys:
+                _add(by_sandwich, k, bit)
+        if rule.get("abcd_pairing"):
+            pairing |= bit
+        if rule.get("leader_pattern"):
+            leader |= bit
+        if rule.get("betrayal_pattern"):
+            betrayal |= bit
+        out.append((bit, rule, tuple(rule.get("tags", [])), rule.get("note"), rule.get("note_tpl")))
+
+    return {
+        "rules": tuple(out),
+        "by_read": by_read,
+        "by_left": by_left,
+        "by_right": by_right,
+        "by_triple": by_triple,
+        "by_sandwich": by_sandwich,
+        "abcd_pairing": pairing,
+        "leader": leader,
+        "betrayal": betrayal,
+    }
+
+
+def _sync_rules() -> None:
+    """Drop compiled tables and memoized results if SPECIAL_RULES changed."""
+    stamp = (id(SPECIAL_RULES), len(SPECIAL_RULES))
+    if _COMPILED_FOR[0] != stamp:
+        _COMPILED_RULES.clear()
+        _scan_cached.cache_clear()
+        _COMPILED_FOR[0] = stamp
+
+
+def recompile_rules() -> None:
+    """Rebuild the rule tables and signal memo on next use (after editing a rule in place)."""
+    _COMPILED_FOR[0] = (0, -1)
+    _sync_rules()
+
+
+def _compiled_rules(feature_type: str) -> Dict[str, Any]:
+    _sync_rules()
+    table = _COMPILED_RULES.get(feature_type)
+    if table is None:
+        table = _COMPILED_RULES[feature_type] = _compile_feature(feature_type)
+    return table
+
+
+_DIRECTION = {
+    (True, True): "front and back",
+    (True, False): "front/direct",
+    (False, True): "back",
+}
+
+
+def _match_compiled(
+    table: Dict[str, Any],
+    flat: Dict[str, int],
+    triples: Dict[str, str],
+    read_values: List[int],
+    left_digits: List[int],
+    right_digits: List[int],
+) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+    """(hits, tags, notes) for one triangle against a compiled feature table."""
+    mask = 0
+    by_read = table["by_read"]
+    if by_read:
+        for v in read_values:
+            mask |= by_read.get(v, 0)
+    by_left = table["by_left"]
+    if by_left:
+        for d in left_digits:
+            mask |= by_left.get(d, 0)
+    by_right = table["by_right"]
+    if by_right:
+        for d in right_digits:
+            mask |= by_right.get(d, 0)
+    by_triple = table["by_triple"]
+    for k, wanted in by_triple.items():
+        mask |= wanted.get(triples.get(k), 0)
+    for k, bits in table["by_sandwich"].items():
+        if _is_sandwich_triple(triples.get(k, "")):
+            mask |= bits
+    if table["abcd_pairing"] and _paired_or_equal(flat.get("A"), flat.get("D")) \
+            and _paired_or_equal(flat.get("B"), flat.get("C")):
+        mask |= table["abcd_pairing"]
+    if table["leader"] and _leader_pattern(flat):
+        mask |= table["leader"]
+    front = back = False
+    betrayal = table["betrayal"]
+    if betrayal:
+        front, back = _betrayal_flags(flat)
+        if not (front or back):
+            betrayal = 0
+        mask |= betrayal
+
+    hits: List[Dict[str, Any]] = []
+    tags: List[str] = []
+    notes: List[str] = []
+    if not mask:
+        return hits, tags, notes
+    for bit, rule, rule_tags, note, tpl in table["rules"]:
+        if not mask & bit:
+            continue
+        hits.append(rule)
+        tags.extend(rule_tags)
+        if betrayal & bit:
+            if front:
+                tags.append("betrayal_front")
+            if back:
+                tags.append("betrayal_back")
+            if isinstance(tpl, str) and "{direction}" in tpl:
+                notes.append(tpl.format(direction=_DIRECTION[(front, back)]))
+            else:
+                notes.append(tpl or "Back-stepping/betrayal marker detected.")
+        elif note:
+            notes.append(note)
+    return hits, tags, notes
+
+
+def _dedup(seq: List[str]) -> List[str]:
+    return list(dict.fromkeys(seq))
+
+
+def _scan_compiled(
+    feature_type: str,
+    final_values: Dict[str, Dict[str, int]],
+    final_reads: Optional[Dict[str, int]],
+) -> Optional[Dict[str, Any]]:
+    table = _compiled_rules(feature_type)
+
+    # one pass over the cells: flat view, triples, left/right digits
+    if isinstance(final_values, Triangle):
+        flat, v = final_values.flat, final_values.cells
+    else:
+        flat = _values_flat(final_values)
+        v = tuple(flat[c] for c in CELLS) if len(flat) == len(CELLS) and all(c in flat for c in CELLS) else None
+    if v is not None:
+        ds = _DIGIT_STR
+        triples = {name: ds[v[i]] + ds[v[j]] + ds[v[k]] for name, (i, j, k) in _TRIPLE_IDX} \
+            if all(0 <= x <= 255 for x in v) else _scan_triples(flat)
+        left_digits = [v[i] for i in _LEFT_IDX]
+        right_digits = [v[i] for i in _RIGHT_IDX]
+    else:
+        triples = _scan_triples(flat)
+        left_digits = _digits_on_side(flat, "left")
+        right_digits = _digits_on_side(flat, "right")
+
+    reads = final_reads or build_reads(final_values)
+    all_read_values = [x for x in (reads or {}).values() if isinstance(x, int)]
+    compound_values = [x for x in all_read_values if 10 <= x <= 99]
+
+    hits, tags, notes = _match_compiled(table, flat, triples, all_read_values, left_digits, right_digits)
+
+    r18 = _evaluate_18_windows(compound_values) if feature_type in ("yearly", "monthly") else None
+    if r18:
+        hits.append({"special": "18_rule"})
+        tags.extend(r18["tags"])
+        notes.append(r18["note"])
+
+    if not hits:
+        return None
+
+    return {
+        "present": True,
+        "feature": feature_type,
+        "tags": _dedup(tags),
+        "notes": _dedup(notes),
+        "reads_used": sorted(set(compound_values)),
+        "triples_seen": {k: s for k, s in triples.items() if s},
+        "left_side_digits": sorted(left_digits),
+        "right_side_digits": sorted(right_digits),
+        "r18": r18,
+    }
+
+
+# ───────────── memo: (feature_type, triangle signature) → result ─────────────
+# Results depend only on the 18 cells (reads are derived from them), so complete
+# triangles are served from a bounded cache. Callers get a copy; caller-supplied
+# reads that differ from the derived ones bypass the cache.
+
+SIGNAL_CACHE_SIZE = 131_072   # room for a full precompute (8 features × 10,000) plus hot combos
+
+
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _derived_reads(sig: bytes) -> Dict[str, int]:
+    return build_reads(Triangle(sig))
+
+
+@lru_cache(maxsize=SIGNAL_CACHE_SIZE)
+def _scan_cached(feature_type: str, sig: bytes) -> Optional[Dict[str, Any]]:
+    return _scan_compiled(feature_type, Triangle(sig), None)
+
+
+def _copy_signals(notes: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if notes is None:
+        return None
+    out = dict(notes)
+    for k in ("tags", "notes", "reads_used", "left_side_digits", "right_side_digits"):
+        out[k] = list(notes[k])
+    out["triples_seen"] = dict(notes["triples_seen"])
+    r18 = notes["r18"]
+    if r18 is not None:
+        out["r18"] = {**r18, "windows": [dict(w) for w in r18["windows"]], "tags": list(r18["tags"])}
+    return out
+
+
 def scan_special_signals(
     *,
     feature_type: str,
@@ -436,6 +708,39 @@ def scan_special_signals(
     Inspect the FINAL (active) triangle of a feature and return a compact note
     ONLY when a rule matches for that feature_type.
     """
+    _sync_rules()
+    sig = _triangle_signature(final_values)
+    if sig is not None and (final_reads is None or final_reads == _derived_reads(sig)):
+        return _copy_signals(_scan_cached(feature_type, sig))
+    return _scan_compiled(feature_type, final_values, final_reads)
+
+
+def precompute_signal_cache(feature_types: Optional[Iterable[str]] = None) -> int:
+    """
+    Fill the signal cache for every one of the 10,000 ABCD triangles (all
+    feature types in SPECIAL_RULES by default). Returns the number of entries.
+    """
+    if feature_types is None:
+        feature_types = sorted({f for r in SPECIAL_RULES for f in r.get("feature", [])})
+    n = 0
+    for ft in feature_types:
+        for key in range(10_000):
+            _scan_cached(ft, Triangle.from_abcd(key // 1000, key // 100 % 10, key // 10 % 10, key % 10).cells)
+            n += 1
+    return n
+
+
+def _scan_special_signals_reference(
+    *,
+    feature_type: str,
+    final_values: Dict[str, Dict[str, int]],
+    final_reads: Optional[Dict[str, int]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Straightforward per-rule loop over SPECIAL_RULES. Kept as the executable
+    spec for the compiled tables used by scan_special_signals (tests and
+    benchmarks compare the two).
+    """
     flat = _values_flat(final_values)
     triples = _scan_triples(flat)
     reads = final_reads or build_reads(final_values)
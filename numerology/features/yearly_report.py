@@ -1,23 +1,14 @@
 # numerology/features/yearly_report.py
 from __future__ import annotations
-from typing import Dict, Any
-from numerology.core import (
-    mystical_triangle_values_image,
-    year_only_triangle,
-    yearly_combined_triangle,
-    _collect_used_numbers,
-)
-from numerology.reads import build_reads
-from numerology.traits import meaning, num_traits, COMPOUND_TRAITS, F_TRAIT
+from typing import Dict, Any, Optional
+from numerology.context import TriangleContext, ensure_context
+from numerology.core import Triangle
+from numerology.traits import meaning, COMPOUND_TRAITS, F_TRAIT
 
-# 🔹 NEW imports
-from numerology.traits import summarize_polarity
-from numerology.features.special_numbers import scan_special_signals
 
-
-def _reads_details(vals: Dict[str, Dict[str, int]]) -> tuple[dict, dict]:
+def _reads_details(vals: Triangle, ctx: TriangleContext) -> tuple[dict, dict]:
     """Build reads + (compact) traits mapping only for used compound codes."""
-    reads = build_reads(vals)
+    reads = ctx.reads(vals)
     used_codes = sorted({v for v in reads.values() if v in COMPOUND_TRAITS})
     reads_traits = {code: COMPOUND_TRAITS[code] for code in used_codes}
     reads_explained = {
@@ -27,7 +18,12 @@ def _reads_details(vals: Dict[str, Dict[str, int]]) -> tuple[dict, dict]:
     return reads_explained, reads_traits
 
 
-def yearly_triangle_report(dob_str: str, year: int) -> Dict[str, Any]:
+def yearly_triangle_report(
+    dob_str: str,
+    year: int,
+    *,
+    ctx: Optional[TriangleContext] = None,
+) -> Dict[str, Any]:
     """
     Yearly report that mirrors your screenshot:
       Left   = DOB triangle
@@ -36,35 +32,31 @@ def yearly_triangle_report(dob_str: str, year: int) -> Dict[str, Any]:
 
     Returns one JSON with values, reads, and traits-driven notes.
     """
-    left = mystical_triangle_values_image(dob_str)
-    right = year_only_triangle(year)
-    combo = yearly_combined_triangle(dob_str, year)
+    ctx = ensure_context(dob_str, ctx)
+    left = ctx.base
+    right = ctx.year_driver(year)
+    combo = ctx.yearly(year)
 
     # traits: collect from the combined triangle (what matters for the year’s effect)
-    used_nums = sorted(_collect_used_numbers(combo))
-    traits_map = {n: num_traits(n) for n in used_nums}
+    traits_map = ctx.traits(combo)
 
     # reads/traits per panel
-    left_reads_explained, left_reads_traits = _reads_details(left)
-    right_reads_explained, right_reads_traits = _reads_details(right)
-    combo_reads_explained, combo_reads_traits = _reads_details(combo)
+    left_reads_explained, left_reads_traits = _reads_details(left, ctx)
+    right_reads_explained, right_reads_traits = _reads_details(right, ctx)
+    combo_reads_explained, combo_reads_traits = _reads_details(combo, ctx)
 
     # 🔹 NEW: compute polarity + special notes (feature-aware = "yearly")
-    polarity = summarize_polarity(combo)
-    special_notes = scan_special_signals(
-        feature_type="yearly",
-        final_values=combo,
-        final_reads=build_reads(combo),
-    )
+    polarity = ctx.polarity(combo)
+    special_notes = ctx.signals("yearly", combo)
 
     # Core glance (from combo)
-    E = combo["layer1"]["E"]; F = combo["layer1"]["F"]; G = combo["layer1"]["G"]
-    P = combo["third_layer"]["P"]; EF = int(f"{E}{F}")
+    E = combo.E; F = combo.F; G = combo.G
+    P = combo.P; EF = int(f"{E}{F}")
 
     # Panel mini-sections with meanings (for UI hover / reference)
-    def panel_core(vals: Dict[str, Dict[str, int]]) -> dict:
-        e = vals["layer1"]["E"]; f = vals["layer1"]["F"]; g = vals["layer1"]["G"]
-        p = vals["third_layer"]["P"]
+    def panel_core(vals: Triangle) -> dict:
+        e = vals.E; f = vals.F; g = vals.G
+        p = vals.P
         return {
             "EF_core": {
                 "value": int(f"{e}{f}"),
@@ -80,34 +72,34 @@ def yearly_triangle_report(dob_str: str, year: int) -> Dict[str, Any]:
         "year": year,
         "panels": {
             "left_dob": {
-                "values": left,
+                "values": left.to_dict(),
                 "reads": left_reads_explained,
                 "reads_traits": left_reads_traits,
                 "interpretations": {"core": panel_core(left)},
                 "core_notes": {
                     "priority": "G is most important core number; then E and F.",
-                    "F_trait": F_TRAIT.get(left["layer1"]["F"], ""),
+                    "F_trait": F_TRAIT.get(left.F, ""),
                 },
             },
             "right_year": {
-                "values": right,
+                "values": right.to_dict(),
                 "reads": right_reads_explained,
                 "reads_traits": right_reads_traits,
                 "interpretations": {"core": panel_core(right)},
                 "note": "Year-only driver: A=0, B=0; C/D from the target year.",
                 "core_notes": {
                     "priority": "Driver panel for the year; used only for combination.",
-                    "F_trait": F_TRAIT.get(right["layer1"]["F"], ""),
+                    "F_trait": F_TRAIT.get(right.F, ""),
                 },
             },
             "combined": {
-                "values": combo,
+                "values": combo.to_dict(),
                 "reads": combo_reads_explained,
                 "reads_traits": combo_reads_traits,
                 "interpretations": {"core": panel_core(combo)},
                 "core_notes": {
                     "priority": "This is the active yearly pattern (DOB ⊕ Year).",
-                    "F_trait": F_TRAIT.get(combo["layer1"]["F"], ""),
+                    "F_trait": F_TRAIT.get(combo.F, ""),
                 },
                 "polarity": polarity,                                  # 🔹 NEW
                 **({"special_notes": special_notes} if special_notes else {}),  # 🔹 NEW
@@ -0,0 +1,176 @@
+# numerology/glyph_atlas.py
+"""
+Triangle PNGs composited from pre-rendered pixels, without plotting.
+
+A layout's image is its empty frame (lines and A..G labels) plus one bold
+digit per value slot. GlyphAtlas.build() renders, once per layout, the frame
+with empty slots and the frame with every slot showing 0, 1, ... 9 (11
+matplotlib renders), and keeps for each slot a fixed box and, per digit, that
+box's pixels. compose() pastes the digits' boxes into a copy of the frame,
+which gives exactly the pixels matplotlib would have drawn (each digit was
+rendered at its own slot's sub-pixel position, so antialiasing matches).
+
+png() does not compress per request either. The PNG's zlib stream is cut at
+the slot boxes into static spans of the frame and one piece per (slot,
+digit, box row); each piece is deflated once, independently, and ends on a
+byte boundary, so any sequence of pieces is a valid stream. A request joins
+the pieces for its digits and checksums the pixels (adler32): ~0.2 ms against
+30-70 ms for a figure + savefig(dpi=170), with identical pixels.
+
+Only single digits have pieces; callers render anything else (never produced
+by the reductions) with matplotlib instead.
+"""
+from __future__ import annotations
+import io
+import struct
+import zlib
+from typing import List, Optional, Protocol, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+DIGITS = "0123456789"
+WINDOW = 0.9   # data units around a slot's centre searched for its digit's pixels
+DPI = 170
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_ZLIB_HEADER = b"\x78\x01"
+_FINAL_BLOCK = b"\x03\x00"   # empty fixed-Huffman block with BFINAL set
+
+
+class _Canvas(Protocol):
+    slots: int
+
+    def render_texts(self, texts: Sequence[str], fmt: str = "png") -> bytes: ...
+
+    def slot_pixels(self) -> Tuple[List[Tuple[float, float]], float]: ...
+
+
+def _decode(png: bytes) -> np.ndarray:
+    return np.asarray(Image.open(io.BytesIO(png)).convert("RGBA"))
+
+
+def _opaque_gray(rgba: np.ndarray) -> bool:
+    return bool((rgba[..., 3] == 255).all() and (rgba[..., 0] == rgba[..., 1]).all()
+                and (rgba[..., 1] == rgba[..., 2]).all())
+
+
+def _deflate(data: bytes) -> bytes:
+    """Raw deflate of `data` on its own, ending byte-aligned (sync flush), not final."""
+    co = zlib.compressobj(6, zlib.DEFLATED, -15)
+    return co.compress(data) + co.flush(zlib.Z_SYNC_FLUSH)
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def _slot_box(frame: np.ndarray, digits: List[np.ndarray], cx: float, cy: float, half: float):
+    """Smallest (top, bottom, left, right) around (cx, cy) holding every digit's pixels."""
+    h, w = frame.shape[:2]
+    r0, r1 = max(0, int(cy - half)), min(h, int(cy + half) + 1)
+    c0, c1 = max(0, int(cx - half)), min(w, int(cx + half) + 1)
+    changed = np.zeros((r1 - r0, c1 - c0), dtype=bool)
+    for img in digits:
+        changed |= np.any(img[r0:r1, c0:c1] != frame[r0:r1, c0:c1], axis=2)
+    rows, cols = np.nonzero(changed)
+    if not rows.size:
+        raise RuntimeError(f"No digit pixels found near slot centre ({cx:.0f}, {cy:.0f})")
+    return r0 + rows.min(), r0 + rows.max() + 1, c0 + cols.min(), c0 + cols.max() + 1
+
+
+class GlyphAtlas:
+    """A layout's frame and per-slot digit boxes, as pixels and as deflated PNG pieces."""
+
+    def __init__(self, frame: np.ndarray, boxes: List[Tuple[int, int, int, int]], digits: List[np.ndarray]):
+        self.shape = frame.shape              # (h, w) gray, or (h, w, 4) RGBA
+        self.boxes = boxes                    # per slot: (top, bottom, left, right)
+        h, w = frame.shape[:2]
+        channels = 1 if frame.ndim == 2 else 4
+        # PNG scanlines: filter byte 0 ("None") + the row's samples
+        self._raw = np.zeros((h, 1 + w * channels), dtype=np.uint8)
+        self._raw[:, 1:] = frame.reshape(h, -1)
+        cols = [(1 + left * channels, 1 + right * channels) for _, _, left, right in boxes]
+        self._cols = cols
+        self._glyphs = [                      # [slot][digit] -> box samples
+            [img.reshape(h, -1)[top:bottom, c0 - 1:c1 - 1].copy() for img in digits]
+            for (top, bottom, _, _), (c0, c1) in zip(boxes, cols)
+        ]
+        self._plan = self._pieces()
+        self._head = _PNG_SIGNATURE + _chunk(
+            b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 0 if channels == 1 else 6, 0, 0, 0)
+        ) + _chunk(b"pHYs", struct.pack(">IIB", round(DPI / 0.0254), round(DPI / 0.0254), 1))
+        self._tail = _chunk(b"IEND", b"")
+
+    @classmethod
+    def build(cls, canvas: _Canvas) -> "GlyphAtlas":
+        frame = _decode(canvas.render_texts([""] * canvas.slots))
+        digits = [_decode(canvas.render_texts([d] * canvas.slots)) for d in DIGITS]
+        if any(img.shape != frame.shape for img in digits):
+            raise RuntimeError("Digit renders changed the image size; cannot composite")
+        centres, unit = canvas.slot_pixels()
+        boxes = [_slot_box(frame, digits, cx, cy, WINDOW * unit) for cx, cy in centres]
+        _check_disjoint(boxes)
+        if all(_opaque_gray(img) for img in [frame, *digits]):
+            # Black on white: one channel holds the same pixels in a quarter of the memory and PNG data.
+            frame, digits = frame[..., 0], [img[..., 0] for img in digits]
+        return cls(frame, boxes, digits)
+
+    def _pieces(self) -> List[Union[bytes, Tuple[int, List[bytes]]]]:
+        """The zlib stream as deflated static spans (bytes) and slot rows ((slot, [digit] -> bytes))."""
+        raw = self._raw
+        width = raw.shape[1]
+        plan: List[Union[bytes, Tuple[int, List[bytes]]]] = []
+        static: List[bytes] = []
+
+        def flush_static():
+            if static:
+                plan.append(_deflate(b"".join(static)))
+                static.clear()
+
+        for y in range(raw.shape[0]):
+            pos = 0
+            for s in sorted((s for s, (top, bottom, _, _) in enumerate(self.boxes) if top <= y < bottom),
+                            key=lambda s: self._cols[s][0]):
+                c0, c1 = self._cols[s]
+                static.append(raw[y, pos:c0].tobytes())
+                flush_static()
+                row = y - self.boxes[s][0]
+                plan.append((s, [_deflate(glyph[row].tobytes()) for glyph in self._glyphs[s]]))
+                pos = c1
+            static.append(raw[y, pos:width].tobytes())
+        flush_static()
+        return plan
+
+    def _valid(self, values: Sequence[int]) -> bool:
+        return len(values) == len(self.boxes) and all(0 <= v <= 9 for v in values)
+
+    def _compose_raw(self, values: Sequence[int]) -> np.ndarray:
+        out = self._raw.copy()
+        for (top, bottom, _, _), (c0, c1), glyphs, v in zip(self.boxes, self._cols, self._glyphs, values):
+            out[top:bottom, c0:c1] = glyphs[v]
+        return out
+
+    def compose(self, values: Sequence[int]) -> Optional[np.ndarray]:
+        """Pixels for the slot values (A..G per triangle), or None if one is not a single digit."""
+        if not self._valid(values):
+            return None
+        return self._compose_raw(values)[:, 1:].reshape(self.shape)
+
+    def png(self, values: Sequence[int]) -> Optional[bytes]:
+        if not self._valid(values):
+            return None
+        parts = [_ZLIB_HEADER]
+        for piece in self._plan:
+            parts.append(piece if isinstance(piece, bytes) else piece[1][values[piece[0]]])
+        parts.append(_FINAL_BLOCK)
+        parts.append(struct.pack(">I", zlib.adler32(self._compose_raw(values))))
+        return self._head + _chunk(b"IDAT", b"".join(parts)) + self._tail
+
+
+def _check_disjoint(boxes: List[Tuple[int, int, int, int]]) -> None:
+    """No two slots' boxes may overlap."""
+    for i, (t1, b1, l1, r1) in enumerate(boxes):
+        for t2, b2, l2, r2 in boxes[i + 1:]:
+            if t1 < b2 and t2 < b1 and l1 < r2 and l2 < r1:
+                raise RuntimeError("Digit boxes of two slots overlap; cannot composite")
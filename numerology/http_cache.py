@@ -0,0 +1,110 @@
+# numerology/http_cache.py
+"""
+HTTP validators and freshness for the pure numerology endpoints.
+
+A response is a function of (path, query parameters, code/data version), so
+its strong ETag is a hash of exactly that. Routes whose inputs reduce to a
+canonical key (numerology.canonical, via num_api._canonical_key) pass that
+key instead of the query, so "dob=29-10-2001" and "dob=2001-10-29" share an
+ETag. The URLs stay separate cache entries (nginx keys on the URI) because
+the body echoes the inputs as given. A matching If-None-Match is answered
+with 304 before anything is built or rendered. Responses are public with a
+short max-age and must-revalidate: after MAX_AGE seconds browsers, nginx
+(deploy/nginx.conf) and the Streamlit client revalidate, which costs a 304
+while nothing changed and picks up a deploy (a new data_version(), so a new
+ETag) within minutes. Day-relative ones ("today", or a default year/month)
+also hash the current date and never stay fresh past the next local midnight.
+"""
+from __future__ import annotations
+import hashlib
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Hashable, Optional
+
+from fastapi import Request, Response
+
+from numerology.shared_tables import hash_sources
+
+MAX_AGE = 5 * 60   # bounds how long a cached response can outlive a deploy
+
+_PKG = Path(__file__).resolve().parent
+
+
+@lru_cache(maxsize=1)
+def data_version() -> str:
+    """Hash of every module in the numerology package (traits, rules, builders, rendering)."""
+    return hash_sources(sorted(str(p.relative_to(_PKG)) for p in _PKG.rglob("*.py")))
+
+
+def seconds_until_midnight(now: Optional[datetime] = None) -> int:
+    now = now or datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max(1, int((midnight - now).total_seconds()))
+
+
+def request_etag(request: Request, *, key: Optional[Hashable] = None, day_relative: bool = False) -> str:
+    """Strong ETag over (data version, path, canonical `key` or else the sorted query, today's date if day-relative)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(data_version().encode())
+    h.update(request.url.path.encode())
+    if key is not None:
+        h.update(b"\0#" + repr(key).encode())
+    else:
+        for k, v in sorted(request.query_params.multi_items()):
+            h.update(b"\0" + k.encode() + b"=" + v.encode())
+    if day_relative:
+        h.update(b"\0@" + date.today().isoformat().encode())
+    return f'"{h.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _cache_headers(request: Request, key: Optional[Hashable], day_relative: bool) -> Dict[str, str]:
+    etag = request_etag(request, key=key, day_relative=day_relative)
+    max_age = min(MAX_AGE, seconds_until_midnight()) if day_relative else MAX_AGE
+    return {"ETag": etag, "Cache-Control": f"public, max-age={max_age}, must-revalidate"}
+
+
+def conditional(
+    request: Request,
+    build: Callable[[], Response],
+    *,
+    key: Optional[Hashable] = None,
+    day_relative: bool = False,
+) -> Response:
+    """
+    304 when the client's If-None-Match covers this request, else `build()`;
+    either way with ETag and Cache-Control set. `key`: the request's
+    canonical inputs, if it has them (see request_etag).
+    """
+    headers = _cache_headers(request, key, day_relative)
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response = build()
+    response.headers.update(headers)
+    return response
+
+
+async def conditional_async(
+    request: Request,
+    build: Callable[[], Awaitable[Response]],
+    *,
+    key: Optional[Hashable] = None,
+    day_relative: bool = False,
+) -> Response:
+    """conditional() for a coroutine `build` (work awaited on a render pool)."""
+    headers = _cache_headers(request, key, day_relative)
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response = await build()
+    response.headers.update(headers)
+    return response
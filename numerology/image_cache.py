@@ -0,0 +1,175 @@
+# numerology/image_cache.py
+"""
+Content-addressed cache of rendered triangle images.
+
+An image depends only on the renderer (source + matplotlib version), the
+layout, the digits drawn, the format and the dpi; titles are never drawn.
+That space is small (10,000 single triangles, a few more combined variants),
+so every image is rendered once and then served from:
+
+  memory  per-process LRU, bounded in bytes (NUMEROLOGY_IMAGE_CACHE_MEMORY_MB, 32)
+  disk    one file per image under NUMEROLOGY_IMAGE_CACHE (default image_cache/
+          next to the package; "off" disables), shared by the API workers and
+          the render/PDF pool processes, bounded by NUMEROLOGY_IMAGE_CACHE_MB
+          (256) with least-recently-used files evicted first
+
+Keys are built by numerology.render_service.image_key (a hash, so they are
+also safe file names). stats() counts memory/disk hits, misses, stores and
+evictions (GET /numerology/image-cache.json).
+"""
+from __future__ import annotations
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_DIR = Path(__file__).resolve().parent.parent / "image_cache"
+_MB = 1 << 20
+
+
+class ImageCache:
+    """In-process LRU in front of a size-bounded directory of image files."""
+
+    def __init__(self, memory_bytes: int, disk_dir: Optional[Path] = None, disk_bytes: int = 0):
+        self.memory_bytes = memory_bytes
+        self.disk_dir = disk_dir
+        self.disk_bytes = disk_bytes
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_used = 0
+        self._disk_used: Optional[int] = None   # scanned on the first store
+        self._counts = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    # ───────────── memory tier ─────────────
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.memory_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_used -= len(old)
+            self._memory[key] = data
+            self._memory_used += len(data)
+            while self._memory_used > self.memory_bytes:
+                _, dropped = self._memory.popitem(last=False)
+                self._memory_used -= len(dropped)
+
+    # ───────────── disk tier ─────────────
+
+    def _path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / key
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)   # mtime = last use, for eviction
+        except OSError:
+            return None
+        return data
+
+    def _write(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)   # readers never see a partial file
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        with self._lock:
+            if self._disk_used is not None:
+                self._disk_used += len(data)
+                over = self._disk_used > self.disk_bytes
+            else:
+                over = True   # first store in this process: measure the directory
+        if over:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used files until the directory is under 90% of its bound."""
+        files = []
+        for path in self.disk_dir.glob("*/*"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+        used = sum(size for _, size, _ in files)
+        evicted = 0
+        if used > self.disk_bytes:
+            target = self.disk_bytes * 0.9
+            for _, size, path in sorted(files, key=lambda f: f[0]):
+                if used <= target:
+                    break
+                path.unlink(missing_ok=True)
+                used -= size
+                evicted += 1
+        with self._lock:
+            self._disk_used = used
+            self._counts["evictions"] += evicted
+
+    # ───────────── API ─────────────
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._counts["memory_hits"] += 1
+                return data
+        data = self._read(key) if self.disk_dir is not None else None
+        with self._lock:
+            self._counts["disk_hits" if data is not None else "misses"] += 1
+        if data is not None:
+            self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._counts["stores"] += 1
+        self._remember(key, data)
+        if self.disk_dir is not None:
+            self._write(key, data)
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_used = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+            out: Dict[str, Any] = {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_used,
+                "memory_limit": self.memory_bytes,
+                "disk_dir": str(self.disk_dir) if self.disk_dir is not None else None,
+                "disk_bytes": self._disk_used,
+                "disk_limit": self.disk_bytes if self.disk_dir is not None else None,
+            }
+        lookups = counts["memory_hits"] + counts["disk_hits"] + counts["misses"]
+        hits = counts["memory_hits"] + counts["disk_hits"]
+        return {**counts, "hit_rate": round(hits / lookups, 3) if lookups else None, **out}
+
+
+def _env_mb(name: str, default: int) -> int:
+    value = (os.getenv(name) or "").strip()
+    return int(float(value) * _MB) if value else default * _MB
+
+
+def cache_dir() -> Optional[Path]:
+    env = (os.getenv("NUMEROLOGY_IMAGE_CACHE") or "").strip()
+    if env.lower() in ("off", "0", "false", "none"):
+        return None
+    return Path(env) if env else DEFAULT_DIR
+
+
+IMAGE_CACHE = ImageCache(
+    _env_mb("NUMEROLOGY_IMAGE_CACHE_MEMORY_MB", 32),
+    cache_dir(),
+    _env_mb("NUMEROLOGY_IMAGE_CACHE_MB", 256),
+)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, Tuple, Optional
 
 from .core import mulank_bhagyank_from_dob
+from .context import TriangleContext
 
 # ─────────────────────────────────────────────────────────────
 # 1) Canonical star labels → human meanings
@@ -181,8 +182,11 @@ def star_info_for_pair(mulank: int, bhagyank: int) -> Dict[str, Optional[str]]:
 # 3) Public API
 # ─────────────────────────────────────────────────────────────
 
-def mulank_bhagyank_profile(dob_str: str) -> Dict[str, object]:
-    mulank, bhagyank = mulank_bhagyank_from_dob(dob_str)
+def mulank_bhagyank_profile(dob_str: str, *, ctx: Optional[TriangleContext] = None) -> Dict[str, object]:
+    if ctx is not None and ctx.dob_str == dob_str:
+        mulank, bhagyank = ctx.mulank_bhagyank
+    else:
+        mulank, bhagyank = mulank_bhagyank_from_dob(dob_str)
     pair_info = star_info_for_pair(mulank, bhagyank)
 
     return {
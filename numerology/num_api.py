@@ -1,7 +1,12 @@
 # numerology/num_api.py
-from fastapi import APIRouter, Query, Response
-import io
+from concurrent.futures import BrokenExecutor
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from functools import lru_cache
+from itertools import chain, groupby
+from operator import attrgetter
 from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from feature_gate import ensure_allowed
 from numerology.features.profile_bulletins import build_profile_bulletins
 
@@ -19,29 +24,45 @@ from numerology import (  # top-level exports from package
 # --- reads helper (concat like EF, AB, etc.) ---
 from numerology.reads import build_reads
 
-# --- viz (PNG/PDF + triptych) ---
-from numerology.viz import (
-    plot_mystical_triangle_excel_exact,
-    build_triangle_png_bytes,
-    build_triangle_pdf_bytes,
-    plot_three_triangles,
-    plot_yearly_triptych,
-    plot_monthly_triptych,
-    plot_daily_triptych,
-)
+# --- rendering (PNG/PDF + triptych) ---
+from numerology import render_service
+from numerology.svg_render import MEDIA_TYPE as SVG_MEDIA_TYPE
+from numerology.image_cache import IMAGE_CACHE
 from numerology.mulank_bhagyank import mulank_bhagyank_profile
+from numerology.reverse_index import get_reverse_index, expand_abcd_dates, parse_criteria
+from numerology.report_store import KINDS as STORE_KINDS, stored_template
+from numerology.fast_json import EchoTemplate, dumps, json_bytes_response, json_response, loads
+from numerology.context import TriangleContext, ensure_context
+from numerology.shared_tables import abcd_triangles
+from numerology.http_cache import conditional, conditional_async
+from numerology.render_pool import RENDER_POOL, PoolBusy, pool_stats
+from numerology.canonical import (
+    day_for_key,
+    day_key,
+    dob_for_key,
+    dob_key,
+    is_today,
+    year_for_key,
+    year_key,
+)
 
 # --- reports (moved to features) ---
 from numerology.features.single_person_report import mystical_triangle_report
 from numerology.features.relationship_report import relationship_triangle_report
 from numerology.features.yearly_report import yearly_triangle_report
 from numerology.features.monthly_report import monthly_prediction_report
-from numerology.features.daily_report import daily_triangle_report
+from numerology.features.daily_report import daily_triangle_report, iter_daily_range
+from numerology.features.calendar_signals import (
+    special_signal_calendar,
+    best_days,
+    parse_cell_constraints,
+)
 from numerology.features.health_report import (
     health_triangle_report,      # existing single (DOB-only)
     health_daily_report,         # NEW: DOB ⊕ Day
     health_monthly_report,       # NEW: DOB ⊕ Month-Year driver
     health_yearly_report,        # NEW: DOB ⊕ Year-only
+    _is_female,
 )
 from numerology.features.profession_report import profession_report
 
@@ -49,43 +70,340 @@ from numerology.features.profession_report import profession_report
 
 router = APIRouter(prefix="/numerology", tags=["numerology"])
 
+
+# ── Deterministic endpoints: encoded bytes, cached ───────────────
+# These results depend only on the canonical keys of their arguments
+# (numerology.canonical): a DOB's ABCD digits, a driver year's C/D digits, a
+# resolved day. Each distinct key is built and encoded once (or read from the
+# report store, see numerology.report_store) from a representative input, and
+# kept as a template with the fields that echo the caller's raw input cut out;
+# a request renders its own `dob`/`year`/... back into it.
+
+ENCODED_CACHE_SIZE = 2048   # ~10-15 KB per report
+
+# argument role → (canonical key of a raw argument, representative argument for a key)
+_ROLES: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "dob": (dob_key, dob_for_key),
+    "year": (year_key, year_for_key),            # driver year: only its C/D matter
+    "calendar_year": (int, int),                 # actual days of the year matter
+    "day": (day_key, day_for_key),
+    "gender": (_is_female, lambda female: "female" if female else None),
+}
+
+
+def _no_echo(*args: Any) -> Dict[str, Any]:
+    return {}
+
+
+def _echo_dob(dob: str, *rest: Any) -> Dict[str, Any]:
+    return {"dob": dob}
+
+
+def _echo_dob_year(dob: str, year: int, *rest: Any) -> Dict[str, Any]:
+    return {"dob": dob, "year": year}
+
+
+def _echo_daily(dob: str, day: Any) -> Dict[str, Any]:
+    # the chosen day is labelled as given, or DD-MM-YYYY for today
+    label = day_for_key(day_key(day)) if is_today(day) else day
+    return {"dob": dob, "day": label, "today": label, "date": label}
+
+
+def _values(dob: str, *, ctx: Optional[TriangleContext] = None) -> Dict[str, Dict[str, int]]:
+    return ensure_context(dob, ctx).base.to_dict()   # == mystical_triangle_values_image(dob)
+
+
+class _Kind(NamedTuple):
+    build: Callable[..., Any]
+    roles: Tuple[str, ...]                                  # one per argument
+    echo: Callable[..., Dict[str, Any]] = _no_echo          # raw arguments the result repeats verbatim
+
+
+# Builders of the kinds in BATCH_TYPES also take ctx= (a shared TriangleContext).
+_DETERMINISTIC: Dict[str, _Kind] = {
+    "values": _Kind(_values, ("dob",)),
+    "year_only": _Kind(year_only_triangle, ("year",)),
+    "yearly_combined": _Kind(yearly_combined_triangle, ("dob", "year")),
+    "single": _Kind(mystical_triangle_report, ("dob",), _echo_dob),
+    "mulank_bhagyank": _Kind(mulank_bhagyank_profile, ("dob",), _echo_dob),
+    "profession": _Kind(profession_report, ("dob",), _echo_dob),
+    "relationship": _Kind(
+        relationship_triangle_report, ("dob", "dob"), lambda left, right: {"relationship": f"{left} + {right}"}
+    ),
+    "yearly": _Kind(yearly_triangle_report, ("dob", "year"), _echo_dob_year),
+    "monthly": _Kind(monthly_prediction_report, ("dob", "year"), _echo_dob_year),
+    "special_calendar": _Kind(special_signal_calendar, ("dob", "calendar_year"), _echo_dob),
+    "daily": _Kind(daily_triangle_report, ("dob", "day"), _echo_daily),
+    "health": _Kind(lambda dob, gender, **kw: health_triangle_report(dob, gender=gender, **kw), ("dob", "gender"), _echo_dob),
+    "health_daily": _Kind(
+        lambda dob, day, gender: health_daily_report(dob, day=day, gender=gender),
+        ("dob", "day", "gender"),
+        lambda dob, day, gender: {"dob": dob, "day": day or "today"},
+    ),
+    "health_monthly": _Kind(
+        lambda dob, year, gender, **kw: health_monthly_report(dob, year, gender=gender, **kw),
+        ("dob", "year", "gender"),
+        _echo_dob_year,
+    ),
+    "health_yearly": _Kind(
+        lambda dob, year, gender, **kw: health_yearly_report(dob, year, gender=gender, **kw),
+        ("dob", "year", "gender"),
+        _echo_dob_year,
+    ),
+}
+
+
+def _canonical_key(kind: str, *args: Any) -> Tuple[Any, ...]:
+    return tuple(_ROLES[role][0](a) for role, a in zip(_DETERMINISTIC[kind].roles, args))
+
+
+def _build_template(kind: str, key: Tuple[Any, ...], ctx: Optional[TriangleContext] = None) -> EchoTemplate:
+    """Stored or freshly built template for a canonical key (`ctx` must be for the key's representative DOB)."""
+    spec = _DETERMINISTIC[kind]
+    if kind in STORE_KINDS:
+        parts = dict(zip(spec.roles, key))
+        stored = stored_template(kind, parts["dob"], parts.get("year"), female=parts.get("gender", False))
+        if stored is not None:
+            return stored
+    args = tuple(_ROLES[role][1](k) for role, k in zip(spec.roles, key))
+    report = spec.build(*args) if ctx is None else spec.build(*args, ctx=ctx)
+    return EchoTemplate.of(report, spec.echo(*args))
+
+
+@lru_cache(maxsize=ENCODED_CACHE_SIZE)
+def _template(kind: str, key: Tuple[Any, ...]) -> EchoTemplate:
+    return _build_template(kind, key)
+
+
+def _encoded(kind: str, *args: Any, key: Optional[Tuple[Any, ...]] = None) -> bytes:
+    if key is None:
+        key = _canonical_key(kind, *args)
+    return _template(kind, key).render(_DETERMINISTIC[kind].echo(*args))
+
+
+def _cached(request: Request, kind: str, *args: Any, day_relative: bool = False) -> Response:
+    key = _canonical_key(kind, *args)   # also the ETag: equivalent spellings revalidate alike
+    return conditional(
+        request,
+        lambda: json_bytes_response(_encoded(kind, *args, key=key)),
+        key=(kind, key),
+        day_relative=day_relative,
+    )
+
+
+# ── Batch: many DOBs in one request ──────────────────────────────
+# Items are validated up front, reduced to canonical DOB keys, and all base
+# triangles are computed in one vectorized pass. Items are then processed
+# grouped by DOB key with one TriangleContext per group, each distinct
+# (report type, canonical key) is rendered once per group, and every item gets
+# one NDJSON line. Lines come grouped by DOB key, not in input order; "index"
+# is the item's position in the request.
+
+MAX_BATCH_ITEMS = 100_000
+BATCH_TYPES = ("values", "single", "profession", "mulank_bhagyank", "health", "yearly", "monthly", "health_monthly", "health_yearly")
+_YEAR_TYPES = {"yearly", "monthly", "health_monthly", "health_yearly"}
+_GENDER_TYPES = {"health", "health_monthly", "health_yearly"}
+
+
+class _BatchItem(NamedTuple):
+    index: int
+    dob: str
+    key: str                  # canonical DOB key
+    year: Optional[int]
+    gender: Optional[str]
+    types: Tuple[str, ...]
+
+
+def _batch_body(body: bytes, content_type: str) -> List[Any]:
+    """Raw items: a JSON list (or {"items": [...]}), or NDJSON with one item per line."""
+    if "ndjson" in content_type or "jsonl" in content_type:
+        items: List[Any] = []
+        for n, line in enumerate(body.splitlines(), 1):
+            if line.strip():
+                try:
+                    items.append(loads(line))
+                except ValueError:
+                    items.append(ValueError(f"Line {n} is not valid JSON"))
+        return items
+    try:
+        data = loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Body is not valid JSON")
+    if isinstance(data, dict):
+        data = data.get("items")
+    if not isinstance(data, list):
+        raise HTTPException(status_code=400, detail='Send a JSON list of items, {"items": [...]}, or NDJSON')
+    return data
+
+
+def _batch_item(index: int, raw: Any) -> _BatchItem:
+    if isinstance(raw, ValueError):
+        raise raw
+    if not isinstance(raw, dict):
+        raise ValueError("Item must be an object like {\"dob\": \"29-10-2001\"}")
+    dob = raw.get("dob")
+    if not isinstance(dob, str):
+        raise ValueError("dob is required (DD-MM-YYYY or YYYY-MM-DD)")
+    types = raw.get("report_types") or ["single"]
+    if isinstance(types, str):
+        types = [t.strip() for t in types.split(",") if t.strip()]
+    if not isinstance(types, list) or not all(isinstance(t, str) for t in types):
+        raise ValueError("report_types must be a list of names")
+    year = raw.get("year")
+    if year is not None:
+        try:
+            if isinstance(year, (bool, float)):
+                raise ValueError
+            year = int(year)
+        except (TypeError, ValueError):
+            raise ValueError("year must be an integer") from None
+    gender = raw.get("gender")
+    if gender is not None and not isinstance(gender, str):
+        raise ValueError("gender must be a string")
+    return _BatchItem(index, dob, dob_key(dob), year, gender, tuple(dict.fromkeys(types)))
+
+
+def _batch_report(kind: str, item: _BatchItem, ctx: TriangleContext, templates: Dict[Tuple[Any, ...], EchoTemplate]) -> bytes:
+    if kind not in BATCH_TYPES:
+        raise ValueError(f"Unknown report type; choose from {', '.join(BATCH_TYPES)}")
+    if kind in _YEAR_TYPES and item.year is None:
+        raise ValueError("year is required")
+    args = (item.dob,) + ((item.year,) if kind in _YEAR_TYPES else ()) + ((item.gender,) if kind in _GENDER_TYPES else ())
+    key = _canonical_key(kind, *args)
+    template = templates.get((kind, key))
+    if template is None:
+        template = templates[(kind, key)] = _build_template(kind, key, ctx)
+    return template.render(_DETERMINISTIC[kind].echo(*args))
+
+
+def _batch_lines(raw_items: List[Any]) -> Iterator[bytes]:
+    items: List[_BatchItem] = []
+    for i, raw in enumerate(raw_items):
+        try:
+            items.append(_batch_item(i, raw))
+        except ValueError as e:
+            yield dumps({"index": i, "dob": raw.get("dob") if isinstance(raw, dict) else None, "error": str(e)}) + b"\n"
+    keys = sorted({item.key for item in items})
+    bases = dict(zip(keys, abcd_triangles([int(k) for k in keys])))
+    items.sort(key=attrgetter("key"))
+    for key, group in groupby(items, key=attrgetter("key")):
+        ctx = TriangleContext(dob_for_key(key), base=bases[key])
+        templates: Dict[Tuple[Any, ...], EchoTemplate] = {}
+        for item in group:
+            reports, errors = [], {}
+            for kind in item.types:
+                try:
+                    reports.append(dumps(kind) + b":" + _batch_report(kind, item, ctx, templates))
+                except ValueError as e:
+                    errors[kind] = str(e)
+            line = dumps({"index": item.index, "dob": item.dob})[:-1] + b',"reports":{' + b",".join(reports) + b"}"
+            if errors:
+                line += b',"errors":' + dumps(errors)
+            yield line + b"}\n"
+
+
+@router.post("/batch")
+async def batch_reports(request: Request):
+    """
+    Reports for many DOBs in one request, streamed as NDJSON.
+
+    Body: a JSON list (or {"items": [...]}), or NDJSON with Content-Type
+    application/x-ndjson, of items {dob, gender?, year?, report_types?}.
+    report_types defaults to ["single"]; see BATCH_TYPES (yearly/monthly and
+    health_monthly/health_yearly need `year`).
+
+    One line per item:
+      {"index": 3, "dob": "...", "reports": {"single": {...}}, "errors": {"yearly": "year is required"}}
+      {"index": 4, "dob": "31-02-2001", "error": "Use DD-MM-YYYY or YYYY-MM-DD"}
+    Lines are grouped by DOB digits, not in request order; use "index".
+    """
+    ensure_allowed("single")
+    items = _batch_body(await request.body(), request.headers.get("content-type", ""))
+    if len(items) > MAX_BATCH_ITEMS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_ITEMS} items per batch")
+    return StreamingResponse(_batch_lines(items), media_type="application/x-ndjson")
+
+
+# ── Rendering: off the event loop ────────────────────────────────
+# Everything above is pure math served from caches and runs inline. Images and
+# PDFs are rendered on a bounded worker pool (numerology.render_pool) so a
+# render never blocks the other requests on this worker, and only once per
+# distinct image (numerology.image_cache). The images carry no
+# captions, so the *_title parameters are accepted for compatibility only.
+
+async def _image(layout: str, fmt: str, triangles: List[Dict[str, Any]]) -> Response:
+    """From the image cache (numerology.image_cache), else rendered on the render pool and cached."""
+    key = render_service.image_key(layout, triangles, fmt)
+    body = IMAGE_CACHE.get(key)
+    if body is None:
+        try:
+            body = await RENDER_POOL.run(render_service.render_image, layout, triangles, fmt, job=f"{layout}.{fmt}")
+        except (PoolBusy, BrokenExecutor) as e:   # full, or a worker died (the pool restarts it)
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+        IMAGE_CACHE.put(key, body)
+    return Response(content=body, media_type=render_service.MEDIA_TYPES[fmt])
+
+
+def _svg(build: Callable[..., bytes], *args: Any) -> Response:
+    """SVG from the template renderer (numerology.svg_render): microseconds, so inline."""
+    return Response(content=build(*args), media_type=SVG_MEDIA_TYPE)
+
+
+@router.get("/pools.json")
+async def pools_json():
+    """Render/PDF pool load: in-flight and queued jobs, saturation, rejections, wait/run times per job."""
+    return json_response(pool_stats())
+
+
+@router.get("/image-cache.json")
+async def image_cache_json():
+    """Image cache counters (this worker): memory/disk hits, misses, stores, evictions."""
+    return json_response(IMAGE_CACHE.stats())
+
+
 @router.get("/mystical-triangle.json")
-async def triangle_json(dob: str = Query(..., description="Date of birth DD-MM-YYYY or YYYY-MM-DD")):
+async def triangle_json(request: Request, dob: str = Query(..., description="Date of birth DD-MM-YYYY or YYYY-MM-DD")):
     ensure_allowed("single") 
-    return mystical_triangle_values_image(dob)
+    return _cached(request, "values", dob)
 
 @router.get("/mystical-triangle.report.json")
-async def triangle_report_json(dob: str = Query(..., description="Date of birth DD-MM-YYYY or YYYY-MM-DD")):
+async def triangle_report_json(request: Request, dob: str = Query(..., description="Date of birth DD-MM-YYYY or YYYY-MM-DD")):
     ensure_allowed("single") 
-    return mystical_triangle_report(dob)
+    return _cached(request, "single", dob)
 
 @router.get("/mystical-triangle.png")
-async def triangle_png(dob: str = Query(..., description="Date of birth DD-MM-YYYY or YYYY-MM-DD")):
+async def triangle_png(request: Request, dob: str = Query(..., description="Date of birth DD-MM-YYYY or YYYY-MM-DD")):
     ensure_allowed("single")
-    img_bytes = build_triangle_png_bytes(dob)
-    return Response(content=img_bytes, media_type="image/png")
+    return await conditional_async(request, lambda: _image("single", "png", render_service.single_triangles(dob)))
 
 @router.get("/mystical-triangle.pdf")
-async def triangle_pdf(dob: str = Query(..., description="Date of birth DD-MM-YYYY or YYYY-MM-DD")):
+async def triangle_pdf(request: Request, dob: str = Query(..., description="Date of birth DD-MM-YYYY or YYYY-MM-DD")):
+    ensure_allowed("single")
+    return await conditional_async(
+        request, lambda: _image("single", "pdf", render_service.single_triangles(dob))
+    )
+
+@router.get("/mystical-triangle.svg")
+async def triangle_svg(request: Request, dob: str = Query(..., description="Date of birth DD-MM-YYYY or YYYY-MM-DD")):
     ensure_allowed("single")
-    pdf_bytes = build_triangle_pdf_bytes(dob)
-    return Response(content=pdf_bytes, media_type="application/pdf")
+    return conditional(request, lambda: _svg(render_service.triangle_svg, dob))
 
 @router.get("/year-only-triangle.json")
-async def year_only_triangle_json(year: int):
+async def year_only_triangle_json(request: Request, year: int):
     ensure_allowed("yearly")
-    return year_only_triangle(year)
+    return _cached(request, "year_only", year)
 
 @router.get("/yearly-combined-triangle.json")
-async def yearly_combined_triangle_json(dob: str, year: int):
+async def yearly_combined_triangle_json(request: Request, dob: str, year: int):
     ensure_allowed("yearly") 
-    return yearly_combined_triangle(dob, year)
+    return _cached(request, "yearly_combined", dob, year)
 
 # ────────────────────────────────────────────────────────────────
 # Triptych (PNG + JSON)
 # ────────────────────────────────────────────────────────────────
 @router.get("/mystical-triangle-triptych.png")
 async def triangle_triptych_png(
+    request: Request,
     left: str = Query(..., description="Left person's DOB (DD-MM-YYYY or YYYY-MM-DD)"),
     right: str = Query("today", description="Right person's DOB or 'today'"),
     left_title: str = Query("Left", description="Title for the left triangle"),
@@ -93,17 +411,32 @@ async def triangle_triptych_png(
     combined_title: str = Query("Combined", description="Title for the combined triangle"),
 ):
     ensure_allowed("single")
-    fig, vals = plot_three_triangles(left, right, left_title, right_title, combined_title)
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=170, bbox_inches="tight")
-    return Response(content=buf.getvalue(), media_type="image/png")
+    return await conditional_async(
+        request,
+        lambda: _image("pair", "png", render_service.pair_triangles(left, right)),
+        day_relative=is_today(right),
+    )
+
+@router.get("/mystical-triangle-triptych.svg")
+async def triangle_triptych_svg(
+    request: Request,
+    left: str = Query(..., description="Left person's DOB (DD-MM-YYYY or YYYY-MM-DD)"),
+    right: str = Query("today", description="Right person's DOB or 'today'"),
+):
+    ensure_allowed("single")
+    return conditional(request, lambda: _svg(render_service.pair_svg, left, right), day_relative=is_today(right))
 
 @router.get("/mystical-triangle-triptych.json")
 async def triangle_triptych_json(
+    request: Request,
     left: str = Query(..., description="Left person's DOB (DD-MM-YYYY or YYYY-MM-DD)"),
     right: str = Query("today", description="Right person's DOB or 'today'"),
 ):
-    ensure_allowed("single") 
+    ensure_allowed("single")
+    return conditional(request, lambda: json_response(_triptych_values(left, right)), day_relative=is_today(right))
+
+
+def _triptych_values(left: str, right: str) -> Dict[str, Any]:
     # Left
     vals_left = mystical_triangle_values_image(left)
     left_reads = build_reads(vals_left)
@@ -135,6 +468,7 @@ async def triangle_triptych_json(
 
 @router.get("/mulank-bhagyank.profile.json")
 async def mulank_bhagyank_profile_json(
+    request: Request,
     dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
 ):
     """
@@ -152,27 +486,34 @@ async def mulank_bhagyank_profile_json(
     }
     """
     ensure_allowed("single")  # or "profession" if you later gate it separately
-    return mulank_bhagyank_profile(dob)
+    return _cached(request, "mulank_bhagyank", dob)
 
 
 # Triptych PNG
 @router.get("/yearly-triptych.png")
 async def yearly_triptych_png(
+    request: Request,
     dob: str,
     year: int,
     left_title: str = "DOB",
     right_title: str | None = None,
     combined_title: str = "Combined (Yearly)",
 ):
-    ensure_allowed("yearly") 
-    fig, _ = plot_yearly_triptych(dob, year, left_title, right_title, combined_title)
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=170, bbox_inches="tight")
-    return Response(content=buf.getvalue(), media_type="image/png")
+    ensure_allowed("yearly")
+    return await conditional_async(
+        request,
+        lambda: _image("combined", "png", render_service.yearly_triangles(dob, year)),
+    )
+
+@router.get("/yearly-triptych.svg")
+async def yearly_triptych_svg(request: Request, dob: str, year: int):
+    ensure_allowed("yearly")
+    return conditional(request, lambda: _svg(render_service.yearly_svg, dob, year))
 
 # ▼▼ ADDED: Monthly Triptych PNG
 @router.get("/monthly-triptych.png")
 async def monthly_triptych_png(
+    request: Request,
     dob: str,
     year: int,
     month: int,
@@ -180,25 +521,35 @@ async def monthly_triptych_png(
     right_title: str | None = None,
     combined_title: str = "Combined (Monthly)",
 ):
-    fig, _ = plot_monthly_triptych(dob, year, month, left_title, right_title, combined_title)
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=170, bbox_inches="tight")
-    return Response(content=buf.getvalue(), media_type="image/png")
+    return await conditional_async(
+        request,
+        lambda: _image("combined", "png", render_service.monthly_triangles(dob, year, month)),
+    )
+
+@router.get("/monthly-triptych.svg")
+async def monthly_triptych_svg(request: Request, dob: str, year: int, month: int):
+    return conditional(request, lambda: _svg(render_service.monthly_svg, dob, year, month))
 # ▲▲ ADDED
 
 # ▼▼ ADDED: Daily Triptych PNG
 @router.get("/daily-triptych.png")
 async def daily_triptych_png(
+    request: Request,
     dob: str,
     day: str = Query("today", description="DD-MM-YYYY or 'today'"),
     left_title: str = "DOB",
     right_title: str | None = None,
     combined_title: str = "Combined (Daily)",
 ):
-    fig, _ = plot_daily_triptych(dob, day, left_title, right_title, combined_title)
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=170, bbox_inches="tight")
-    return Response(content=buf.getvalue(), media_type="image/png")
+    return await conditional_async(
+        request,
+        lambda: _image("combined", "png", render_service.daily_triangles(dob, day)),
+        day_relative=is_today(day),
+    )
+
+@router.get("/daily-triptych.svg")
+async def daily_triptych_svg(request: Request, dob: str, day: str = Query("today", description="DD-MM-YYYY or 'today'")):
+    return conditional(request, lambda: _svg(render_service.daily_svg, dob, day), day_relative=is_today(day))
 # ▲▲ ADDED
 
 
@@ -206,75 +557,188 @@ async def daily_triptych_png(
 
 @router.get("/relationship-triangle.report.json")
 async def relationship_triangle_report_json(
+    request: Request,
     left: str = Query(..., description="Left person's DOB (DD-MM-YYYY or YYYY-MM-DD)"),
     right: str = Query(..., description="Right person's DOB (DD-MM-YYYY or YYYY-MM-DD)"),
 ):
     ensure_allowed("relationship")
-    return relationship_triangle_report(left, right)
+    return _cached(request, "relationship", left, right)
 
 
 # JSON report
 @router.get("/yearly-triangle.report.json")
 async def yearly_triangle_report_json(
+    request: Request,
     dob: str,
     year: int
 ):
     ensure_allowed("yearly")
-    return yearly_triangle_report(dob, year)
+    return _cached(request, "yearly", dob, year)
 
 
 
 @router.get("/monthly.report.json")
-async def monthly_report_json(dob: str, year: int):
+async def monthly_report_json(request: Request, dob: str, year: int):
     """
     Monthly prediction report (DOB ⊕ Year) with months mapped as per screenshot.
     """
-    return monthly_prediction_report(dob, year)
+    return _cached(request, "monthly", dob, year)
 
 
 
 
 @router.get("/features/daily-triangle.report.json")
 async def daily_triangle_report_json(
-    dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD")
+    request: Request,
+    dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
 ):
-    return daily_triangle_report(dob)
+    return _cached(request, "daily", dob, None, day_relative=True)
+
+
+@router.get("/features/daily-triangle.range.ndjson")
+async def daily_triangle_range_ndjson(
+    request: Request,
+    dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
+    start: str = Query(..., description="First day, DD-MM-YYYY or YYYY-MM-DD"),
+    end: str = Query(..., description="Last day (inclusive), DD-MM-YYYY or YYYY-MM-DD"),
+    fields: str | None = Query(None, description="Comma-separated subset of values,reads,core,time_slots,polarity,special_notes"),
+):
+    """
+    Combined daily panel for every day in [start, end], streamed as NDJSON
+    (one JSON object per line, in date order).
+    """
+    def _build() -> Response:
+        wanted = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        records = iter_daily_range(dob, start, end, fields=wanted)
+        # Pull the first record eagerly so bad input is a 400, not a broken stream.
+        try:
+            first = next(records, None)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        lines = (
+            dumps(rec) + b"\n"
+            for rec in (chain([first], records) if first is not None else ())
+        )
+        return StreamingResponse(lines, media_type="application/x-ndjson")
+
+    return conditional(request, _build)
+
+
+@router.get("/features/special-calendar.json")
+async def special_calendar_json(
+    request: Request,
+    dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
+    year: int = Query(..., description="Calendar year (e.g., 2025)"),
+):
+    """Daily special-signal tags for every day of the year (heatmap data)."""
+    try:
+        return _cached(request, "special_calendar", dob, year)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/features/best-days.json")
+async def best_days_json(
+    request: Request,
+    dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
+    start: str = Query(..., description="First day, DD-MM-YYYY or YYYY-MM-DD"),
+    end: str = Query(..., description="Last day (inclusive), DD-MM-YYYY or YYYY-MM-DD"),
+    cells: str | None = Query(None, description="Combined-cell constraints, e.g. G=1|9,P=6"),
+    exclude_tags: str | None = Query(None, description="Comma-separated tags to avoid, e.g. accident_risk,betrayal_risk"),
+    require_tags: str | None = Query(None, description="Comma-separated tags that must be present"),
+    top_k: int = Query(10, ge=1, le=366),
+):
+    """Top-k days in the window matching the combined-triangle constraints."""
+    def _tags(s: str | None) -> list[str]:
+        return [t.strip() for t in (s or "").split(",") if t.strip()]
+
+    def _build() -> Response:
+        try:
+            return json_response(best_days(
+                dob, start, end,
+                cells=parse_cell_constraints(cells),
+                exclude_tags=_tags(exclude_tags),
+                require_tags=_tags(require_tags),
+                top_k=top_k,
+            ))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return conditional(request, _build)
+
+
+@router.get("/reverse-index.json")
+async def reverse_index_json(
+    request: Request,
+    cells: str | None = Query(None, description="Cell values, e.g. G=1|9,P=6"),
+    reads: str | None = Query(None, description="Read codes, e.g. EF(CORE)=18"),
+    triples: str | None = Query(None, description="Triples, e.g. AEG=sandwich or DFG=111|same"),
+    tags: str | None = Query(None, description="Comma-separated SPECIAL_RULES tags"),
+    feature: str = Query("person", description="feature_type used for tags"),
+    start: str | None = Query(None, description="Expand to dates from (DD-MM-YYYY or YYYY-MM-DD)"),
+    end: str | None = Query(None, description="Expand to dates until (inclusive)"),
+    limit: int = Query(1000, ge=1, le=100_000, description="Max dates returned"),
+):
+    """Which ABCD inputs (and, with start/end, which dates) produce a triangle pattern."""
+    def _build() -> Response:
+        try:
+            keys = get_reverse_index().query(
+                cells=parse_criteria(cells),
+                reads=parse_criteria(reads),
+                triples=parse_criteria(triples),
+                tags=[t.strip() for t in (tags or "").split(",") if t.strip()],
+                feature=feature,
+            )
+            out = {"count": len(keys), "abcd": [f"{k:04d}" for k in sorted(keys)]}
+            if start and end:
+                dates = expand_abcd_dates(keys, start, end)
+                out["date_count"] = int(dates.size)
+                out["dates"] = [d.strftime("%d-%m-%Y") for d in dates[:limit].tolist()]
+            return json_response(out)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return conditional(request, _build)
 
 
 
 @router.get("/health-triangle.report.json")
 async def health_triangle_report_json(
+    request: Request,
     dob: str = Query(..., description="DD-MM-YYYY or YYYY-MM-DD"),
     gender: str | None = Query(None, description="optional: male/female"),
 ):
-    return health_triangle_report(dob, gender=gender)
+    return _cached(request, "health", dob, gender)
 
 
 @router.get("/health/daily.report.json")
 async def health_daily_report_json(
+    request: Request,
     dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
     day: str | None = Query(None, description="DD-MM-YYYY or YYYY-MM-DD; omit for 'today'"),
     gender: str | None = Query(None, description="optional: male/female"),
 ):
-    return health_daily_report(dob, day=day, gender=gender)
+    return _cached(request, "health_daily", dob, day, gender, day_relative=is_today(day))
 
 
 @router.get("/health/monthly.report.json")
 async def health_monthly_report_json(
+    request: Request,
     dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
     year: int = Query(..., description="Target year (e.g., 2025)"),
     gender: str | None = Query(None, description="optional: male/female"),
 ):
-    return health_monthly_report(dob, year, gender=gender)
+    return _cached(request, "health_monthly", dob, year, gender)
 
 
 @router.get("/health/yearly.report.json")
 async def health_yearly_report_json(
+    request: Request,
     dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
     year: int = Query(..., description="Target year (e.g., 2025)"),
     gender: str | None = Query(None, description="optional: male/female"),
 ):
-    return health_yearly_report(dob, year, gender=gender)
+    return _cached(request, "health_yearly", dob, year, gender)
 
 
 
@@ -285,13 +749,15 @@ async def health_yearly_report_json(
 
 @router.get("/profession.report.json")
 async def profession_report_json(
-    dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD")
+    request: Request,
+    dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
 ):
     ensure_allowed("single")   # or "profession" if you create a new feature gate
-    return profession_report(dob)
+    return _cached(request, "profession", dob)
 
 @router.get("/profile-bulletins.json")
 async def profile_bulletins_json(
+    request: Request,
     dob: str = Query(..., description="DOB in DD-MM-YYYY or YYYY-MM-DD"),
     gender: str | None = Query(None, description="male/female/other (optional)"),
     year: int | None = Query(None, description="Target year (optional)"),
@@ -303,6 +769,10 @@ async def profile_bulletins_json(
     Personality + Profession + Health + Time cycles.
     Uses existing report logic; only aggregates.
     """
-    return build_profile_bulletins(dob=dob, gender=gender, year=year, month=month, day=day)
+    return conditional(
+        request,
+        lambda: json_response(build_profile_bulletins(dob=dob, gender=gender, year=year, month=month, day=day)),
+        day_relative=is_today(day) or year is None or month is None,
+    )
 
 
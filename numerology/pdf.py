@@ -1,8 +1,11 @@
 # numerology/pdf.py
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor, wait
 from io import BytesIO
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from datetime import date
+import functools
+import logging
 import os  # ← added
 
 from reportlab.lib import colors
@@ -21,35 +24,36 @@ from AI.ai import (
     generate_health_daily_interpretation,
     generate_health_monthly_interpretation,
     generate_health_yearly_interpretation,
+    generate_profession_interpretation,
     get_last_used,
 )
+from AI.settings import settings as ai_settings
 from AI.swot import generate_swot_from_interpretation
 
-# Triangle image + structured single-person report
-from numerology.viz import (
-    build_triangle_png_bytes,
-    plot_three_triangles,
-    plot_yearly_triptych,
-    plot_monthly_triptych,   # ← use viz monthly (no combined drawing)
-    plot_daily_triptych,     # ← use viz daily   (no combined drawing)
+# Triangle drawings + structured single-person report
+from numerology.pdf_triangle import triangle_drawing
+from numerology.triangle_layout import (
+    daily_triangles,
+    monthly_triangles,
+    pair_triangles,
+    single_triangles,
+    yearly_triangles,
 )
 from numerology.features.single_person_report import mystical_triangle_report
 
 # NEW: Mulank/Bhagyank + pair rating (same as UI API)
 from numerology.mulank_bhagyank import mulank_bhagyank_profile
+from numerology.canonical import day_key, dob_key, year_key
+from numerology.context import TriangleContext, ensure_context
 
 # NEW: Profession / career mapping (same as /numerology/profession.report.json)
 from numerology.features.profession_report import profession_report
 
-# Optional plotting helpers (used for triptychs)
-import io
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-
 from reportlab.pdfgen.canvas import Canvas
 from reportlab.lib.utils import ImageReader
 
+logger = logging.getLogger(__name__)
+
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 LOGO_PATH = os.path.join(ASSETS_DIR, "asb_logo.jpg")   # updated to your logo file
@@ -59,6 +63,10 @@ COVER_IMAGE_PATH = os.path.join(ASSETS_DIR, "cover_page.png")
 REMEDIES_IMAGE_PATH = os.path.join(ASSETS_DIR, "remedies_image.png")
 INLINE_HALF_IMAGE_PATH = os.path.join(ASSETS_DIR, "inline_half.png")
 
+# Triangles: "vector" draws them on the PDF canvas (numerology.pdf_triangle);
+# "png" embeds the rendered images instead, as before.
+PDF_TRIANGLES = (os.getenv("NUMEROLOGY_PDF_TRIANGLES") or "vector").strip().lower()
+
 
 def _brand_page(canvas: Canvas, doc):
     """
@@ -186,13 +194,6 @@ def _normalize_interpretation(result: Any) -> str:
     return str(result).strip()
 
 
-def _fig_to_png_bytes(fig) -> bytes:
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=170, bbox_inches="tight")
-    plt.close(fig)
-    return buf.getvalue()
-
-
 def _scaled_image_from_bytes(png_bytes: bytes, max_height_ratio: float = 0.6) -> Image:
     """
     Return a ReportLab Image flowable scaled to the SAME bounding box
@@ -204,6 +205,22 @@ def _scaled_image_from_bytes(png_bytes: bytes, max_height_ratio: float = 0.6) ->
     img._restrictSize(max_w, max_h)
     return img
 
+
+def _triangle_flowable(layout: str, triangles):
+    """
+    Triangle(s) in the same box as _scaled_image_from_bytes: a vector Drawing,
+    or the PNG (numerology.render_service) if PDF_TRIANGLES is "png" or the
+    drawing fails.
+    """
+    max_w = A4[0] - (36 + 36)
+    if PDF_TRIANGLES != "png":
+        try:
+            return triangle_drawing(triangles, max_w, max_w * 0.65)
+        except Exception:
+            pass
+    from numerology.render_service import cached_image   # matplotlib only when needed
+    return _scaled_image_from_bytes(cached_image(layout, triangles))
+
 def _scaled_image_from_path(img_path: str, *, max_height_ratio: float = 0.5) -> Image | None:
     """Scaled Image flowable from a local path.
 
@@ -248,8 +265,27 @@ def _format_for_pdf(text: str) -> str:
     return "<br/>".join(out)
 
 
+def _generated(memo: TriangleContext, mode: str, inputs: tuple, fn, /, *args, **kwargs) -> str | None:
+    """_safe_call(fn, ...) once per report: memoized on the context by mode + canonical inputs."""
+    return memo.generated(mode, inputs, lambda: _safe_call(fn, *args, **kwargs))
+
+
+def _canonical(key_fn, value) -> str:
+    """Canonical key of an input, or the input itself if it does not parse (its section then fails alone)."""
+    try:
+        return key_fn(value)
+    except Exception:
+        return str(value)
+
+
+def _get_personality_text(dob: str, *, ctx: TriangleContext | None = None) -> str | None:
+    """The Personality narrative (generate_interpretation), shared with the SWOT."""
+    ctx = ensure_context(dob, ctx)
+    return _generated(ctx, "person", (), generate_interpretation, dob, ctx=ctx)
+
+
 # NEW: AI SWOT helper (same source as UI /ai/swot.ai.json)
-def _get_swot_for_pdf(dob: str) -> Dict[str, Any] | None:
+def _get_swot_for_pdf(dob: str, *, ctx: TriangleContext | None = None) -> Dict[str, Any] | None:
     """
     Build SWOT using the SAME logic as /ai/swot.ai.json:
       1) Use generate_interpretation(dob) to get plain text.
@@ -257,16 +293,19 @@ def _get_swot_for_pdf(dob: str) -> Dict[str, Any] | None:
     Returns dict like:
       { "Strengths": [...], "Weaknesses": [...], ... }
     or None if anything fails.
+
+    Both steps are memoized on ctx, so the Personality section's text is
+    reused and the SWOT is classified once per report.
     """
     try:
+        ctx = ensure_context(dob, ctx)
         # 1) get the same interpretation as the Personality section
-        raw = generate_interpretation(dob)
-        text = _normalize_interpretation(raw)
+        text = _get_personality_text(dob, ctx=ctx)
         if not isinstance(text, str) or not text.strip():
             return None
 
         # 2) run SWOT classifier (LLM or heuristic, depending on settings)
-        swot = generate_swot_from_interpretation(text)
+        swot = ctx.generated("swot", (), lambda: generate_swot_from_interpretation(text))
         if isinstance(swot, dict):
             return swot
         return None
@@ -275,29 +314,10 @@ def _get_swot_for_pdf(dob: str) -> Dict[str, Any] | None:
 
 
 # NEW: AI Profession helper (to mirror /ai/profession.ai.json)
-def _get_profession_ai_text(dob: str) -> str | None:
-    """
-    Try to pull AI profession interpretation from AI.ai.
-    Looks for one of:
-      • generate_profession_interpretation
-      • generate_profession
-      • generate_profession_ai
-    Returns normalized string or None.
-    """
-    try:
-        import AI.ai as ai_module
-        for cand in (
-            "generate_profession_interpretation",
-            "generate_profession",
-            "generate_profession_ai",
-        ):
-            fn = getattr(ai_module, cand, None)
-            if callable(fn):
-                raw = fn(dob)
-                return _normalize_interpretation(raw)
-    except Exception:
-        return None
-    return None
+def _get_profession_ai_text(dob: str, *, ctx: TriangleContext | None = None) -> str | None:
+    """The Profession narrative (generate_profession_interpretation), as normalized text or None."""
+    ctx = ensure_context(dob, ctx)
+    return _generated(ctx, "profession", (), generate_profession_interpretation, dob, ctx=ctx)
 
 
 # ───────────────────── Single-person Report PDF (kept for tests) ─────────────────────
@@ -309,8 +329,9 @@ def build_ai_report_pdf(dob: str) -> bytes:
 
     • Works with the configured generator; tests will monkeypatch to "mock".
     """
-    report = mystical_triangle_report(dob)
-    raw_interp = generate_interpretation(dob)
+    ctx = TriangleContext(dob)
+    report = mystical_triangle_report(dob, ctx=ctx)
+    raw_interp = generate_interpretation(dob, ctx=ctx)
     interpretation = _normalize_interpretation(raw_interp)
 
     buf = BytesIO()
@@ -379,10 +400,7 @@ def build_ai_report_pdf(dob: str) -> bytes:
     story.append(Paragraph(f"DOB: <b>{dob}</b>", subheading))
 
     # Triangle image
-    img_bytes = build_triangle_png_bytes(dob)
-    img = Image(BytesIO(img_bytes))
-    max_w = A4[0] - (36 + 36)
-    img._restrictSize(max_w, max_w * 0.65)
+    img = _triangle_flowable("single", single_triangles(dob))
     story += [Spacer(1, 10), img, Spacer(1, 10)]
 
     # Interpretation
@@ -423,6 +441,35 @@ def _safe_call(fn, *args, **kwargs) -> str | None:
         return None
 
 
+def _fan_out(jobs: Dict[str, Callable[[], Any]], *, workers: int, deadline: float) -> Dict[str, Any]:
+    """
+    Run the section generators concurrently and return {name: result}.
+
+    A job that raises, or is still running after `deadline` seconds, yields
+    None (its section is skipped, as when a generator fails). Late jobs are
+    abandoned, not interrupted: their threads finish in the background,
+    bounded by the provider timeouts.
+    """
+    results: Dict[str, Any] = dict.fromkeys(jobs)
+    if not jobs:
+        return results
+    pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs))), thread_name_prefix="pdf-section")
+    try:
+        futures = {pool.submit(job): name for name, job in jobs.items()}
+        done, late = wait(futures, timeout=deadline)
+        for fut in done:
+            try:
+                results[futures[fut]] = fut.result()
+            except Exception:
+                logger.exception("Master PDF: section %r failed", futures[fut])
+        if late:
+            logger.warning("Master PDF: sections missed the %ss deadline: %s",
+                           deadline, ", ".join(sorted(futures[f] for f in late)))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
 def _add_section(story, title_style, body_style, heading: str, text: str | None):
     if not text:
         return
@@ -453,13 +500,20 @@ def build_ai_master_report_pdf(
     Notes:
       • Uses your configured generator/model (see settings).
       • Gracefully skips sections if a generator call or image build fails.
+      • The LLM sections are generated in parallel (AI_REPORT_WORKERS threads,
+        each provider capped by AI/limits.py); sections not done within
+        AI_REPORT_DEADLINE seconds are skipped.
+      • One TriangleContext is shared by every section, so the DOB triangle and
+        its drivers/reads/specials are computed once for the whole document,
+        and so is each narrative and the SWOT (TriangleContext.generated).
     """
+    ctx = TriangleContext(dob)
 
     # NEW: Mulank/Bhagyank profile from the same source as UI
     mulank = bhagyank = None
     pair_rating = pair_meaning = None
     try:
-        mb_profile = mulank_bhagyank_profile(dob)
+        mb_profile = mulank_bhagyank_profile(dob, ctx=ctx)
         if isinstance(mb_profile, dict):
             mulank = mb_profile.get("mulank")
             bhagyank = mb_profile.get("bhagyank")
@@ -472,13 +526,10 @@ def build_ai_master_report_pdf(
     # NEW: Profession report (same logic as /numerology/profession.report.json)
     profession_data: Dict[str, Any] | None = None
     try:
-        profession_data = profession_report(dob)
+        profession_data = profession_report(dob, ctx=ctx)
     except Exception:
         profession_data = None
 
-    # NEW: SWOT from AI (if available)
-    swot_dict: Dict[str, Any] | None = _get_swot_for_pdf(dob)
-
     if year is None:
         year = date.today().year
     if not day or str(day).strip().lower() == "today":
@@ -492,16 +543,44 @@ def build_ai_master_report_pdf(
     if report_date is None:
         report_date = date.today().strftime("%d-%m-%Y")
 
-    # Collect texts
-    single_text         = _safe_call(generate_interpretation, dob)
-    daily_text          = _safe_call(generate_daily_interpretation, dob, day=day)
-    monthly_text        = _safe_call(generate_monthly_interpretation, dob, year, month=month)
-    yearly_text         = _safe_call(generate_yearly_interpretation, dob, year)
-    health_text         = _safe_call(generate_health_interpretation, dob, gender=gender)
-    health_daily_text   = _safe_call(generate_health_daily_interpretation, dob, day=day, gender=gender)
-    health_monthly_text = _safe_call(generate_health_monthly_interpretation, dob, year, gender=gender)
-    health_yearly_text  = _safe_call(generate_health_yearly_interpretation, dob, year, gender=gender)
-    relationship_text   = _safe_call(generate_relationship_interpretation, dob, partner_dob) if partner_dob else None
+    # Collect texts: every LLM call at once, so the wait is the slowest call, not their sum
+    # (each memoized on ctx by mode + canonical inputs, so none is generated twice)
+    call = functools.partial
+    d, y, g = _canonical(day_key, day), _canonical(year_key, year), (gender or "").strip().lower()
+    jobs: Dict[str, Callable[[], Any]] = {
+        "personality":    call(_get_personality_text, dob, ctx=ctx),
+        "swot":           call(_get_swot_for_pdf, dob, ctx=ctx),   # SWOT of the personality text
+        "daily":          call(_generated, ctx, "daily", (d,), generate_daily_interpretation, dob, day=day, ctx=ctx),
+        "monthly":        call(_generated, ctx, "monthly", (y, month), generate_monthly_interpretation,
+                               dob, year, month=month, ctx=ctx),
+        "yearly":         call(_generated, ctx, "yearly", (y,), generate_yearly_interpretation, dob, year, ctx=ctx),
+        "health":         call(_generated, ctx, "health", (g,), generate_health_interpretation,
+                               dob, gender=gender, ctx=ctx),
+        "health_daily":   call(_generated, ctx, "health_daily", (d, g), generate_health_daily_interpretation,
+                               dob, day=day, gender=gender, ctx=ctx),
+        "health_monthly": call(_generated, ctx, "health_monthly", (y, g), generate_health_monthly_interpretation,
+                               dob, year, gender=gender, ctx=ctx),
+        "health_yearly":  call(_generated, ctx, "health_yearly", (y, g), generate_health_yearly_interpretation,
+                               dob, year, gender=gender, ctx=ctx),
+    }
+    if partner_dob:
+        jobs["relationship"] = call(_generated, ctx, "relationship", (_canonical(dob_key, partner_dob),),
+                                    generate_relationship_interpretation, dob, partner_dob)
+    if profession_data:
+        jobs["profession"] = call(_get_profession_ai_text, dob, ctx=ctx)
+    texts = _fan_out(jobs, workers=ai_settings.report_workers, deadline=ai_settings.report_deadline_seconds)
+
+    single_text         = texts["personality"]
+    derived_swot        = texts["swot"]
+    daily_text          = texts["daily"]
+    monthly_text        = texts["monthly"]
+    yearly_text         = texts["yearly"]
+    health_text         = texts["health"]
+    health_daily_text   = texts["health_daily"]
+    health_monthly_text = texts["health_monthly"]
+    health_yearly_text  = texts["health_yearly"]
+    relationship_text   = texts.get("relationship")
+    ai_prof_text        = texts.get("profession")
 
     # Build PDF
     buf = BytesIO()
@@ -670,10 +749,7 @@ def build_ai_master_report_pdf(
     # ───────────── Base triangle image ─────────────
     if include_images:
         try:
-            img_bytes = build_triangle_png_bytes(dob)
-            img = Image(BytesIO(img_bytes))
-            max_w = A4[0] - (36 + 36)
-            img._restrictSize(max_w, max_w * 0.65)
+            img = _triangle_flowable("single", single_triangles(dob))
             story += [Spacer(1, 10), img, Spacer(1, 10)]
         except Exception:
             pass
@@ -682,14 +758,7 @@ def build_ai_master_report_pdf(
     _add_section(story, h2, body, "Personality Traits", single_text)
     story.append(Spacer(1, 6))
 
-    # SWOT: Use already generated single_text to derive SWOT (save one AI call)
-    derived_swot = None
-    if single_text:
-        try:
-            derived_swot = generate_swot_from_interpretation(single_text)
-        except Exception:
-            pass
-
+    # SWOT: derived from single_text (see _get_swot_for_pdf)
     if isinstance(derived_swot, dict) and derived_swot:
         story.append(Paragraph("SWOT Analysis", h2))
         for key in ("Strengths", "Weaknesses", "Opportunities", "Threats"):
@@ -776,7 +845,6 @@ def build_ai_master_report_pdf(
             story.append(Paragraph(f"Suggested domains & roles:{prof_lines}", body))
 
         # ✅ AI Profession interpretation (same spirit as /ai/profession.ai.json)
-        ai_prof_text = _get_profession_ai_text(dob)
         if ai_prof_text:
             story.append(Spacer(1, 6))
             story.append(Paragraph("Profession Interpretation", h2))
@@ -790,9 +858,7 @@ def build_ai_master_report_pdf(
         story.append(Paragraph(f"Time Cycles — Daily (for {day_label})", h2))
         if include_images:
             try:
-                d_fig, _d_vals = plot_daily_triptych(dob, day_label)
-                d_png = _fig_to_png_bytes(d_fig)
-                d_img = _scaled_image_from_bytes(d_png)
+                d_img = _triangle_flowable("combined", daily_triangles(dob, day_label))
                 story += [Spacer(1, 6), d_img, Spacer(1, 8)]
             except Exception:
                 pass
@@ -806,9 +872,7 @@ def build_ai_master_report_pdf(
         story.append(Paragraph(f"Time Cycles — Monthly ({month_name} {year})", h2))
         if include_images:
             try:
-                m_fig, _m_vals = plot_monthly_triptych(dob, year, month)
-                m_png = _fig_to_png_bytes(m_fig)
-                m_img = _scaled_image_from_bytes(m_png)
+                m_img = _triangle_flowable("combined", monthly_triangles(dob, year, month))
                 story += [Spacer(1, 6), m_img, Spacer(1, 8)]
             except Exception:
                 pass
@@ -821,9 +885,7 @@ def build_ai_master_report_pdf(
         story.append(Paragraph(f"Time Cycles — Yearly ({year})", h2))
         if include_images:
             try:
-                y_fig, _y_vals = plot_yearly_triptych(dob, year)
-                y_png = _fig_to_png_bytes(y_fig)
-                y_img = _scaled_image_from_bytes(y_png)
+                y_img = _triangle_flowable("combined", yearly_triangles(dob, year))
                 story += [Spacer(1, 6), y_img, Spacer(1, 8)]
             except Exception:
                 pass
@@ -850,15 +912,7 @@ def build_ai_master_report_pdf(
         )
         if include_images:
             try:
-                rel_fig, _rels = plot_three_triangles(
-                    left_dob=dob,
-                    right_dob_or_today=partner_dob,
-                    left_title="Left",
-                    right_title="Right",
-                    combined_title="Combined (Relationship)",
-                )
-                rel_png = _fig_to_png_bytes(rel_fig)
-                img = _scaled_image_from_bytes(rel_png)
+                img = _triangle_flowable("pair", pair_triangles(dob, partner_dob))
                 story += [Spacer(1, 6), img, Spacer(1, 8)]
             except Exception:
                 pass
@@ -1,9 +1,14 @@
 from __future__ import annotations
 from typing import Dict
 
+from numerology.core import Triangle
+
 # ── Reads (Excel-style concatenations, no reduction) ──────────────────────────
 def build_reads(vals: Dict[str, Dict[str, int]]) -> Dict[str, int]:
-    v = {**vals["inputs"], **vals["layer1"], **vals["second_layer"], **vals["third_layer"]}
+    if isinstance(vals, Triangle):
+        v = vals.flat
+    else:
+        v = {**vals["inputs"], **vals["layer1"], **vals["second_layer"], **vals["third_layer"]}
     def cat(a: str, b: str) -> int:
         return int(f"{v[a]}{v[b]}")
     return {
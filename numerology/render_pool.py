@@ -0,0 +1,233 @@
+# numerology/render_pool.py
+"""
+Execution model for CPU-heavy handler work.
+
+Pure-math handlers (triangle values, JSON reports, served from the caches)
+take microseconds to a few ms and run inline on the event loop. Rendering a
+matplotlib PNG/PDF or building a ReportLab PDF takes 50 ms to seconds; done
+inline in an `async def` handler it stalls every other request on the worker.
+That work is submitted to a bounded worker pool instead and awaited:
+
+    png = await RENDER_POOL.run(triangle_png, dob)
+
+Each pool has a fixed number of worker processes and admits at most
+`workers + queue` jobs at a time; further jobs are rejected at once with
+PoolBusy (the API answers 503 + Retry-After) rather than piling up. stats()
+reports in-flight and queued jobs, saturation (in-flight / limit), the
+queue-depth peak, rejections and recent wait/run times, overall and per job
+function (GET /numerology/pools.json).
+
+Pools (workers/queue from the environment, defaults in parentheses):
+  render  NUMEROLOGY_RENDER_WORKERS (2) / NUMEROLOGY_RENDER_QUEUE (32)
+          triangle PNG/PDF and triptych images; workers are long-lived and
+          build their figures once at start (numerology.render_service)
+  pdf     NUMEROLOGY_PDF_WORKERS (2) / NUMEROLOGY_PDF_QUEUE (8)
+          AI report PDFs (LLM calls + ReportLab), kept apart so slow reports
+          can't starve image requests
+
+NUMEROLOGY_POOL_MODE selects how jobs run: "process" (default; worker
+processes started lazily, from a forkserver where available), "thread"
+(one background thread per pool, for development) or "inline" (on the event
+loop, i.e. the old behaviour; for benchmarks). Job functions and their
+arguments must be picklable: module-level functions only.
+"""
+from __future__ import annotations
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from numerology import render_service
+
+MODES = ("process", "thread", "inline")
+_RECENT = 256   # wait/run samples kept per pool (and per job) for the percentiles
+
+
+class PoolBusy(RuntimeError):
+    """The pool already holds `workers + queue` jobs."""
+
+
+def _percentiles(ms: np.ndarray) -> Optional[Dict[str, float]]:
+    if not ms.size:
+        return None
+    return {"p50": round(float(np.percentile(ms, 50)), 1), "p95": round(float(np.percentile(ms, 95)), 1)}
+
+
+def _timed(fn: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[Any, float, float]:
+    """Runs in the worker: (result, wall-clock start, run seconds)."""
+    started = time.time()
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, started, time.perf_counter() - t0
+
+
+def _mp_context():
+    methods = multiprocessing.get_all_start_methods()
+    # Never fork a running server process (threads, open sockets); a forkserver
+    # forks from a clean single-threaded parent that has the renderers imported.
+    if "forkserver" in methods:
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(["numerology.render_service"])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+class WorkerPool:
+    """Bounded pool of render/PDF workers with queue-depth accounting."""
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        queue: int,
+        mode: str = "process",
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown pool mode '{mode}'; use one of {', '.join(MODES)}")
+        if workers < 1 or queue < 0:
+            raise ValueError("A pool needs workers >= 1 and queue >= 0")
+        self.name = name
+        self.workers = workers
+        self.queue = queue
+        self.mode = mode
+        self.initializer = initializer   # run once per worker process/thread (not inline)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0, "peak_queued": 0}
+        self._recent: Deque[Tuple[float, float]] = deque(maxlen=_RECENT)
+        self._jobs: Dict[str, Tuple[int, Deque[float]]] = {}   # job name -> (completed, recent run s)
+
+    @property
+    def limit(self) -> int:
+        return self.workers + self.queue
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.mode == "process":
+                    self._executor = ProcessPoolExecutor(
+                        self.workers, mp_context=_mp_context(), initializer=self.initializer
+                    )
+                else:
+                    # pyplot is not thread-safe: one thread renders at a time
+                    self._executor = ThreadPoolExecutor(
+                        1, thread_name_prefix=f"{self.name}-pool", initializer=self.initializer
+                    )
+            return self._executor
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._in_flight >= self.limit:
+                self._counts["rejected"] += 1
+                raise PoolBusy(f"{self.name} pool is full ({self._in_flight} jobs)")
+            self._in_flight += 1
+            self._counts["submitted"] += 1
+            queued = max(0, self._in_flight - self.workers)
+            self._counts["peak_queued"] = max(self._counts["peak_queued"], queued)
+
+    def _release(self, job: str, ok: bool, submitted: float, timing: Optional[Tuple[float, float]]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._counts["completed" if ok else "failed"] += 1
+            if timing is not None:
+                started, run = timing
+                self._recent.append((max(0.0, started - submitted), run))
+                done, runs = self._jobs.get(job) or (0, deque(maxlen=_RECENT))
+                runs.append(run)
+                self._jobs[job] = (done + 1, runs)
+
+    def _on_done(self, job: str, future: Future, submitted: float) -> None:
+        # Runs when the worker is actually done, even if the awaiting request
+        # was cancelled meanwhile, so in_flight never undercounts busy workers.
+        exc = None if future.cancelled() else future.exception()
+        if isinstance(exc, BrokenExecutor):
+            with self._lock:   # a worker died; start a fresh executor next time
+                if self._executor is not None and getattr(self._executor, "_broken", False):
+                    self._executor = None
+        ok = not future.cancelled() and exc is None
+        self._release(job, ok, submitted, tuple(future.result()[1:]) if ok else None)
+
+    async def run(self, fn: Callable[..., Any], *args: Any, job: Optional[str] = None) -> Any:
+        """
+        Run fn(*args) on the pool and await its result (PoolBusy when full).
+        `job` names it in stats() (default: the function's name).
+        """
+        self._admit()
+        job = job or getattr(fn, "__name__", "job")
+        submitted = time.time()
+        if self.mode == "inline":
+            try:
+                result, started, run = _timed(fn, args)
+            except BaseException:
+                self._release(job, False, submitted, None)
+                raise
+            self._release(job, True, submitted, (started, run))
+            return result
+        try:
+            future = self._get_executor().submit(_timed, fn, args)
+        except BaseException:
+            self._release(job, False, submitted, None)
+            raise
+        future.add_done_callback(lambda f: self._on_done(job, f, submitted))
+        result, _, _ = await asyncio.wrap_future(future)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = self._in_flight
+            counts = dict(self._counts)
+            recent = np.array(self._recent) * 1000 if self._recent else np.zeros((0, 2))
+            jobs = {name: (done, np.array(runs) * 1000) for name, (done, runs) in sorted(self._jobs.items())}
+        out: Dict[str, Any] = {
+            "mode": self.mode,
+            "workers": self.workers,
+            "queue_limit": self.queue,
+            "in_flight": in_flight,
+            "running": min(in_flight, self.workers),
+            "queued": max(0, in_flight - self.workers),
+            "saturation": round(in_flight / self.limit, 2),
+            **counts,
+            "wait_ms": _percentiles(recent[:, 0]),
+            "run_ms": _percentiles(recent[:, 1]),
+            "jobs": {name: {"completed": done, "run_ms": _percentiles(runs)} for name, (done, runs) in jobs.items()},
+        }
+        return out
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _env_int(name: str, default: int) -> int:
+    value = (os.getenv(name) or "").strip()
+    return int(value) if value else default
+
+
+def _pool(name: str, workers: int, queue: int, initializer: Optional[Callable[[], None]] = None) -> WorkerPool:
+    prefix = f"NUMEROLOGY_{name.upper()}"
+    return WorkerPool(
+        name,
+        _env_int(f"{prefix}_WORKERS", workers),
+        _env_int(f"{prefix}_QUEUE", queue),
+        (os.getenv("NUMEROLOGY_POOL_MODE") or "process").strip().lower(),
+        initializer,
+    )
+
+
+RENDER_POOL = _pool("render", 2, 32, render_service.warm)
+PDF_POOL = _pool("pdf", 2, 8)
+POOLS: Dict[str, WorkerPool] = {p.name: p for p in (RENDER_POOL, PDF_POOL)}
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: pool.stats() for name, pool in POOLS.items()}
@@ -0,0 +1,251 @@
+# numerology/render_service.py
+"""
+Triangle images from long-lived, pre-drawn figures.
+
+Every image the API and the report PDFs draw is the inverted 4–2–1 triangle
+(viz._draw_inverted_421) in one of three layouts, and the only thing that
+differs between two requests is the seven numbers A..G in each triangle.
+Building the figure (axes, 11 lines, 14 texts, tight_layout) is most of a
+render, and a pyplot figure that is not closed stays alive for the life of
+the process. So each process builds one TriangleCanvas per layout, once, and
+a render only sets the value texts and saves:
+
+    single    one DOB triangle (mystical-triangle.png/.pdf, report PDFs)
+    pair      two triangles side by side (mystical-triangle-triptych.png)
+    combined  one combined triangle (yearly/monthly/daily triptych PNGs)
+
+Canvases are plain matplotlib Figures with an Agg canvas, never registered
+with pyplot, so there is nothing to close and the figure count cannot grow.
+A canvas renders one image at a time (a lock), since the render and PDF pools
+can share a process in thread/inline mode.
+
+render_image() is the render pool's job (numerology.render_pool): picklable
+arguments, bytes out, pixel-identical to the viz plot_* figures. PNGs come
+from NUMEROLOGY_PNG_RENDERER:
+  atlas       (default) composited from a glyph atlas built from the canvas
+              (numerology.glyph_atlas): same pixels, no plotting per request
+  matplotlib  the canvas itself
+  svg         rasterized from the SVG template (needs cairosvg)
+PDFs always come from the canvas. warm() builds the canvases and atlases
+when a worker starts.
+
+Images are cached by image_key() (numerology.image_cache); the *_png/*_pdf
+helpers, used by viz and the report PDFs, check the cache before rendering.
+
+The *_svg functions fill the SVG template (numerology.svg_render); they take
+microseconds and the API calls them inline.
+"""
+from __future__ import annotations
+import hashlib
+import io
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.text import Text
+
+from numerology import svg_render
+from numerology.glyph_atlas import GlyphAtlas
+from numerology.image_cache import IMAGE_CACHE
+from numerology.shared_tables import hash_sources
+from numerology.triangle_layout import (  # noqa: F401 - the triangle builders are part of this API
+    CELLS,
+    TriangleValues,
+    cell_values,
+    daily_triangles,
+    monthly_triangles,
+    pair_triangles,
+    single_triangles,
+    yearly_triangles,
+)
+from numerology.viz import _draw_inverted_421
+
+# layout: (figsize, triangles, tight_layout), as the viz plot_* functions draw them
+LAYOUTS = {
+    "single": ((5.5, 4.2), 1, False),
+    "pair": ((9, 4.2), 2, True),
+    "combined": ((4.8, 4.0), 1, True),
+}
+DPI = 170
+PNG_RENDERER = (os.getenv("NUMEROLOGY_PNG_RENDERER") or "atlas").strip().lower()
+MEDIA_TYPES = {"png": "image/png", "pdf": "application/pdf"}
+
+# Everything an image is drawn from; editing any of these changes every image key.
+_SOURCES = ("triangle_layout.py", "viz.py", "svg_render.py", "glyph_atlas.py", "render_service.py")
+
+
+class TriangleCanvas:
+    """One layout's figure, drawn once; render() only swaps the value texts."""
+
+    def __init__(self, layout: str):
+        figsize, n, tight = LAYOUTS[layout]
+        self.layout = layout
+        self.figure = Figure(figsize=figsize)
+        FigureCanvasAgg(self.figure)
+        axes = self.figure.subplots(1, n, squeeze=False)[0]
+        self._cells: List[Dict[str, Text]] = [_draw_inverted_421(ax, 0, 0, 0, 0, 0, 0, 0) for ax in axes]
+        if tight:
+            self.figure.tight_layout()
+        self._lock = threading.Lock()
+
+    @property
+    def slots(self) -> int:
+        """Value texts drawn: 7 per triangle."""
+        return 7 * len(self._cells)
+
+    def render(self, triangles: Sequence[TriangleValues], fmt: str = "png") -> bytes:
+        if len(triangles) != len(self._cells):
+            raise ValueError(f"'{self.layout}' draws {len(self._cells)} triangle(s), got {len(triangles)}")
+        return self.render_texts([str(v) for vals in triangles for v in cell_values(vals)], fmt)
+
+    def render_texts(self, texts: Sequence[str], fmt: str = "png") -> bytes:
+        """Render with the value slots (A..G per triangle, in order) set to `texts`."""
+        buf = io.BytesIO()
+        with self._lock:
+            for cells, chunk in zip(self._cells, (texts[i:i + 7] for i in range(0, len(texts), 7))):
+                for label, text in zip(CELLS, chunk):
+                    cells[label].set_text(text)
+            self.figure.savefig(buf, format=fmt, dpi=DPI, bbox_inches="tight")
+        return buf.getvalue()
+
+    def slot_pixels(self) -> Tuple[List[Tuple[float, float]], float]:
+        """
+        Approximate centre of each value slot in the saved image, in pixels
+        (x right, y down), and the pixels per data unit.
+        """
+        with self._lock:
+            renderer = self.figure.canvas.get_renderer()
+            bbox = self.figure.get_tightbbox(renderer).padded(matplotlib.rcParams["savefig.pad_inches"])
+            centres = []
+            for cells in self._cells:
+                for label in CELLS:
+                    x, y = cells[label].axes.transData.transform(cells[label].get_position()) / self.figure.dpi
+                    centres.append(((x - bbox.x0) * DPI, (bbox.y1 - y) * DPI))
+            ax = self._cells[0]["A"].axes
+            unit = (ax.transData.transform((1, 0)) - ax.transData.transform((0, 0)))[0] / self.figure.dpi * DPI
+        return centres, unit
+
+
+_canvases: Dict[str, TriangleCanvas] = {}
+_canvases_lock = threading.Lock()
+
+
+def canvas(layout: str) -> TriangleCanvas:
+    """This process's canvas for `layout`, built on first use."""
+    c = _canvases.get(layout)
+    if c is None:
+        with _canvases_lock:
+            c = _canvases.get(layout) or _canvases.setdefault(layout, TriangleCanvas(layout))
+    return c
+
+
+_atlases: Dict[str, GlyphAtlas] = {}
+
+
+def atlas(layout: str) -> GlyphAtlas:
+    """This process's glyph atlas for `layout`, built from its canvas on first use."""
+    a = _atlases.get(layout)
+    if a is None:
+        c = canvas(layout)
+        with _canvases_lock:
+            a = _atlases.get(layout) or _atlases.setdefault(layout, GlyphAtlas.build(c))
+    return a
+
+
+def warm() -> None:
+    """Build every layout's canvas, and atlas if PNGs use it (render pool worker initializer)."""
+    for layout in LAYOUTS:
+        canvas(layout)
+        if _png_renderer() == "atlas":
+            atlas(layout)
+
+
+# ── Rendering + image cache ──────────────────────────────────────────────────
+
+def _png_renderer() -> str:
+    if PNG_RENDERER == "svg":
+        return "svg" if svg_render.can_rasterize() else "matplotlib"
+    return "matplotlib" if PNG_RENDERER == "matplotlib" else "atlas"
+
+
+@lru_cache(maxsize=1)
+def renderer_version() -> str:
+    """Hash of the drawing code, matplotlib's version and the PNG renderer in use."""
+    return hash_sources(_SOURCES, f"matplotlib={matplotlib.__version__} png={_png_renderer()}")
+
+
+def image_key(layout: str, triangles: Sequence[TriangleValues], fmt: str = "png") -> str:
+    """Content address of an image: (renderer version, layout, digits drawn, format, dpi)."""
+    digits = tuple(cell_values(vals) for vals in triangles)
+    h = hashlib.blake2b(repr((renderer_version(), layout, digits, fmt, DPI)).encode(), digest_size=16)
+    return f"{h.hexdigest()}.{fmt}"
+
+
+def render_image(layout: str, triangles: List[TriangleValues], fmt: str = "png") -> bytes:
+    """Render without the cache (the render pool job)."""
+    if fmt == "png" and _png_renderer() == "svg":
+        return svg_render.svg_png(triangles)
+    if fmt == "png" and _png_renderer() == "atlas":
+        png = atlas(layout).png([v for vals in triangles for v in cell_values(vals)])
+        if png is not None:
+            return png
+    return canvas(layout).render(triangles, fmt)
+
+
+def cached_image(layout: str, triangles: List[TriangleValues], fmt: str = "png") -> bytes:
+    key = image_key(layout, triangles, fmt)
+    body = IMAGE_CACHE.get(key)
+    if body is None:
+        body = render_image(layout, triangles, fmt)
+        IMAGE_CACHE.put(key, body)
+    return body
+
+
+def triangle_png(dob: str) -> bytes:
+    return cached_image("single", single_triangles(dob))
+
+
+def triangle_pdf(dob: str) -> bytes:
+    return cached_image("single", single_triangles(dob), "pdf")
+
+
+def pair_png(left_dob: str, right_dob_or_today: str = "today") -> bytes:
+    return cached_image("pair", pair_triangles(left_dob, right_dob_or_today))
+
+
+def yearly_png(dob: str, year: int) -> bytes:
+    return cached_image("combined", yearly_triangles(dob, year))
+
+
+def monthly_png(dob: str, year: int, month: int) -> bytes:
+    return cached_image("combined", monthly_triangles(dob, year, month))
+
+
+def daily_png(dob: str, day: str = "today") -> bytes:
+    return cached_image("combined", daily_triangles(dob, day))
+
+
+# ── SVG (inline) ─────────────────────────────────────────────────────────────
+
+def triangle_svg(dob: str) -> bytes:
+    return svg_render.svg(single_triangles(dob))
+
+
+def pair_svg(left_dob: str, right_dob_or_today: str = "today") -> bytes:
+    return svg_render.svg(pair_triangles(left_dob, right_dob_or_today))
+
+
+def yearly_svg(dob: str, year: int) -> bytes:
+    return svg_render.svg(yearly_triangles(dob, year))
+
+
+def monthly_svg(dob: str, year: int, month: int) -> bytes:
+    return svg_render.svg(monthly_triangles(dob, year, month))
+
+
+def daily_svg(dob: str, day: str = "today") -> bytes:
+    return svg_render.svg(daily_triangles(dob, day))
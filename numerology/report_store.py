@@ -0,0 +1,337 @@
+# numerology/report_store.py
+"""
+Materialized report store.
+
+The single, health, profession and mulank/bhagyank reports are pure functions
+of the DOB's ABCD digits (health also of whether `gender` is female), and the
+yearly/monthly reports of (ABCD, target year's C/D). This module renders each
+of them once per key into an SQLite file of pre-serialized JSON, so the API can
+answer with stored bytes and only splice the `dob`/`year` echo fields in.
+
+    python -m numerology.report_store [--path FILE] [--years 2026-2027] [--if-stale]
+    python -m numerology.report_store --check
+
+The store records a hash of the source modules it was built from; when any of
+them (traits, special_numbers, profession_traits, the report builders …)
+changes, the store is treated as stale and callers fall back to live builds
+until it is rebuilt. NUMEROLOGY_REPORT_STORE overrides the file location
+("off" disables the store).
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from numerology.canonical import abcd_key, dob_key, dob_for_key, year_key
+from numerology.features.single_person_report import mystical_triangle_report
+from numerology.features.health_report import health_triangle_report, _is_female
+from numerology.features.profession_report import profession_report
+from numerology.features.yearly_report import yearly_triangle_report
+from numerology.features.monthly_report import monthly_prediction_report
+from numerology.mulank_bhagyank import mulank_bhagyank_profile
+from numerology.shared_tables import hash_sources
+from numerology.fast_json import EchoTemplate, dumps
+
+FORMAT = 1
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "report_store.sqlite"
+# Readers map the file (PRAGMA mmap_size) instead of copying pages into a
+# per-connection cache, so gunicorn workers share one copy in the page cache.
+MMAP_SIZE = 1 << 30
+
+# Everything a stored report is derived from; editing any of these invalidates the store.
+_SOURCES = (
+    "core.py",
+    "reads.py",
+    "traits.py",
+    "context.py",
+    "mulank_bhagyank.py",
+    "mulank_bhagyank_traits.py",
+    "profession_traits.py",
+    "report_store.py",
+    "features/special_numbers.py",
+    "features/single_person_report.py",
+    "features/health_report.py",
+    "features/profession_report.py",
+    "features/yearly_report.py",
+    "features/monthly_report.py",
+)
+
+# kind → (builder(dob_str, year, gender), echo fields at the head of the report)
+_KINDS: Dict[str, Tuple[Callable[[str, Optional[int], Optional[str]], Dict[str, Any]], Tuple[str, ...]]] = {
+    "single": (lambda dob, year, gender: mystical_triangle_report(dob), ("dob",)),
+    "health": (lambda dob, year, gender: health_triangle_report(dob, gender=gender), ("dob",)),
+    "profession": (lambda dob, year, gender: profession_report(dob), ("dob",)),
+    "mulank_bhagyank": (lambda dob, year, gender: mulank_bhagyank_profile(dob), ("dob",)),
+    "yearly": (lambda dob, year, gender: yearly_triangle_report(dob, year), ("dob", "year")),
+    "monthly": (lambda dob, year, gender: monthly_prediction_report(dob, year), ("dob", "year")),
+}
+KINDS = tuple(_KINDS)
+
+
+@lru_cache(maxsize=1)
+def source_version() -> str:
+    """Hash of the store format and every source module in _SOURCES."""
+    return hash_sources(_SOURCES, f"format={FORMAT}")
+
+
+def store_path() -> Optional[Path]:
+    env = (os.getenv("NUMEROLOGY_REPORT_STORE") or "").strip()
+    if env.lower() in ("off", "0", "false", "none"):
+        return None
+    return Path(env) if env else DEFAULT_PATH
+
+
+# ───────────── keys + encoding ─────────────
+
+def _key(kind: str, dob: str, year: Optional[str], female: bool) -> str:
+    """Row key from the canonical keys (numerology.canonical) of the DOB and year."""
+    if kind == "health":
+        return dob + (":f" if female else ":")
+    if _KINDS[kind][1] == ("dob", "year"):
+        return dob + ":" + year
+    return dob
+
+
+def _tail(report: Dict[str, Any], echo: Tuple[str, ...]) -> bytes:
+    """Serialized report minus its leading echo fields: b'"k":v,...}'."""
+    if tuple(report)[: len(echo)] != echo:
+        raise ValueError(f"Report does not start with echo fields {echo}: {tuple(report)[:3]}")
+    return dumps({k: v for k, v in report.items() if k not in echo})[1:]
+
+
+# Reports of one kind share most of their text (trait descriptions, notes), so
+# each kind is compressed against a preset dictionary of sample reports; that
+# is ~3-5x smaller than compressing each report on its own.
+_ZDICT_SIZE = 32 * 1024
+
+
+def _compress(tail: bytes, zdict: bytes) -> bytes:
+    co = zlib.compressobj(6, zdict=zdict)
+    return co.compress(tail) + co.flush()
+
+
+def _decode(body: bytes, zdict: bytes, echo: Tuple[str, ...]) -> EchoTemplate:
+    return EchoTemplate.after_head(echo, zlib.decompressobj(zdict=zdict).decompress(body))
+
+
+# ───────────── reading ─────────────
+
+_local = threading.local()
+
+
+def _connection(path: Path) -> Optional[Tuple[sqlite3.Connection, Dict[str, bytes]]]:
+    """Per-thread read-only (connection, zdicts); reopened when the file is replaced, None when stale."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    stamp = (str(path), st.st_ino, st.st_mtime_ns)
+    cached = getattr(_local, "store", None)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    if cached is not None and cached[1] is not None:
+        cached[1][0].close()
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        version = conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        current = bool(version) and version[0] == source_version()
+        store = (conn, dict(conn.execute("SELECT kind, zdict FROM dicts"))) if current else None
+    except sqlite3.DatabaseError:
+        store = None
+    if store is None:
+        conn.close()
+    _local.store = (stamp, store)
+    return store
+
+
+def stored_template(
+    kind: str,
+    dob: str,
+    year: Optional[str] = None,
+    *,
+    female: bool = False,
+) -> Optional[EchoTemplate]:
+    """
+    The stored `kind` report for canonical DOB key `dob` (and year key `year`),
+    with slots for its echo fields; None when there is no current store or no
+    entry for the key.
+    """
+    path = store_path()
+    if path is None:
+        return None
+    store = _connection(path)
+    if store is None:
+        return None
+    conn, zdicts = store
+    row = conn.execute("SELECT body FROM reports WHERE kind = ? AND key = ?", (kind, _key(kind, dob, year, female))).fetchone()
+    if row is None:
+        return None
+    return _decode(row[0], zdicts[kind], _KINDS[kind][1])
+
+
+def stored_report(
+    kind: str,
+    dob_str: str,
+    year: Optional[int] = None,
+    *,
+    gender: Optional[str] = None,
+) -> Optional[bytes]:
+    """
+    JSON bytes of the `kind` report for this DOB (and year), identical to the live
+    builder's response; None when there is no current store or no entry for the key.
+    """
+    template = stored_template(
+        kind, dob_key(dob_str), None if year is None else year_key(year), female=_is_female(gender)
+    )
+    return None if template is None else template.render({"dob": dob_str, "year": year})
+
+
+# ───────────── building ─────────────
+
+def _representative_dobs() -> Iterator[Tuple[Tuple[int, int, int, int], str]]:
+    """One DOB per reachable ABCD (A, B are never 0; C=D=0 would be year 0000)."""
+    for a in range(1, 10):
+        for b in range(1, 10):
+            for c in range(10):
+                for d in range(10):
+                    if c == d == 0:
+                        continue
+                    yield (a, b, c, d), dob_for_key(abcd_key((a, b, c, d)))
+
+
+def parse_years(spec: str) -> List[int]:
+    """ "2026" or "2025-2030" → list of years. """
+    first, _, last = spec.partition("-")
+    first_y, last_y = int(first), int(last or first)
+    if not (1 <= first_y <= last_y <= 9999):
+        raise ValueError("Years must look like 2026 or 2025-2030 (1..9999)")
+    return list(range(first_y, last_y + 1))
+
+
+def _variants(kind: str, year_drivers: List[int]) -> List[Tuple[Optional[int], Optional[str]]]:
+    """(year, gender) combinations stored per ABCD for `kind`."""
+    if "year" in _KINDS[kind][1]:
+        return [(y, None) for y in year_drivers]
+    if kind == "health":
+        return [(None, None), (None, "female")]
+    return [(None, None)]
+
+
+def _zdicts(dobs: List[Tuple[Tuple[int, int, int, int], str]], year_drivers: List[int]) -> Dict[str, bytes]:
+    """Per-kind preset dictionary: the tails of a fixed spread of sample reports."""
+    out = {}
+    for kind, (build, echo) in _KINDS.items():
+        year, gender = _variants(kind, year_drivers)[0]
+        sample = b"".join(_tail(build(dob, year, gender), echo) for _, dob in dobs[::1000])
+        out[kind] = sample[-_ZDICT_SIZE:]
+    return out
+
+
+def _rows(
+    dobs: List[Tuple[Tuple[int, int, int, int], str]],
+    year_drivers: List[int],
+    zdicts: Dict[str, bytes],
+) -> Iterator[Tuple[str, str, bytes]]:
+    for abcd, dob in dobs:
+        for kind, (build, echo) in _KINDS.items():
+            for year, gender in _variants(kind, year_drivers):
+                body = _compress(_tail(build(dob, year, gender), echo), zdicts[kind])
+                key = _key(kind, abcd_key(abcd), None if year is None else year_key(year), _is_female(gender))
+                yield kind, key, body
+
+
+def build_store(path: Path, years: List[int]) -> int:
+    """Render every report into a fresh store at `path` (atomically replaced). Returns row count."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    if tmp.exists():
+        tmp.unlink()
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.executescript(
+            """
+            CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE reports (
+                kind TEXT NOT NULL,
+                key  TEXT NOT NULL,
+                body BLOB NOT NULL,
+                PRIMARY KEY (kind, key)
+            ) WITHOUT ROWID;
+            CREATE TABLE dicts (kind TEXT PRIMARY KEY, zdict BLOB NOT NULL);
+            """
+        )
+        # Year reports depend only on the year's C/D; render each pair once.
+        year_drivers = list({year_key(y): y for y in reversed(years)}.values())
+        dobs = list(_representative_dobs())
+        zdicts = _zdicts(dobs, year_drivers)
+        conn.executemany("INSERT INTO dicts VALUES (?, ?)", zdicts.items())
+        conn.executemany("INSERT INTO reports VALUES (?, ?, ?)", _rows(dobs, year_drivers, zdicts))
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [
+                ("version", source_version()),
+                ("years", f"{min(years)}-{max(years)}"),
+                ("built_at", time.strftime("%Y-%m-%dT%H:%M:%S")),
+            ],
+        )
+        count = conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return count
+
+
+def store_status(path: Path) -> Dict[str, Any]:
+    if not Path(path).exists():
+        return {"path": str(path), "exists": False, "current": False, "version": source_version()}
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        meta = dict(conn.execute("SELECT name, value FROM meta"))
+        counts = dict(conn.execute("SELECT kind, COUNT(*) FROM reports GROUP BY kind"))
+    finally:
+        conn.close()
+    return {
+        "path": str(path),
+        "exists": True,
+        "current": meta.get("version") == source_version(),
+        "version": source_version(),
+        "meta": meta,
+        "counts": counts,
+    }
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Build the materialized numerology report store.")
+    ap.add_argument("--path", type=Path, default=None, help=f"store file (default: $NUMEROLOGY_REPORT_STORE or {DEFAULT_PATH})")
+    this_year = date.today().year
+    ap.add_argument("--years", default=f"{this_year}-{this_year + 1}", help="yearly/monthly target years, e.g. 2025-2030")
+    ap.add_argument("--check", action="store_true", help="only report whether the store is current")
+    ap.add_argument("--if-stale", action="store_true", help="do nothing when the store is current for these years")
+    args = ap.parse_args()
+
+    path = args.path or store_path() or DEFAULT_PATH
+    if args.check:
+        print(json.dumps(store_status(path), indent=2))
+        return
+    years = parse_years(args.years)
+    status = store_status(path)
+    if args.if_stale and status["current"] and status["meta"].get("years") == f"{min(years)}-{max(years)}":
+        print(f"{path}: current (version {source_version()})")
+        return
+    t0 = time.perf_counter()
+    n = build_store(path, years)
+    print(f"{path}: {n} reports, version {source_version()}, {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
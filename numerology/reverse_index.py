@@ -0,0 +1,237 @@
+# numerology/reverse_index.py
+"""
+Reverse lookups over the whole triangle space.
+
+Every triangle is a pure function of its inputs A..D, so the 10,000 ABCD
+combinations cover every DOB (and every calendar day). This index maps cell
+values, build_reads codes, triples and SPECIAL_RULES tags back to the set of
+ABCD keys (A*1000 + B*100 + C*10 + D) that produce them, and expands such a
+set into concrete dates.
+
+When the shared tables file (numerology.shared_tables) is present, sections are
+grouped straight from its mapped arrays instead of re-deriving 10,000 triangles.
+
+    idx = get_reverse_index()
+    keys = idx.query(reads={"EF(CORE)": 18}, triples={"AEG": "sandwich"})
+    dates = expand_abcd_dates(keys, "01-01-1990", "31-12-2009")   # at most MAX_RANGE_DAYS
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from numerology.core import (
+    CELLS,
+    Triangle,
+    mystical_triangle_values_batch,
+    _as_date,
+    _CELL_INDEX,
+)
+from numerology.reads import build_reads
+from numerology.features.daily_report import MAX_RANGE_DAYS
+from numerology.features.special_numbers import (
+    SPECIAL_RULES,
+    feature_tags,
+    scan_special_signals,
+    _scan_triples,
+    _is_sandwich_triple,
+    _TRIPLE_IDX,
+)
+from numerology.shared_tables import SharedTables, get_shared_tables
+
+N_KEYS = 10_000
+
+Criteria = Mapping[str, Union[int, str, Iterable[Union[int, str]]]]
+
+
+def _key_abcd(key: int) -> Tuple[int, int, int, int]:
+    return key // 1000, key // 100 % 10, key // 10 % 10, key % 10
+
+
+def _triple_patterns(s: str) -> List[str]:
+    """Exact digits plus the pattern names the rules use ("same" 111..999, "sandwich" 1x1)."""
+    out = [s]
+    if len(s) == 3 and s[0] == s[1] == s[2] and s != "000":
+        out.append("same")
+    if _is_sandwich_triple(s):
+        out.append("sandwich")
+    return out
+
+
+def _group(pairs: Iterable[Tuple[Tuple[str, object], int]]) -> Dict[Tuple[str, object], FrozenSet[int]]:
+    acc: Dict[Tuple[str, object], Set[int]] = {}
+    for k, key in pairs:
+        acc.setdefault(k, set()).add(key)
+    return {k: frozenset(v) for k, v in acc.items()}
+
+
+def _group_columns(names: Iterable[str], matrix: np.ndarray) -> Dict[Tuple[str, object], FrozenSet[int]]:
+    """(column name, value) → keys, for a (N_KEYS, len(names)) table."""
+    out: Dict[Tuple[str, object], FrozenSet[int]] = {}
+    for j, name in enumerate(names):
+        col = matrix[:, j]
+        for v in np.unique(col).tolist():
+            out[(name, v)] = frozenset(np.flatnonzero(col == v).tolist())
+    return out
+
+
+class ReverseIndex:
+    """In-memory ABCD reverse index; each section is built on first use."""
+
+    def __init__(self, shared: Optional[SharedTables] = None):
+        self.shared = shared
+        self._triangles: Optional[Tuple[Triangle, ...]] = None
+        self._cells: Optional[Dict[Tuple[str, object], FrozenSet[int]]] = None
+        self._reads: Optional[Dict[Tuple[str, object], FrozenSet[int]]] = None
+        self._triples: Optional[Dict[Tuple[str, object], FrozenSet[int]]] = None
+        self._tags: Dict[str, Dict[str, FrozenSet[int]]] = {}
+
+    # ── sections ──
+    @property
+    def triangles(self) -> Tuple[Triangle, ...]:
+        if self._triangles is None:
+            self._triangles = tuple(Triangle.from_abcd(*_key_abcd(k)) for k in range(N_KEYS))
+        return self._triangles
+
+    @property
+    def cells(self) -> Dict[Tuple[str, object], FrozenSet[int]]:
+        """(cell, value) → keys."""
+        if self._cells is None and self.shared is not None:
+            self._cells = _group_columns(CELLS, self.shared.cells)
+        if self._cells is None:
+            self._cells = _group(
+                ((c, v), k) for k, t in enumerate(self.triangles) for c, v in zip(CELLS, t.cells)
+            )
+        return self._cells
+
+    @property
+    def reads(self) -> Dict[Tuple[str, object], FrozenSet[int]]:
+        """(read name, code) → keys, e.g. ("EF(CORE)", 18)."""
+        if self._reads is None and self.shared is not None:
+            self._reads = _group_columns(self.shared.read_names, self.shared.reads)
+        if self._reads is None:
+            self._reads = _group(
+                ((name, code), k)
+                for k, t in enumerate(self.triangles)
+                for name, code in build_reads(t).items()
+            )
+        return self._reads
+
+    @property
+    def triples(self) -> Dict[Tuple[str, object], FrozenSet[int]]:
+        """(triple name, digits | "same" | "sandwich") → keys, e.g. ("AEG", "sandwich")."""
+        if self._triples is None and self.shared is not None:
+            c = self.shared.cells.astype(np.int16)
+            codes = np.stack([c[:, i] * 100 + c[:, j] * 10 + c[:, k] for _, (i, j, k) in _TRIPLE_IDX], axis=1)
+            acc: Dict[Tuple[str, object], Set[int]] = {}
+            for (name, code), keys in _group_columns([n for n, _ in _TRIPLE_IDX], codes).items():
+                for pat in _triple_patterns(f"{code:03d}"):
+                    acc.setdefault((name, pat), set()).update(keys)
+            self._triples = {k: frozenset(v) for k, v in acc.items()}
+        if self._triples is None:
+            self._triples = _group(
+                ((name, pat), k)
+                for k, t in enumerate(self.triangles)
+                for name, s in _scan_triples(t.flat).items()
+                for pat in _triple_patterns(s)
+            )
+        return self._triples
+
+    def tags(self, feature: str) -> Dict[str, FrozenSet[int]]:
+        """SPECIAL_RULES tag → keys, for one feature_type (scanned on first request)."""
+        if feature not in self._tags and self.shared is not None:
+            masks = self.shared.signals(feature)
+            self._tags[feature] = {
+                tag: frozenset(np.flatnonzero(masks & np.uint64(1 << bit)).tolist())
+                for bit, tag in enumerate(self.shared.tags[feature])
+            }
+        if feature not in self._tags:
+            if not any(feature in r.get("feature", []) for r in SPECIAL_RULES):
+                raise ValueError(f"Unknown feature '{feature}'")
+            acc: Dict[str, Set[int]] = {}
+            for k, t in enumerate(self.triangles):
+                notes = scan_special_signals(feature_type=feature, final_values=t)
+                for tag in (notes["tags"] if notes else ()):
+                    acc.setdefault(tag, set()).add(k)
+            self._tags[feature] = {tag: frozenset(v) for tag, v in acc.items()}
+        return self._tags[feature]
+
+    # ── queries ──
+    @staticmethod
+    def _any_of(section: Dict[Tuple[str, object], FrozenSet[int]], name: str, values, cast) -> Set[int]:
+        if isinstance(values, (str, int)):
+            values = [values]
+        out: Set[int] = set()
+        for v in values:
+            out |= section.get((name, cast(v)), frozenset())
+        return out
+
+    def query(
+        self,
+        *,
+        cells: Optional[Criteria] = None,
+        reads: Optional[Criteria] = None,
+        triples: Optional[Criteria] = None,
+        tags: Iterable[str] = (),
+        feature: str = "person",
+    ) -> Set[int]:
+        """
+        ABCD keys matching ALL criteria; within one name, any listed value matches.
+        cells={"G": [1, 9]}, reads={"EF(CORE)": 18}, triples={"AEG": "sandwich"},
+        tags=["accident_risk"] (tags are scanned for `feature`).
+        """
+        result: Set[int] = set(range(N_KEYS))
+        for name, values in (cells or {}).items():
+            if name not in _CELL_INDEX:
+                raise ValueError(f"Unknown cell '{name}'")
+            result &= self._any_of(self.cells, name, values, int)
+        for name, values in (reads or {}).items():
+            result &= self._any_of(self.reads, name, values, int)
+        for name, values in (triples or {}).items():
+            result &= self._any_of(self.triples, name, values, str)
+        tags = list(tags)
+        if tags:
+            known = feature_tags(feature)
+            unknown = [t for t in tags if t not in known]
+            if unknown:
+                raise ValueError(f"Unknown tags for feature '{feature}': {unknown}; choose from {sorted(known)}")
+            by_tag = self.tags(feature)
+            for tag in tags:
+                result &= by_tag.get(tag, frozenset())
+        return result
+
+
+def parse_criteria(spec: Optional[str]) -> Dict[str, List[str]]:
+    """ "EF(CORE)=18|81,G=5" → {"EF(CORE)": ["18", "81"], "G": ["5"]}. """
+    out: Dict[str, List[str]] = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, sep, values = part.partition("=")
+        vals = [v.strip() for v in values.split("|") if v.strip()]
+        if not sep or not name.strip() or not vals:
+            raise ValueError(f"Bad criterion '{part}'; use NAME=value|value")
+        out[name.strip()] = vals
+    return out
+
+
+@lru_cache(maxsize=1)
+def get_reverse_index() -> ReverseIndex:
+    """Process-wide index (built lazily, then served from memory)."""
+    return ReverseIndex(get_shared_tables())
+
+
+def expand_abcd_dates(keys: Iterable[int], start, end) -> np.ndarray:
+    """All dates in [start, end] whose triangle ABCD key is in `keys` (datetime64[D])."""
+    first, last = _as_date(start), _as_date(end)
+    if last < first:
+        raise ValueError("end must not be before start")
+    if (last - first).days + 1 > MAX_RANGE_DAYS:
+        raise ValueError(f"Range too long; at most {MAX_RANGE_DAYS} days per request")
+    days = np.arange(np.datetime64(first, "D"), np.datetime64(last, "D") + 1)
+    tri = mystical_triangle_values_batch(days)
+    abcd = ((tri["A"].astype(np.int32) * 10 + tri["B"]) * 10 + tri["C"]) * 10 + tri["D"]
+    wanted = np.fromiter(keys, dtype=np.int32)
+    return days[np.isin(abcd, wanted)]
@@ -0,0 +1,227 @@
+# numerology/shared_tables.py
+"""
+Deploy-time artifact of the per-ABCD tables, mapped read-only into every worker.
+
+The 10,000 ABCD triangles, their build_reads codes and their SPECIAL_RULES tags
+(as one bitmask per feature) are written once to a flat binary file:
+
+    python -m numerology.shared_tables [--path FILE] [--if-stale]
+
+Workers mmap it (no parse, no copy), so under `gunicorn -w N` all of them read
+the same page-cache pages and a freshly forked worker has the tables at once.
+Like the report store, the file records a hash of the sources it was derived
+from and is ignored when stale. NUMEROLOGY_SHARED_TABLES overrides the file
+location ("off" disables it).
+
+Layout: MAGIC, uint64 header length, uint64 data start, JSON header, then
+64-byte aligned arrays described by the header ({name: {dtype, shape, offset}},
+offsets relative to the data start).
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from numerology.core import CELLS, Triangle, _cell_matrix, _triangle_cells_batch
+from numerology.reads import build_reads
+from numerology.features.special_numbers import SPECIAL_RULES, scan_special_signals
+
+MAGIC = b"ASBTBL01"
+N_KEYS = 10_000
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "shared_tables.bin"
+_ALIGN = 64
+_PREAMBLE = struct.Struct("<8sQQ")   # magic, header length, data start
+
+_PKG = Path(__file__).resolve().parent
+_SOURCES = (
+    "core.py",
+    "reads.py",
+    "shared_tables.py",
+    "features/special_numbers.py",
+)
+
+
+def hash_sources(sources: Iterable[str], salt: str = "") -> str:
+    """Short content hash of package-relative source files (artifact versioning)."""
+    h = hashlib.sha256(salt.encode())
+    for rel in sources:
+        h.update(rel.encode())
+        h.update((_PKG / rel).read_bytes())
+    return h.hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
+def source_version() -> str:
+    return hash_sources(_SOURCES)
+
+
+def tables_path() -> Optional[Path]:
+    env = (os.getenv("NUMEROLOGY_SHARED_TABLES") or "").strip()
+    if env.lower() in ("off", "0", "false", "none"):
+        return None
+    return Path(env) if env else DEFAULT_PATH
+
+
+def _features() -> List[str]:
+    return sorted({f for r in SPECIAL_RULES for f in r.get("feature", [])})
+
+
+# ───────────── reading ─────────────
+
+class SharedTables:
+    """
+    Read-only views over a mapped tables file:
+      cells          (10000, 18) uint8   triangle of ABCD key k in CELLS order
+      reads          (10000, n)  uint8   build_reads codes, columns = read_names
+      signals[f]     (10000,)    uint64  tag bitmask for feature f, bits = tags[f]
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, hlen, data_start = _PREAMBLE.unpack_from(self._mm)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a shared tables file")
+        self.header: Dict[str, Any] = json.loads(self._mm[_PREAMBLE.size : _PREAMBLE.size + hlen])
+        self.version: str = self.header["version"]
+        self.read_names: Tuple[str, ...] = tuple(self.header["read_names"])
+        self.tags: Dict[str, Tuple[str, ...]] = {f: tuple(t) for f, t in self.header["tags"].items()}
+        self.arrays: Dict[str, np.ndarray] = {
+            name: np.frombuffer(
+                self._mm,
+                dtype=np.dtype(spec["dtype"]),
+                count=int(np.prod(spec["shape"])),
+                offset=data_start + spec["offset"],
+            ).reshape(spec["shape"])
+            for name, spec in self.header["tables"].items()
+        }
+
+    @property
+    def cells(self) -> np.ndarray:
+        return self.arrays["cells"]
+
+    @property
+    def reads(self) -> np.ndarray:
+        return self.arrays["reads"]
+
+    def signals(self, feature: str) -> np.ndarray:
+        try:
+            return self.arrays[f"signals/{feature}"]
+        except KeyError:
+            raise ValueError(f"Unknown feature '{feature}'") from None
+
+    def tags_of(self, feature: str, key: int) -> List[str]:
+        """Tags of ABCD `key` for `feature` (in vocabulary order, not scan order)."""
+        mask = int(self.signals(feature)[key])
+        return [t for bit, t in enumerate(self.tags[feature]) if mask >> bit & 1]
+
+
+@lru_cache(maxsize=1)
+def get_shared_tables() -> Optional[SharedTables]:
+    """The mapped tables when a current file exists, else None (callers compute instead)."""
+    path = tables_path()
+    if path is None or not path.exists():
+        return None
+    try:
+        tables = SharedTables(path)
+    except (OSError, ValueError):
+        return None
+    return tables if tables.version == source_version() else None
+
+
+def abcd_triangles(keys: Sequence[int]) -> List[Triangle]:
+    """Triangles for ABCD keys: rows of the mapped tables, else one vectorized pass."""
+    idx = np.asarray(keys, dtype=np.int64)
+    tables = get_shared_tables()
+    if tables is not None:
+        cells = tables.cells[idx]
+    else:
+        cells = _cell_matrix(_triangle_cells_batch(idx // 1000, idx // 100 % 10, idx // 10 % 10, idx % 10))
+    return [Triangle(row.tobytes()) for row in cells]
+
+
+# ───────────── building ─────────────
+
+def _compute_tables() -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    keys = np.arange(N_KEYS)
+    cells = _cell_matrix(_triangle_cells_batch(keys // 1000, keys // 100 % 10, keys // 10 % 10, keys % 10))
+    tris = [Triangle(row.tobytes()) for row in cells]
+
+    reads_rows = [build_reads(t) for t in tris]
+    read_names = list(reads_rows[0])
+    reads = np.array([[r[n] for n in read_names] for r in reads_rows], dtype=np.uint8)
+
+    arrays: Dict[str, np.ndarray] = {"cells": cells, "reads": reads}
+    tags: Dict[str, List[str]] = {}
+    for feature in _features():
+        vocab: Dict[str, int] = {}
+        masks = np.zeros(N_KEYS, dtype=np.uint64)
+        for k, (t, r) in enumerate(zip(tris, reads_rows)):
+            notes = scan_special_signals(feature_type=feature, final_values=t, final_reads=r)
+            m = 0
+            for tag in (notes["tags"] if notes else ()):
+                m |= 1 << vocab.setdefault(tag, len(vocab))
+            masks[k] = m
+        if len(vocab) > 64:
+            raise ValueError(f"Feature '{feature}' has {len(vocab)} tags; masks hold 64")
+        arrays[f"signals/{feature}"] = masks
+        tags[feature] = list(vocab)
+    return arrays, {"read_names": read_names, "tags": tags, "cells": list(CELLS)}
+
+
+def build_tables(path: Path) -> Dict[str, Any]:
+    """Compute every table and write the file atomically. Returns the header."""
+    arrays, extra = _compute_tables()
+
+    specs: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    for name, arr in arrays.items():
+        specs[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+        offset += -(-arr.nbytes // _ALIGN) * _ALIGN
+    header = {"version": source_version(), "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"), **extra, "tables": specs}
+
+    raw = json.dumps(header, separators=(",", ":")).encode()
+    data_start = -(-(_PREAMBLE.size + len(raw)) // _ALIGN) * _ALIGN
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(_PREAMBLE.pack(MAGIC, len(raw), data_start) + raw)
+        for spec, arr in zip(specs.values(), arrays.values()):
+            fh.write(b"\0" * (data_start + spec["offset"] - fh.tell()))
+            fh.write(np.ascontiguousarray(arr).tobytes())
+    os.replace(tmp, path)
+    return header
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Build the shared (mmap'ed) per-ABCD tables file.")
+    ap.add_argument("--path", type=Path, default=None, help=f"tables file (default: $NUMEROLOGY_SHARED_TABLES or {DEFAULT_PATH})")
+    ap.add_argument("--if-stale", action="store_true", help="do nothing when the file is already current")
+    args = ap.parse_args()
+
+    path = args.path or tables_path() or DEFAULT_PATH
+    if args.if_stale and path.exists():
+        try:
+            if SharedTables(path).version == source_version():
+                print(f"{path}: current (version {source_version()})")
+                return
+        except (OSError, ValueError):
+            pass
+    t0 = time.perf_counter()
+    header = build_tables(path)
+    print(f"{path}: {len(header['tables'])} tables, version {header['version']}, {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
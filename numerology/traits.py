@@ -1,5 +1,7 @@
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple, Set
 
+from numerology.core import Triangle, _triangle_signature
 
 
 # helper function for traits.py
@@ -421,13 +423,16 @@ CRITICAL_NINE_PAIRS: Set[int] = {
 _POLARITY_POSITIVE = {"C", "D", "F", "G"}
 _POLARITY_NEGATIVE = {"A", "B", "E"}
 
-def summarize_polarity(values: dict) -> dict:
-    # flatten safely
-    flat: Dict[str, int] = {}
-    for sec in ("inputs", "layer1", "second_layer", "third_layer"):
-        block = values.get(sec) or {}
-        if isinstance(block, dict):
-            flat.update(block)
+def _summarize_polarity(values: dict) -> dict:
+    # flatten safely (a Triangle already carries its flat view)
+    if isinstance(values, Triangle):
+        flat = values.flat
+    else:
+        flat = {}
+        for sec in ("inputs", "layer1", "second_layer", "third_layer"):
+            block = values.get(sec) or {}
+            if isinstance(block, dict):
+                flat.update(block)
 
     pos = neg = neu = 0
     detail = {"positive": [], "negative": [], "neutral": []}
@@ -457,3 +462,28 @@ def summarize_polarity(values: dict) -> dict:
         "balance": balance,
         "detail": detail,
     }
+
+
+# Polarity depends only on the 18 cells: complete triangles are memoized by
+# their signature and callers get a copy.
+POLARITY_CACHE_SIZE = 65_536
+
+
+@lru_cache(maxsize=POLARITY_CACHE_SIZE)
+def _polarity_cached(sig: bytes) -> dict:
+    return _summarize_polarity(Triangle(sig))
+
+
+def summarize_polarity(values: dict) -> dict:
+    sig = _triangle_signature(values)
+    if sig is None:
+        return _summarize_polarity(values)
+    pol = _polarity_cached(sig)
+    return {**pol, "detail": {k: list(v) for k, v in pol["detail"].items()}}
+
+
+def precompute_polarity_cache() -> int:
+    """Fill the polarity cache for all 10,000 ABCD triangles; returns the entry count."""
+    for key in range(10_000):
+        _polarity_cached(Triangle.from_abcd(key // 1000, key // 100 % 10, key // 10 % 10, key % 10).cells)
+    return 10_000
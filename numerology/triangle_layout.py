@@ -0,0 +1,117 @@
+# numerology/triangle_layout.py
+"""
+Geometry of the inverted 4–2–1 triangle (A B C D | E F | G).
+
+Data units: the triangle spans 0..10 on both axes, y up, tip at (5, 0).
+viz._draw_inverted_421 (matplotlib), numerology.svg_render and
+numerology.pdf_triangle draw from these constants, so every renderer puts
+the same lines and numbers in the same place. The *_triangles functions give
+the triangle values each image shows.
+"""
+from __future__ import annotations
+from datetime import date
+from typing import List, Mapping, Tuple
+
+from numerology.core import (
+    _resolve_right_day,
+    combine_two_triangles,
+    month_year_driver_triangle_selected,
+    mystical_triangle_today,
+    mystical_triangle_values_image,
+    year_only_triangle,
+)
+
+CELLS = "ABCDEFG"
+
+
+# Helper: x of sides at a given y
+def _x_left(y):   return -0.5*y + 5.0
+def _x_right(y):  return  0.5*y + 5.0
+
+
+# Horizontal bars — tuned to match the reference sketch
+_Y1, _Y2, _Y3 = 7.4, 5.0, 2.8
+
+# Line segments ((x0, x1), (y0, y1)), in drawing order
+TRIANGLE_LINES = (
+    # Outer triangle edges
+    ((0, 5), (10, 0)),
+    ((10, 5), (10, 0)),
+    ((0, 10), (10, 10)),
+    # Full-width horizontals (edge-to-edge along sides)
+    ((_x_left(_Y1), _x_right(_Y1)), (_Y1, _Y1)),
+    ((_x_left(_Y2), _x_right(_Y2)), (_Y2, _Y2)),
+    # Top band 4 columns (verticals down to y1 only)
+    ((2.5, 2.5), (10, _Y1)),
+    ((5.0, 5.0), (10, _Y1)),
+    ((7.5, 7.5), (10, _Y1)),
+    # Middle band center split from y1 → y2
+    ((5.0, 5.0), (_Y1, _Y2)),
+)
+LINE_WIDTH = 3.0   # points
+
+# Centers for each cell
+_YM = 0.5*(_Y1 + _Y2)   # middle band: mid y, then average edges to center
+CELL_CENTERS = {
+    # Top band: fixed 4 equal columns on the top band
+    "A": (1.25, 0.5*(10 + _Y1)),
+    "B": (3.75, 0.5*(10 + _Y1)),
+    "C": (6.25, 0.5*(10 + _Y1)),
+    "D": (8.75, 0.5*(10 + _Y1)),
+    "E": (0.5*(_x_left(_YM) + 5.0), _YM),
+    "F": (0.5*(5.0 + _x_right(_YM)), _YM),
+    # Tip region G
+    "G": (5.0, 0.55*_Y3),
+}
+
+# Small label above, bold value just below each center: (dy, font size in points)
+LABEL_OFFSET, LABEL_SIZE = 0.55, 9
+VALUE_OFFSET, VALUE_SIZE = -0.15, 16
+
+# Points per data unit in the single-triangle figure (5.5 x 4.2 in, default
+# subplot margins, equal aspect: 10 units span 0.77 * 4.2 in of axes height).
+# Scales LINE_WIDTH and the font sizes for renderers that work in data units.
+PT_PER_UNIT = 0.77 * 4.2 * 72 / 10
+
+
+# A triangle as the image builders return it: {"inputs": {A..D}, "layer1": {E..G}}
+# (not numerology.core.Triangle, the immutable value object).
+TriangleValues = Mapping[str, Mapping[str, int]]
+
+
+def cell_values(vals: TriangleValues) -> Tuple[int, ...]:
+    """A..G of a triangle dict ({"inputs": {A..D}, "layer1": {E..G}})."""
+    inputs, layer1 = vals["inputs"], vals["layer1"]
+    return (inputs["A"], inputs["B"], inputs["C"], inputs["D"], layer1["E"], layer1["F"], layer1["G"])
+
+
+# ── Triangles per image ──────────────────────────────────────────────────────
+
+def single_triangles(dob: str) -> List[TriangleValues]:
+    return [mystical_triangle_values_image(dob)]
+
+
+def pair_triangles(left_dob: str, right_dob_or_today: str = "today") -> List[TriangleValues]:
+    """Left DOB next to a right DOB or 'today' (viz.plot_three_triangles)."""
+    left = mystical_triangle_values_image(left_dob)
+    if right_dob_or_today.lower() == "today":
+        return [left, mystical_triangle_today()]
+    return [left, mystical_triangle_values_image(right_dob_or_today)]
+
+
+def yearly_triangles(dob: str, year: int) -> List[TriangleValues]:
+    """DOB ⊕ year (viz.plot_yearly_triptych)."""
+    return [combine_two_triangles(mystical_triangle_values_image(dob), year_only_triangle(year))]
+
+
+def monthly_triangles(dob: str, year: int, month: int) -> List[TriangleValues]:
+    """DOB ⊕ month-year driver (viz.plot_monthly_triptych)."""
+    date(year, month, 1)   # the plot's caption rejects an impossible month; so do we
+    right = month_year_driver_triangle_selected(month, year)
+    return [combine_two_triangles(mystical_triangle_values_image(dob), right)]
+
+
+def daily_triangles(dob: str, day: str = "today") -> List[TriangleValues]:
+    """DOB ⊕ day driver (viz.plot_daily_triptych)."""
+    right, _label = _resolve_right_day(day)
+    return [combine_two_triangles(mystical_triangle_values_image(dob), right)]
@@ -16,6 +16,8 @@ from .core import (mystical_triangle_values_image,
                    month_year_driver_triangle_selected,  # ← use selected month
                    _resolve_right_day,    
 )
+from .triangle_layout import (CELL_CENTERS, TRIANGLE_LINES, LINE_WIDTH,
+                              LABEL_OFFSET, LABEL_SIZE, VALUE_OFFSET, VALUE_SIZE)
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Inverted 4–2–1 layout WITH labels + numbers (A B C D | E F | G)
@@ -27,64 +29,26 @@ def _draw_inverted_421(ax: plt.Axes,
     """
     Draw the structure in your reference (top band 4 cols, middle band center split,
     short lower bar) and render the values inside each cell. No page titles.
+    Returns the value text artists by cell label (numerology.render_service
+    reuses a drawn figure and only updates these).
     """
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 10)
     ax.set_aspect("equal")
     ax.axis("off")
 
-    # Outer triangle edges
-    ax.plot([0, 5], [10, 0], color="black", linewidth=3.0)
-    ax.plot([10, 5], [10, 0], color="black", linewidth=3.0)
-    ax.plot([0, 10], [10, 10], color="black", linewidth=3.0)
-
-    # Helper: x of sides at a given y
-    def x_left(y):   return -0.5*y + 5.0
-    def x_right(y):  return  0.5*y + 5.0
-
-    # Horizontal bars — tuned to match your sketch
-    y1 = 7.4
-    y2 = 5.0
-    y3 = 2.8
-
-    # Full-width horizontals (edge-to-edge along sides)
-    ax.plot([x_left(y1), x_right(y1)], [y1, y1], color="black", linewidth=3.0)
-    ax.plot([x_left(y2), x_right(y2)], [y2, y2], color="black", linewidth=3.0)
-    # ax.plot([x_left(y3), x_right(y3)], [y3, y3], color="black", linewidth=3.0)
-
-    # Top band 4 columns (verticals down to y1 only)
-    for x in (2.5, 5.0, 7.5):
-        ax.plot([x, x], [10, y1], color="black", linewidth=3.0)
-
-    # Middle band center split from y1 → y3
-    ax.plot([5.0, 5.0], [y1, y2], color="black", linewidth=3.0)
+    for xs, ys in TRIANGLE_LINES:
+        ax.plot(list(xs), list(ys), color="black", linewidth=LINE_WIDTH)
 
     # ---- Place numbers (and optional small labels) ----
-    def put(lbl: str, val: int, x: float, y: float):
+    values = {}
+    for lbl, val in zip("ABCDEFG", (A, B, C, D, E, F, G)):
+        x, y = CELL_CENTERS[lbl]
         if show_labels:
-            ax.text(x, y + 0.55, lbl, ha="center", va="center", fontsize=9, color="#000")
-        ax.text(x, y - 0.15, str(val), ha="center", va="center",
-                fontsize=16, fontweight="bold")
-
-    # Centers for each cell
-    # Top band: fixed 4 equal columns on the top band
-    cxA, cyA = 1.25, 0.5*(10 + y1)
-    cxB, cyB = 3.75, cyA
-    cxC, cyC = 6.25, cyA
-    cxD, cyD = 8.75, cyA
-
-    # Middle band: compute mid y, then average edges to center
-    ym = 0.5*(y1 + y2)
-    cxE = 0.5*(x_left(ym) + 5.0); cyE = ym
-    cxF = 0.5*(5.0 + x_right(ym)); cyF = ym
-
-    # Tip region G
-    cxG, cyG = 5.0, 0.55*y3
-
-    put("A", A, cxA, cyA); put("B", B, cxB, cyB)
-    put("C", C, cxC, cyC); put("D", D, cxD, cyD)
-    put("E", E, cxE, cyE); put("F", F, cxF, cyF)
-    put("G", G, cxG, cyG)
+            ax.text(x, y + LABEL_OFFSET, lbl, ha="center", va="center", fontsize=LABEL_SIZE, color="#000")
+        values[lbl] = ax.text(x, y + VALUE_OFFSET, str(val), ha="center", va="center",
+                              fontsize=VALUE_SIZE, fontweight="bold")
+    return values
 
 
 def plot_mystical_triangle_excel_exact(
@@ -112,19 +76,26 @@ def plot_mystical_triangle_excel_exact(
     return fig, vals
 
 # ── Export helpers ────────────────────────────────────────────────────────────
-def build_triangle_png_bytes(dob_str: str) -> bytes:
-    fig, _ = plot_mystical_triangle_excel_exact(dob_str, save_path=None)
+
+def figure_bytes(fig, fmt: str = "png") -> bytes:
+    """Encode a figure and close it (always, so callers don't accumulate figures)."""
     buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=170, bbox_inches="tight")
-    plt.close(fig)
+    try:
+        fig.savefig(buf, format=fmt, dpi=170, bbox_inches="tight")
+    finally:
+        plt.close(fig)
     return buf.getvalue()
 
+# The image endpoints and PDFs render from pre-drawn figures (numerology.render_service);
+# the output is identical to plot_mystical_triangle_excel_exact + savefig.
+
+def build_triangle_png_bytes(dob_str: str) -> bytes:
+    from numerology.render_service import triangle_png
+    return triangle_png(dob_str)
+
 def build_triangle_pdf_bytes(dob_str: str) -> bytes:
-    fig, _ = plot_mystical_triangle_excel_exact(dob_str, save_path=None)
-    buf = io.BytesIO()
-    fig.savefig(buf, format="pdf", dpi=170, bbox_inches="tight")
-    plt.close(fig)
-    return buf.getvalue()
+    from numerology.render_service import triangle_pdf
+    return triangle_pdf(dob_str)
 
 def _draw_triangle_on(ax: plt.Axes, vals: Dict[str, Dict[str, int]], title: str):
     """
@@ -3,7 +3,7 @@ import os
 import re
 import base64
 from datetime import date, datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 import requests
 import streamlit as st
@@ -311,18 +311,34 @@ def _params(**kw) -> Dict[str, Any]:
     return {k: v for k, v in kw.items() if v is not None}
 
 
+# Last (ETag, payload) per request, so an expired st.cache_data entry is
+# revalidated with If-None-Match (a 304 from nginx/FastAPI, no body) instead
+# of downloaded again.
+_ETAG_CACHE: Dict[Tuple[str, str], Tuple[str, Any]] = {}
+_ETAG_CACHE_MAX = 512
+
+
 @st.cache_data(ttl=300, show_spinner=False)
 def api_get_cached(api_base: str, path: str, params: Optional[dict], timeout: int) -> Dict[str, Any] | bytes:
     base = (api_base or "").rstrip("/")
     url = f"{base}{path}"
+    key = (url, repr(sorted((params or {}).items())))
+    known = _ETAG_CACHE.get(key)
+    headers = {"If-None-Match": known[0]} if known else None
     # Use tuple for explicit (connect, read) timeouts
     t = (10, timeout)
-    r = SESSION.get(url, params=params, timeout=t)
+    r = SESSION.get(url, params=params, headers=headers, timeout=t)
+    if r.status_code == 304 and known:
+        return known[1]
     r.raise_for_status()
     ctype = r.headers.get("content-type", "")
-    if "application/json" in ctype:
-        return r.json()
-    return r.content
+    payload = r.json() if "application/json" in ctype else r.content
+    etag = r.headers.get("ETag")
+    if etag:
+        if len(_ETAG_CACHE) >= _ETAG_CACHE_MAX:
+            _ETAG_CACHE.clear()
+        _ETAG_CACHE[key] = (etag, payload)
+    return payload
 
 
 def api_get_json(path: str, params: Optional[dict] = None):
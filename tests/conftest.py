@@ -1,5 +1,8 @@
 # tests/conftest.py
-import os, sys
+import os, sys, tempfile
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
+
+# keep rendered images out of the working tree (numerology.image_cache)
+os.environ.setdefault("NUMEROLOGY_IMAGE_CACHE", tempfile.mkdtemp(prefix="asb-image-cache-"))
@@ -63,3 +63,187 @@ def test_ai_master_report_pdf_bytes(monkeypatch):
     )
     assert r.status_code == 200
     assert r.headers["content-type"] == "application/pdf"
+
+
+def test_daily_range_ndjson_stream():
+    import json
+    c = TestClient(app)
+    r = c.get(
+        "/api/numerology/features/daily-triangle.range.ndjson",
+        params={"dob": "29-10-2001", "start": "01-01-2025", "end": "10-01-2025", "fields": "core,polarity"},
+    )
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert len(rows) == 10 and set(rows[0]) == {"day", "core", "polarity"}
+    bad = c.get(
+        "/api/numerology/features/daily-triangle.range.ndjson",
+        params={"dob": "29-10-2001", "start": "01-01-2025", "end": "10-01-2025", "fields": "nope"},
+    )
+    assert bad.status_code == 400
+
+
+PRE_ENCODED = [
+    ("/api/numerology/mystical-triangle.json", {"dob": "29-10-2001"}, "values", ("29-10-2001",)),
+    ("/api/numerology/mystical-triangle.report.json", {"dob": "29-10-2001"}, "single", ("29-10-2001",)),
+    ("/api/numerology/yearly-triangle.report.json", {"dob": "1990-05-17", "year": 2025}, "yearly", ("1990-05-17", 2025)),
+    ("/api/numerology/monthly.report.json", {"dob": "1990-05-17", "year": 2025}, "monthly", ("1990-05-17", 2025)),
+    ("/api/numerology/health-triangle.report.json", {"dob": "04-07-1984", "gender": "female"}, "health", ("04-07-1984", "female")),
+    ("/api/numerology/health/yearly.report.json", {"dob": "04-07-1984", "year": 2026}, "health_yearly", ("04-07-1984", 2026, None)),
+    ("/api/numerology/relationship-triangle.report.json", {"left": "29-10-2001", "right": "04-07-1984"}, "relationship", ("29-10-2001", "04-07-1984")),
+]
+
+
+@pytest.mark.parametrize("url,params,kind,args", PRE_ENCODED)
+def test_pre_encoded_reports_match_fastapi_encoding(monkeypatch, url, params, kind, args):
+    import json
+    from fastapi.encoders import jsonable_encoder
+    from numerology import num_api
+
+    monkeypatch.setenv("NUMEROLOGY_REPORT_STORE", "off")
+    num_api._template.cache_clear()
+    c = TestClient(app)
+    r = c.get(url, params=params)
+    assert r.status_code == 200 and r.headers["content-type"] == "application/json"
+    expected = json.loads(json.dumps(jsonable_encoder(num_api._DETERMINISTIC[kind].build(*args))))
+    assert r.json() == expected
+    hits = num_api._template.cache_info().hits
+    assert c.get(url, params=params).content == r.content
+    assert num_api._template.cache_info().hits == hits + 1
+
+
+def test_fast_json_stdlib_fallback(monkeypatch):
+    import json
+    import numpy as np
+    from numerology import fast_json
+    from numerology.features.single_person_report import mystical_triangle_report
+
+    report = mystical_triangle_report("29-10-2001")
+    fast = fast_json.dumps(report)
+    monkeypatch.setattr(fast_json, "orjson", None)
+    slow = fast_json.dumps(report)
+    assert json.loads(fast) == json.loads(slow)
+    assert fast_json.dumps({1: np.int64(7), "d": np.arange(2)}) == b'{"1":7,"d":[0,1]}'
+
+
+def test_etag_and_304_on_pure_endpoints():
+    from numerology.http_cache import MAX_AGE
+    c = TestClient(app)
+    for url, params in [
+        ("/api/numerology/profession.report.json", {"dob": "29-10-2001"}),
+        ("/api/numerology/mystical-triangle.png", {"dob": "29-10-2001"}),
+    ]:
+        r = c.get(url, params=params)
+        etag = r.headers["etag"]
+        assert r.status_code == 200 and etag.startswith('"')
+        assert r.headers["cache-control"] == f"public, max-age={MAX_AGE}, must-revalidate"
+        again = c.get(url, params=params, headers={"If-None-Match": f'"other", W/{etag}'})
+        assert again.status_code == 304 and again.content == b"" and again.headers["etag"] == etag
+        other = c.get(url, params={**params, "dob": "30-10-2001"}, headers={"If-None-Match": etag})
+        assert other.status_code == 200 and other.headers["etag"] != etag
+
+
+def test_equivalent_spellings_share_etag():
+    c = TestClient(app)
+    url = "/api/numerology/health/daily.report.json"
+    a = c.get(url, params={"dob": "29-10-2001", "day": "12-03-2025"})
+    b = c.get(url, params={"dob": "2001-10-29", "day": "2025-03-12"})
+    assert a.status_code == b.status_code == 200
+    assert a.headers["etag"] == b.headers["etag"]
+    assert a.json()["dob"] == "29-10-2001" and b.json()["dob"] == "2001-10-29"
+    again = c.get(url, params={"day": "2025-03-12", "dob": "29/10/2001"}, headers={"If-None-Match": a.headers["etag"]})
+    assert again.status_code == 304
+    other = c.get(url, params={"dob": "29-10-2001", "day": "13-03-2025"})
+    assert other.headers["etag"] != a.headers["etag"]
+
+
+def test_today_responses_expire_at_midnight():
+    from datetime import datetime
+    from numerology.http_cache import MAX_AGE, seconds_until_midnight
+
+    def max_age(r):
+        assert r.headers["cache-control"].endswith(", must-revalidate")
+        return int(r.headers["cache-control"].split("max-age=")[1].split(",")[0])
+
+    assert seconds_until_midnight(datetime(2025, 3, 1, 23, 59, 30)) == 30
+    assert seconds_until_midnight(datetime(2025, 3, 1, 0, 0, 0)) == 86400
+    c = TestClient(app)
+    r = c.get("/api/numerology/features/daily-triangle.report.json", params={"dob": "29-10-2001"})
+    assert r.status_code == 200 and 0 < max_age(r) <= min(MAX_AGE, seconds_until_midnight())
+    fixed = c.get("/api/numerology/health/daily.report.json", params={"dob": "29-10-2001", "day": "01-01-2025"})
+    today = c.get("/api/numerology/health/daily.report.json", params={"dob": "29-10-2001"})
+    assert max_age(fixed) == MAX_AGE
+    assert max_age(today) <= MAX_AGE
+
+
+def test_canonical_inputs_share_cache_entries(monkeypatch):
+    import json
+    from numerology import num_api
+
+    monkeypatch.setenv("NUMEROLOGY_REPORT_STORE", "off")
+    num_api._template.cache_clear()
+    c = TestClient(app)
+    # same ABCD digits (2,1,2,1) spelled and dated differently; 2034 has 2025's year C/D
+    spellings = ["29-10-2001", "2001-10-29", "29/10/2001", "11-10-2001"]
+    bodies = [
+        c.get("/api/numerology/yearly-triangle.report.json", params={"dob": d, "year": y}).json()
+        for d, y in zip(spellings, [2025, 2034, 2025, 2034])
+    ]
+    assert num_api._template.cache_info().misses == 1
+    for d, y, body in zip(spellings, [2025, 2034, 2025, 2034], bodies):
+        assert (body["dob"], body["year"]) == (d, y)
+        assert {k: v for k, v in body.items() if k not in ("dob", "year")} == {
+            k: v for k, v in bodies[0].items() if k not in ("dob", "year")
+        }
+
+    # an explicit day equal to today resolves to the same entry as "today"
+    from datetime import date
+    today = date.today()
+    implicit = c.get("/api/numerology/health/daily.report.json", params={"dob": "29-10-2001"})
+    explicit = c.get("/api/numerology/health/daily.report.json", params={"dob": "29/10/2001", "day": today.isoformat()})
+    assert json.loads(implicit.content)["context"]["day"] == "today"
+    assert json.loads(explicit.content)["context"]["day"] == today.isoformat()
+    assert num_api._template.cache_info().misses == 2
+
+
+def test_batch_streams_reports_with_per_item_errors(monkeypatch):
+    import json
+    from numerology import num_api
+
+    monkeypatch.setenv("NUMEROLOGY_REPORT_STORE", "off")
+    spec = num_api._DETERMINISTIC["single"]
+    calls = []
+    monkeypatch.setitem(num_api._DETERMINISTIC, "single", spec._replace(build=lambda *a, **kw: calls.append(a) or spec.build(*a, **kw)))
+    items = [
+        {"dob": "29-10-2001"},
+        {"dob": "2001/10/29", "report_types": ["single", "yearly", "health", "nope"], "year": 2026, "gender": "female"},
+        {"dob": "31-02-2001"},
+        "29-10-2001",
+        {"dob": "04-07-1984", "report_types": ["health_monthly"]},
+    ]
+    c = TestClient(app)
+    r = c.post("/api/numerology/batch", json=items)
+    assert r.status_code == 200 and r.headers["content-type"].startswith("application/x-ndjson")
+    rows = {row["index"]: row for row in map(json.loads, r.text.splitlines())}
+    assert sorted(rows) == [0, 1, 2, 3, 4]
+    assert len(calls) == 1   # one build for both spellings of the same ABCD
+
+    def get(url, **params):
+        return c.get(f"/api/numerology/{url}", params=params).json()
+
+    assert rows[0]["reports"] == {"single": get("mystical-triangle.report.json", dob="29-10-2001")}
+    assert rows[1]["reports"] == {
+        "single": get("mystical-triangle.report.json", dob="2001/10/29"),
+        "yearly": get("yearly-triangle.report.json", dob="2001/10/29", year=2026),
+        "health": get("health-triangle.report.json", dob="2001/10/29", gender="female"),
+    }
+    assert set(rows[1]["errors"]) == {"nope"}
+    assert rows[2]["error"] == "Use DD-MM-YYYY or YYYY-MM-DD" and "reports" not in rows[2]
+    assert "error" in rows[3]
+    assert rows[4]["reports"] == {} and rows[4]["errors"] == {"health_monthly": "year is required"}
+
+    ndjson = b'{"dob": "29-10-2001"}\n\n{oops\n'
+    r = c.post("/api/numerology/batch", content=ndjson, headers={"content-type": "application/x-ndjson"})
+    rows = sorted(map(json.loads, r.text.splitlines()), key=lambda row: row["index"])
+    assert [("reports" in row, "error" in row) for row in rows] == [(True, False), (False, True)]
+    assert c.post("/api/numerology/batch", json={"dob": "29-10-2001"}).status_code == 400
@@ -0,0 +1,72 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from numerology.core import (
+    CELLS,
+    TRIANGLE_DTYPE,
+    mystical_triangle_values_batch,
+    mystical_triangle_values_image,
+)
+
+
+def _scalar_cells(dob: str) -> tuple:
+    vals = mystical_triangle_values_image(dob)
+    flat = {**vals["inputs"], **vals["layer1"], **vals["second_layer"], **vals["third_layer"]}
+    return tuple(flat[c] for c in CELLS)
+
+
+def test_batch_matches_scalar_1900_to_2100():
+    start, end = date(1900, 1, 1), date(2100, 12, 31)
+    days = np.arange(np.datetime64(start), np.datetime64(end) + 1)
+    batch = mystical_triangle_values_batch(days)
+    assert batch.dtype == TRIANGLE_DTYPE
+    assert len(batch) == (end - start).days + 1
+
+    d = start
+    for row in batch:
+        assert tuple(int(x) for x in row) == _scalar_cells(d.strftime("%d-%m-%Y")), d
+        d += timedelta(days=1)
+
+
+def test_batch_accepts_ymd_arrays_and_strings():
+    dobs = ["29-10-2001", "28-01-2005", "11-11-2011", "2000-01-01"]
+    from_str = mystical_triangle_values_batch(dobs)
+    from_ymd = mystical_triangle_values_batch(
+        day=[29, 28, 11, 1], month=[10, 1, 11, 1], year=[2001, 2005, 2011, 2000]
+    )
+    assert np.array_equal(from_str, from_ymd)
+    for row, dob in zip(from_str, dobs):
+        assert tuple(int(x) for x in row) == _scalar_cells(dob)
+
+
+def _row_dict(row) -> dict:
+    return {c: int(row[c]) for c in CELLS}
+
+
+def _flat(vals: dict) -> dict:
+    return {**vals["inputs"], **vals["layer1"], **vals["second_layer"], **vals["third_layer"]}
+
+
+def test_daily_range_matches_scalar_combine():
+    from numerology.core import daily_combined_triangle, daily_combined_triangle_range
+    days, combined = daily_combined_triangle_range("29-10-2001", "01-01-2024", "31-12-2024")
+    assert len(days) == len(combined) == 366
+    for day, row in zip(days.astype(object), combined):
+        expected = daily_combined_triangle("29-10-2001", day.strftime("%d-%m-%Y"))
+        assert _row_dict(row) == _flat(expected)
+
+
+def test_yearly_and_monthly_ranges_match_scalar_combine():
+    from numerology.core import (
+        monthly_combined_triangle,
+        monthly_combined_triangle_range,
+        yearly_combined_triangle,
+        yearly_combined_triangle_range,
+    )
+    for dob in ("28-01-2005", "15-08-1985"):
+        years, yearly = yearly_combined_triangle_range(dob, 1990, 2110)
+        _, monthly = monthly_combined_triangle_range(dob, 1990, 2110)
+        for y, yrow, mrow in zip(years, yearly, monthly):
+            assert _row_dict(yrow) == _flat(yearly_combined_triangle(dob, int(y)))
+            assert _row_dict(mrow) == _flat(monthly_combined_triangle(dob, int(y)))
@@ -0,0 +1,73 @@
+from numerology.features.calendar_signals import special_signal_calendar
+from numerology.features.daily_report import daily_triangle_report
+
+
+def _report_tags(dob, day):
+    notes = daily_triangle_report(dob, day)["panels"]["combined"].get("special_notes")
+    return notes["tags"] if notes else []
+
+
+def test_calendar_matches_daily_report_every_day():
+    for dob in ("29-10-2001", "07-03-1988"):
+        cal = special_signal_calendar(dob, 2024)
+        assert cal["year"] == 2024 and len(cal["days"]) == 366
+        for row in cal["days"]:
+            assert row["tags"] == _report_tags(dob, row["day"])
+
+
+def test_calendar_tag_counts():
+    cal = special_signal_calendar("29-10-2001", 2025)
+    expect = {}
+    for row in cal["days"]:
+        for t in row["tags"]:
+            expect[t] = expect.get(t, 0) + 1
+    assert cal["tag_counts"] == expect
+    assert cal["days"][0]["day"] == "01-01-2025" and cal["days"][-1]["day"] == "31-12-2025"
+
+
+def test_best_days_filters_and_ranking():
+    import pytest
+    from numerology.core import daily_combined_triangle
+    from numerology.core import _flat_values
+    from numerology.features.calendar_signals import best_days, parse_cell_constraints
+
+    assert parse_cell_constraints("G=1|9, p=6") == {"G": (1, 9), "P": (6,)}
+    with pytest.raises(ValueError):
+        parse_cell_constraints("Z=1")
+
+    res = best_days(
+        "29-10-2001", "01-01-2025", "30-06-2025",
+        cells={"G": [1, 9]}, exclude_tags=["accident_risk", "betrayal_risk"], top_k=5,
+    )
+    assert 0 < len(res["days"]) <= 5 and res["matches"] >= len(res["days"])
+    ranks = [(len(d["tags"]), d["day"][6:] + d["day"][3:5] + d["day"][:2]) for d in res["days"]]
+    assert ranks == sorted(ranks)
+    for d in res["days"]:
+        flat = _flat_values(daily_combined_triangle("29-10-2001", d["day"]))
+        assert flat["G"] in (1, 9) and d["values"] == flat
+        assert d["tags"] == _report_tags("29-10-2001", d["day"])
+        assert not {"accident_risk", "betrayal_risk"} & set(d["tags"])
+
+    with pytest.raises(ValueError):
+        best_days("29-10-2001", "01-01-2025", "30-06-2025", exclude_tags=["nope"])
+
+
+def test_tag_vocabulary_is_fixed_and_bad_inputs_are_400():
+    import pytest
+    from fastapi.testclient import TestClient
+    from app import app
+    from numerology.features import calendar_signals
+
+    vocab = dict(calendar_signals.TAG_BITS)
+    with pytest.raises(TypeError):
+        calendar_signals.TAG_BITS["bogus"] = 99
+    with pytest.raises(ValueError, match="Unknown tag"):
+        calendar_signals._tag_mask(["bogus"])
+    assert dict(calendar_signals.TAG_BITS) == vocab
+
+    c = TestClient(app)
+    url = "/api/numerology/features/special-calendar.json"
+    assert c.get(url, params={"dob": "29-10-2001", "year": 2025}).status_code == 200
+    for params in ({"dob": "31-02-2001", "year": 2025}, {"dob": "29-10-2001", "year": 0},
+                   {"dob": "29-10-2001", "year": 10000}):
+        assert c.get(url, params=params).status_code == 400
@@ -0,0 +1,66 @@
+# tests/test_canonical.py
+import random
+from datetime import date, datetime
+
+import pytest
+
+from numerology.canonical import day_for_key, day_key, dob_for_key, dob_key, year_for_key, year_key
+from numerology.core import parse_dob, _dob_abcd, _year_cd
+from numerology.fast_json import EchoTemplate
+
+
+def _strptime_parse(s: str) -> date:
+    """The former parse_dob: strptime over both accepted formats."""
+    s = s.strip().replace("/", "-")
+    for fmt in ("%d-%m-%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(s, fmt).date()
+        except ValueError:
+            pass
+    raise ValueError("Use DD-MM-YYYY or YYYY-MM-DD")
+
+
+def _outcome(parse, s):
+    try:
+        return parse(s)
+    except ValueError as e:
+        return str(e)
+
+
+def test_parse_dob_accepts_exactly_what_strptime_did():
+    rng = random.Random(7)
+    cases = ["29-10-2001", "2001-10-29", "9/1/2001", " 2001/1/9 ", " 9-1-2001", "31-02-2001",
+             "29-02-2000", "29-02-1900", "00-01-2001", "01-13-2001", "01-01-0000", "1-1-01", "01-01-20011"]
+    cases += ["".join(rng.choice("0123456789-/ ") for _ in range(rng.randint(5, 11))) for _ in range(20000)]
+    cases += [f"{d}-{m}-{y}" for d in ("1", "01", " 1", "31") for m in ("2", "02", " 2", "12") for y in ("2024", "0001", "9999")]
+    for s in cases:
+        assert _outcome(parse_dob, s) == _outcome(_strptime_parse, s), s
+
+
+def test_key_round_trips():
+    for dob in ["29-10-2001", "2001-10-29", "01-01-0001", "31-12-9999", "17/5/1990"]:
+        key = dob_key(dob)
+        assert key == "".join(map(str, _dob_abcd(parse_dob(dob))))
+        assert dob_key(dob_for_key(key)) == key
+    for year in [0, 1, 99, 100, 2000, 2025, 2034, 9999]:
+        key = year_key(year)
+        assert _year_cd(year_for_key(key)) == _year_cd(year)
+    assert year_for_key(year_key(12345)) == 12345 and year_for_key(year_key(-3)) == -3
+    assert day_key(None) == day_key("Today") == date.today().isoformat()
+    assert day_key("3/2/2026") == day_key("2026-02-03") == "2026-02-03"
+    assert day_for_key("2026-02-03") == "03-02-2026"
+    with pytest.raises(ValueError):
+        dob_key("2001.10.29")
+
+
+def test_echo_template_renders_raw_inputs():
+    report = {"dob": "02-01-0201", "year": 207, "panels": [{"dob": "other"}], "context": {"year": 207, "n": 1}}
+    t = EchoTemplate.of(report, {"dob": "02-01-0201", "year": 207})
+    assert t.names == ("dob", "year", "year")
+    assert t.render({"dob": "29/10/2001", "year": 2034}) == (
+        b'{"dob":"29/10/2001","year":2034,"panels":[{"dob":"other"}],"context":{"year":2034,"n":1}}'
+    )
+    with pytest.raises(ValueError):
+        EchoTemplate.of({"dob": "x"}, {"dob": "y"})
+    head = EchoTemplate.after_head(("dob", "year"), b'"a":1}')
+    assert head.render({"dob": "d", "year": 1}) == b'{"dob":"d","year":1,"a":1}'
@@ -0,0 +1,76 @@
+import pytest
+
+import numerology.context as context_mod
+from numerology.context import TriangleContext
+from numerology.features.daily_report import daily_triangle_report
+from numerology.features.health_report import health_daily_report, health_yearly_report
+from numerology.features.monthly_report import monthly_prediction_report
+from numerology.features.profile_bulletins import build_profile_bulletins
+from numerology.features.single_person_report import mystical_triangle_report
+from numerology.features.yearly_report import yearly_triangle_report
+
+
+def test_reports_with_shared_context_match_standalone():
+    dob = "29-10-2001"
+    ctx = TriangleContext(dob)
+    assert mystical_triangle_report(dob, ctx=ctx) == mystical_triangle_report(dob)
+    assert yearly_triangle_report(dob, 2025, ctx=ctx) == yearly_triangle_report(dob, 2025)
+    assert monthly_prediction_report(dob, 2025, ctx=ctx) == monthly_prediction_report(dob, 2025)
+    assert daily_triangle_report(dob, "12-03-2025", ctx=ctx) == daily_triangle_report(dob, "12-03-2025")
+    assert health_daily_report(dob, day="12-03-2025", ctx=ctx) == health_daily_report(dob, day="12-03-2025")
+    assert health_yearly_report(dob, 2025, gender="f", ctx=ctx) == health_yearly_report(dob, 2025, gender="f")
+    with pytest.raises(ValueError):
+        mystical_triangle_report("01-01-1990", ctx=ctx)
+
+
+def test_bulletins_compute_each_artifact_once(monkeypatch):
+    calls = {"parse": 0, "reads": [], "signals": []}
+    real_parse, real_reads, real_scan = context_mod.parse_dob, context_mod.build_reads, context_mod.scan_special_signals
+
+    def parse(s):
+        calls["parse"] += 1
+        return real_parse(s)
+
+    def reads(t):
+        calls["reads"].append(t.cells)
+        return real_reads(t)
+
+    def scan(**kw):
+        calls["signals"].append((kw["feature_type"], kw["final_values"].cells))
+        return real_scan(**kw)
+
+    monkeypatch.setattr(context_mod, "parse_dob", parse)
+    monkeypatch.setattr(context_mod, "build_reads", reads)
+    monkeypatch.setattr(context_mod, "scan_special_signals", scan)
+
+    out = build_profile_bulletins(dob="29-10-2001", gender="male", year=2025, month=3, day="today")
+    assert out["personality"] and out["health"]
+    assert calls["parse"] == 1
+    assert len(calls["reads"]) == len(set(calls["reads"]))
+    assert len(calls["signals"]) == len(set(calls["signals"]))
+
+
+def test_generated_builds_once_across_threads():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    ctx = TriangleContext("29-10-2001")
+    calls = []
+
+    def build():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return "narrative"
+
+    with ThreadPoolExecutor(4) as pool:
+        out = list(pool.map(lambda _: ctx.generated("person", (), build), range(8)))
+    assert out == ["narrative"] * 8 and len(calls) == 1
+    assert ctx.generated("yearly", ("25",), lambda: "y") == "y"
+
+    def boom():
+        raise RuntimeError("provider down")
+
+    with pytest.raises(RuntimeError):
+        ctx.generated("daily", ("2025-03-12",), boom)
+    assert ctx.generated("daily", ("2025-03-12",), lambda: "retried") == "retried"
@@ -80,3 +80,18 @@ def test_triangle_from_abcd_matches_pipeline():
     assert t["core"]["core_pair"] == int(f"{e}{f}")
     assert t["core"]["G"] == g
     assert t["core"]["P_outcome"] == p
+
+def test_triangle_table_matches_reference_pipeline():
+    # every ABCD key in the precomputed table must equal the original full_reduce pipeline
+    for a, b, c, d in it.product(range(10), repeat=4):
+        E = full_reduce(a + b); F = full_reduce(c + d); G = full_reduce(E + F)
+        I = full_reduce(a + E); J = full_reduce(b + E); H = full_reduce(I + J)
+        K = full_reduce(c + F); L = full_reduce(d + F); M = full_reduce(K + L)
+        N = full_reduce(F + G); O = full_reduce(E + G); P = full_reduce(N + O)
+        Q = full_reduce(O + P); R = full_reduce(N + P)
+        t = _triangle_from_abcd(a, b, c, d)
+        assert t["inputs"] == {"A": a, "B": b, "C": c, "D": d}
+        assert t["layer1"] == {"E": E, "F": F, "G": G}
+        assert t["second_layer"] == {"H": H, "I": I, "J": J, "K": K, "L": L, "M": M}
+        assert t["third_layer"] == {"N": N, "O": O, "P": P, "Q": Q, "R": R}
+        assert t["core"] == {"core_pair": int(f"{E}{F}"), "G": G, "P_outcome": P}
@@ -18,3 +18,22 @@ def test_yearly_panels_and_glance():
         assert k in rep["panels"]
     g = rep["summary"]["glance"]
     assert {"G","EF","P"} <= set(g.keys())
+
+
+def test_daily_range_matches_single_day_report():
+    from numerology.features.daily_report import iter_daily_range
+    rows = list(iter_daily_range("29-10-2001", "30-12-2024", "02-01-2025"))
+    assert [r["day"] for r in rows] == ["30-12-2024", "31-12-2024", "01-01-2025", "02-01-2025"]
+    for r in rows:
+        expect = daily_triangle_report("29-10-2001", r["day"])["panels"]["combined"]
+        assert {k: v for k, v in r.items() if k != "day"} == expect
+
+def test_daily_range_field_selection_and_limits():
+    import pytest
+    from numerology.features.daily_report import iter_daily_range
+    rows = list(iter_daily_range("29-10-2001", "2025-03-01", "2025-03-31", fields=["core"]))
+    assert len(rows) == 31 and all(set(r) == {"day", "core"} for r in rows)
+    with pytest.raises(ValueError):
+        next(iter_daily_range("29-10-2001", "01-01-2025", "02-01-2025", fields=["bogus"]))
+    with pytest.raises(ValueError):
+        next(iter_daily_range("29-10-2001", "01-01-1990", "01-01-2025"))
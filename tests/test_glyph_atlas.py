@@ -0,0 +1,52 @@
+# tests/test_glyph_atlas.py
+import io
+import itertools
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from numerology import render_service as rs
+from numerology.triangle_layout import cell_values
+
+
+def _pixels(png: bytes) -> np.ndarray:
+    return np.asarray(Image.open(io.BytesIO(png)).convert("RGBA")).astype(int)
+
+
+@pytest.mark.parametrize("layout, triangles", [
+    ("single", rs.single_triangles("29-10-2001")),
+    ("single", rs.single_triangles("17-12-1988")),
+    ("pair", rs.pair_triangles("29-10-2001", "05-05-1990")),
+    ("combined", rs.yearly_triangles("29-10-2001", 2034)),
+    ("combined", rs.monthly_triangles("05-05-1990", 2026, 11)),
+])
+def test_atlas_png_matches_matplotlib_pixels(layout, triangles):
+    values = [v for vals in triangles for v in cell_values(vals)]
+    png = rs.atlas(layout).png(values)
+    assert png is not None
+    reference = _pixels(rs.canvas(layout).render(triangles))
+    diff = np.abs(_pixels(png) - reference)
+    assert diff.max() == 0, f"{np.count_nonzero(diff.any(axis=2))} pixels differ"
+
+
+def test_every_digit_in_every_slot():
+    atlas, canvas = rs.atlas("single"), rs.canvas("single")
+    for d in range(10):   # digit d in slot i, d+1 in the next, ...
+        values = [(d + i) % 10 for i in range(7)]
+        reference = _pixels(canvas.render_texts([str(v) for v in values]))
+        assert (_pixels(atlas.png(values)) == reference).all()
+        assert (atlas.compose(values) == reference[..., 0]).all()
+
+
+def test_out_of_range_values_fall_back_to_matplotlib():
+    atlas = rs.atlas("single")
+    assert atlas.png([1, 2, 3, 4, 5, 6, 10]) is None and atlas.png([1, 2]) is None
+    triangle = {"inputs": {"A": 1, "B": 2, "C": 3, "D": 4}, "layer1": {"E": 5, "F": 6, "G": 12}}
+    assert rs.render_image("single", [triangle]) == rs.canvas("single").render([triangle])
+
+
+def test_atlas_png_decodes_for_many_combinations():
+    atlas = rs.atlas("combined")
+    for values in itertools.islice(itertools.product(range(10), repeat=7), 0, 10 ** 7, 99991):
+        Image.open(io.BytesIO(atlas.png(list(values)))).load()   # valid zlib stream and checksums
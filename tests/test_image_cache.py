@@ -0,0 +1,60 @@
+# tests/test_image_cache.py
+import os
+
+from fastapi.testclient import TestClient
+
+from app import app
+from numerology import num_api, render_service as rs
+from numerology.image_cache import ImageCache
+from numerology.render_pool import WorkerPool
+
+
+def test_memory_lru_and_disk_tiers(tmp_path):
+    cache = ImageCache(memory_bytes=10, disk_dir=tmp_path, disk_bytes=1 << 20)
+    cache.put("aa1.png", b"12345")
+    cache.put("bb2.png", b"67890")
+    assert cache.get("aa1.png") == b"12345"       # memory; aa1 is now most recent
+    cache.put("cc3.png", b"abcde")                 # evicts bb2 from memory only
+    assert cache.get("bb2.png") == b"67890"       # from disk
+    assert cache.get("zz9.png") is None
+    fresh = ImageCache(memory_bytes=10, disk_dir=tmp_path, disk_bytes=1 << 20)
+    assert fresh.get("cc3.png") == b"abcde"       # another process sees the files
+    s = cache.stats()
+    assert (s["memory_hits"], s["disk_hits"], s["misses"], s["stores"]) == (1, 1, 1, 3)
+    assert s["memory_bytes"] <= 10
+
+
+def test_disk_is_bounded_evicting_least_recently_used(tmp_path):
+    cache = ImageCache(memory_bytes=0, disk_dir=tmp_path, disk_bytes=3500)
+    for i in range(3):
+        cache.put(f"k{i}.png", bytes(1000))
+        os.utime(tmp_path / f"k{i}" / f"k{i}.png", (i, i))
+    cache.get("k0.png")                            # used again: newest now
+    cache.put("k3.png", bytes(1000))               # 4000 > 3500: evict down to 90%
+    names = sorted(p.name for p in tmp_path.glob("*/*"))
+    assert names == ["k0.png", "k2.png", "k3.png"]
+    assert cache.stats()["evictions"] == 1 and cache.stats()["disk_bytes"] == 3000
+
+
+def test_keys_follow_drawn_digits_not_input_spelling():
+    a = rs.image_key("single", rs.single_triangles("29-10-2001"))
+    assert a == rs.image_key("single", rs.single_triangles("2001-10-29"))
+    assert a != rs.image_key("single", rs.single_triangles("29-10-2001"), "pdf")
+    assert a != rs.image_key("single", rs.single_triangles("17-12-1988"))
+
+
+def test_endpoint_renders_each_image_once(monkeypatch, tmp_path):
+    cache = ImageCache(1 << 20, tmp_path, 1 << 20)
+    pool = WorkerPool("render", workers=1, queue=4, mode="inline")
+    monkeypatch.setattr(num_api, "IMAGE_CACHE", cache)
+    monkeypatch.setattr(num_api, "RENDER_POOL", pool)
+    c = TestClient(app)
+    bodies = [
+        c.get("/api/numerology/yearly-triptych.png", params={"dob": dob, "year": 2034}).content
+        for dob in ("29-10-2001", "2001-10-29", "29-10-2001")
+    ]
+    assert bodies[0] == bodies[1] == bodies[2] == rs.render_image("combined", rs.yearly_triangles("29-10-2001", 2034))
+    assert pool.stats()["jobs"]["combined.png"]["completed"] == 1
+    s = cache.stats()
+    assert (s["misses"], s["memory_hits"], s["stores"]) == (1, 2, 1)
+    assert set(c.get("/api/numerology/image-cache.json").json()) >= {"memory_hits", "disk_hits", "misses"}
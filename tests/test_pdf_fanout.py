@@ -0,0 +1,129 @@
+import threading
+import time
+
+import pytest
+
+from AI import limits
+from AI import settings as ai_settings
+from numerology import pdf
+
+
+def test_fan_out_runs_jobs_concurrently():
+    started = time.perf_counter()
+    out = pdf._fan_out({f"s{i}": lambda i=i: time.sleep(0.2) or i for i in range(5)}, workers=5, deadline=5)
+    assert out == {f"s{i}": i for i in range(5)}
+    assert time.perf_counter() - started < 0.6
+
+
+def test_fan_out_failures_and_late_jobs_are_none():
+    def boom():
+        raise RuntimeError("provider down")
+
+    release = threading.Event()
+    started = time.perf_counter()
+    out = pdf._fan_out({"ok": lambda: "text", "boom": boom, "slow": release.wait}, workers=3, deadline=0.2)
+    release.set()
+    assert out == {"ok": "text", "boom": None, "slow": None}
+    assert time.perf_counter() - started < 1
+
+
+def test_provider_limit_caps_concurrent_calls(monkeypatch, tmp_path):
+    monkeypatch.setattr(ai_settings.settings, "openai_concurrency", 2, raising=False)
+    monkeypatch.setattr(limits, "LOCK_DIR", tmp_path)
+    limits.reset()
+    active = peak = 0
+    lock = threading.Lock()
+
+    @limits.provider_limited("openai")
+    def call():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    try:
+        pdf._fan_out({str(i): call for i in range(6)}, workers=6, deadline=5)
+    finally:
+        limits.reset()
+    assert peak == 2
+
+
+def _hold_slot(lock_dir):
+    limits.LOCK_DIR = lock_dir
+    with limits._Slots("openai", 2).hold(10):
+        started = time.time()
+        time.sleep(0.3)
+        return started, time.time()
+
+
+@pytest.mark.skipif(limits.fcntl is None, reason="host-wide slots need flock")
+def test_provider_limit_holds_across_processes(tmp_path):
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(4, mp_context=multiprocessing.get_context("fork")) as pool:
+        spans = list(pool.map(_hold_slot, [tmp_path] * 4))
+    peak = max(sum(s <= t < e for s, e in spans) for t, _ in spans)
+    assert peak == 2
+
+
+def test_slot_wait_times_out(monkeypatch, tmp_path):
+    monkeypatch.setattr(limits, "LOCK_DIR", tmp_path)
+    other_process = limits._Slots("ollama", 1)   # own per-process semaphore, same slot file
+    with other_process.hold(1):
+        with pytest.raises(TimeoutError):
+            with limits._Slots("ollama", 1).hold(0.2):
+                pass
+    with limits._Slots("ollama", 1).hold(0.2):
+        pass
+
+
+@pytest.mark.slow
+def test_master_pdf_sections_generated_in_parallel(monkeypatch):
+    monkeypatch.setattr(ai_settings.settings, "llm_provider", "mock", raising=False)
+    monkeypatch.setattr(ai_settings.settings, "report_workers", 12, raising=False)
+
+    def slow(fn):
+        def wrapped(*args, **kwargs):
+            time.sleep(0.3)
+            return fn(*args, **kwargs)
+        return wrapped
+
+    for name in ("generate_daily_interpretation", "generate_monthly_interpretation",
+                 "generate_yearly_interpretation", "generate_health_interpretation",
+                 "generate_relationship_interpretation"):
+        monkeypatch.setattr(pdf, name, slow(getattr(pdf, name)))
+
+    started = time.perf_counter()
+    out = pdf.build_ai_master_report_pdf(
+        "29-10-2001", partner_dob="28-01-2005", year=2025, include_images=False
+    )
+    assert out[:5] == b"%PDF-"
+    assert time.perf_counter() - started < 5 * 0.3
+
+
+@pytest.mark.slow
+def test_master_pdf_generates_each_narrative_and_swot_once(monkeypatch):
+    monkeypatch.setattr(ai_settings.settings, "llm_provider", "mock", raising=False)
+    calls = {}
+
+    def counted(name, fn):
+        def wrapped(*args, **kwargs):
+            calls[name] = calls.get(name, 0) + 1
+            return fn(*args, **kwargs)
+        return wrapped
+
+    generators = ("generate_interpretation", "generate_swot_from_interpretation", "generate_daily_interpretation",
+                  "generate_yearly_interpretation", "generate_relationship_interpretation",
+                  "generate_profession_interpretation")
+    for name in generators:
+        monkeypatch.setattr(pdf, name, counted(name, getattr(pdf, name)))
+
+    out = pdf.build_ai_master_report_pdf(
+        "29-10-2001", partner_dob="28-01-2005", year=2025, include_images=False
+    )
+    assert out[:5] == b"%PDF-"
+    assert calls == {name: 1 for name in generators}
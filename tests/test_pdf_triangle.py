@@ -0,0 +1,58 @@
+import pytest
+from reportlab.graphics import renderPDF
+from reportlab.graphics.shapes import Drawing, Group, Line, String
+from reportlab.platypus import Image
+
+from numerology import pdf
+from numerology.pdf_triangle import triangle_drawing
+from numerology.triangle_layout import CELLS, TRIANGLE_LINES, cell_values, pair_triangles, single_triangles
+
+
+def _strings(node):
+    for child in getattr(node, "contents", []):
+        if isinstance(child, String):
+            yield child.text
+        elif isinstance(child, Group):
+            yield from _strings(child)
+
+
+def test_drawing_has_lines_labels_and_values_in_cell_order():
+    triangles = pair_triangles("29-10-2001", "28-01-2005")
+    d = triangle_drawing(triangles, 500, 300)
+    assert len(d.contents) == 2
+    for group, vals in zip(d.contents, triangles):
+        assert sum(isinstance(c, Line) for c in group.contents) == len(TRIANGLE_LINES)
+        texts = list(_strings(group))
+        assert texts[0::2] == list(CELLS)
+        assert texts[1::2] == [str(v) for v in cell_values(vals)]
+
+
+@pytest.mark.parametrize("count", [1, 2])
+def test_drawing_fits_box_and_keeps_aspect(count):
+    triangles = single_triangles("29-10-2001") * count
+    d = triangle_drawing(triangles, 523, 523 * 0.65)
+    assert d.width <= 523 + 1e-6 and d.height <= 523 * 0.65 + 1e-6
+    assert max(d.width / 523, d.height / (523 * 0.65)) == pytest.approx(1)
+    assert d.width / d.height == pytest.approx((count * 10 + (count - 1) * 1.5 + 0.4) / 10.4)
+
+
+def test_drawing_renders_to_pdf():
+    out = renderPDF.drawToString(triangle_drawing(single_triangles("29-10-2001"), 300, 200))
+    assert out[:5] == b"%PDF-"
+
+
+def test_flowable_is_vector_by_default():
+    assert isinstance(pdf._triangle_flowable("single", single_triangles("29-10-2001")), Drawing)
+
+
+def test_flowable_falls_back_to_png(monkeypatch):
+    def broken(*args):
+        raise RuntimeError("no drawing")
+
+    monkeypatch.setattr(pdf, "triangle_drawing", broken)
+    img = pdf._triangle_flowable("single", single_triangles("29-10-2001"))
+    assert isinstance(img, Image)
+
+    monkeypatch.undo()
+    monkeypatch.setattr(pdf, "PDF_TRIANGLES", "png")
+    assert isinstance(pdf._triangle_flowable("pair", pair_triangles("29-10-2001")), Image)
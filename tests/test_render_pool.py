@@ -0,0 +1,104 @@
+# tests/test_render_pool.py
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app
+from numerology import num_api
+from numerology.image_cache import ImageCache
+from numerology.render_pool import PoolBusy, WorkerPool
+from numerology.viz import build_triangle_png_bytes
+
+
+def test_pool_bounds_admission_and_reports_queue_depth():
+    release = threading.Event()
+
+    async def scenario():
+        pool = WorkerPool("t", workers=1, queue=1, mode="thread")
+        jobs = [asyncio.ensure_future(pool.run(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        busy = pool.stats()
+        with pytest.raises(PoolBusy):
+            await pool.run(release.wait, 5)
+        release.set()
+        assert await asyncio.gather(*jobs) == [True, True]
+        await asyncio.sleep(0.01)
+        pool.shutdown()
+        return busy, pool.stats()
+
+    busy, done = asyncio.run(scenario())
+    assert (busy["in_flight"], busy["running"], busy["queued"], busy["saturation"]) == (2, 1, 1, 1.0)
+    assert done["in_flight"] == 0 and done["peak_queued"] == 1
+    assert (done["submitted"], done["completed"], done["rejected"]) == (2, 2, 1)
+    assert done["run_ms"]["p50"] >= 0
+    assert done["jobs"]["wait"]["completed"] == 2
+
+
+def test_process_pool_renders_and_propagates_errors():
+    async def scenario():
+        pool = WorkerPool("p", workers=1, queue=0, mode="process")
+        try:
+            png = await pool.run(build_triangle_png_bytes, "29-10-2001")
+            with pytest.raises(ValueError):
+                await pool.run(build_triangle_png_bytes, "not-a-date")
+            return png, pool.stats()
+        finally:
+            pool.shutdown()
+
+    png, stats = asyncio.run(scenario())
+    assert png == build_triangle_png_bytes("29-10-2001")
+    assert (stats["completed"], stats["failed"]) == (1, 1)
+
+
+def test_full_render_pool_answers_503(monkeypatch):
+    full = WorkerPool("render", workers=1, queue=0, mode="inline")
+    full._in_flight = 1
+    monkeypatch.setattr(num_api, "RENDER_POOL", full)
+    monkeypatch.setattr(num_api, "IMAGE_CACHE", ImageCache(0))   # nothing cached: must render
+    c = TestClient(app)
+    r = c.get("/api/numerology/mystical-triangle.png", params={"dob": "29-10-2001"})
+    assert r.status_code == 503 and r.headers["retry-after"] == "1"
+    assert c.get("/api/numerology/mystical-triangle.report.json", params={"dob": "29-10-2001"}).status_code == 200
+    stats = c.get("/api/numerology/pools.json").json()
+    assert set(stats) == {"render", "pdf"}
+
+
+def test_crashed_worker_answers_503(monkeypatch):
+    import AI.ai_api as ai_api
+    from concurrent.futures.process import BrokenProcessPool
+
+    async def crashed(*args, **kwargs):
+        raise BrokenProcessPool("A process in the process pool was terminated abruptly")
+
+    for module, pool in ((num_api, num_api.RENDER_POOL), (ai_api, ai_api.PDF_POOL)):
+        monkeypatch.setattr(pool, "run", crashed)
+    monkeypatch.setattr(num_api, "IMAGE_CACHE", ImageCache(0))
+    c = TestClient(app)
+    r = c.get("/api/numerology/mystical-triangle.png", params={"dob": "29-10-2001"})
+    assert r.status_code == 503 and r.headers["retry-after"] == "1"
+    for path in ("/api/ai/report.pdf", "/api/ai/master-report.pdf"):
+        r = c.get(path, params={"dob": "29-10-2001"})
+        assert r.status_code == 503 and r.headers["retry-after"] == "5", path
+
+
+def _crash():
+    import os
+    os._exit(1)
+
+
+def test_process_pool_recovers_after_worker_crash():
+    from concurrent.futures import BrokenExecutor
+
+    async def scenario():
+        pool = WorkerPool("p", workers=1, queue=0, mode="process")
+        try:
+            with pytest.raises(BrokenExecutor):
+                await pool.run(_crash)
+            await asyncio.sleep(0.05)
+            return await pool.run(build_triangle_png_bytes, "29-10-2001")
+        finally:
+            pool.shutdown()
+
+    assert asyncio.run(scenario()) == build_triangle_png_bytes("29-10-2001")
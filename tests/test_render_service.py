@@ -0,0 +1,74 @@
+# tests/test_render_service.py
+import matplotlib.pyplot as plt
+import pytest
+
+from numerology import render_service as rs
+from numerology import viz
+
+
+CASES = [
+    ("single", rs.single_triangles, ("29-10-2001",), lambda: viz.plot_mystical_triangle_excel_exact("29-10-2001")),
+    ("pair", rs.pair_triangles, ("29-10-2001", "17-12-1988"), lambda: viz.plot_three_triangles("29-10-2001", "17-12-1988")),
+    ("pair", rs.pair_triangles, ("29-10-2001", "today"), lambda: viz.plot_three_triangles("29-10-2001", "today")),
+    ("combined", rs.yearly_triangles, ("29-10-2001", 2034), lambda: viz.plot_yearly_triptych("29-10-2001", 2034)),
+    ("combined", rs.monthly_triangles, ("05-05-1990", 2026, 11), lambda: viz.plot_monthly_triptych("05-05-1990", 2026, 11)),
+    ("combined", rs.daily_triangles, ("05-05-1990", "01-02-2020"), lambda: viz.plot_daily_triptych("05-05-1990", "01-02-2020")),
+]
+
+
+@pytest.mark.parametrize("layout, triangles, args, plot", CASES)
+def test_reused_canvas_matches_fresh_figure(layout, triangles, args, plot):
+    rs.canvas(layout).render(triangles("01-01-2000", *args[1:]))   # leave other numbers on the canvas first
+    assert rs.canvas(layout).render(triangles(*args)) == viz.figure_bytes(plot()[0])
+
+
+def test_renders_reuse_figures_and_leave_nothing_open():
+    rs.warm()
+    figures = {name: c.figure for name, c in rs._canvases.items()}
+    artists = len(rs.canvas("combined").figure.axes[0].get_children())
+    for i in range(20):
+        rs.yearly_png("29-10-2001", 2000 + i)
+        rs.pair_png("29-10-2001", f"{1 + i:02d}-05-1990")
+    assert {name: c.figure for name, c in rs._canvases.items()} == figures
+    assert len(rs.canvas("combined").figure.axes[0].get_children()) == artists
+    assert plt.get_fignums() == []
+
+
+def test_invalid_inputs_raise_and_the_canvas_recovers():
+    with pytest.raises(ValueError):
+        rs.monthly_png("29-10-2001", 2026, 13)
+    with pytest.raises(ValueError):
+        rs.triangle_png("31-02-2001")
+    assert rs.triangle_pdf("29-10-2001").startswith(b"%PDF")
+
+
+def test_svg_template_fills_values_in_cell_order():
+    import xml.etree.ElementTree as ET
+    from numerology.core import mystical_triangle_values_image
+    from numerology.triangle_layout import cell_values
+
+    ns = "{http://www.w3.org/2000/svg}"
+    root = ET.fromstring(rs.pair_svg("29-10-2001", "17-12-1988"))
+    labels, values = (g.findall(f"{ns}text") for g in root.iter(f"{ns}g") if g.get("font-size"))
+    assert [t.text for t in labels] == list("ABCDEFG") * 2
+    expected = cell_values(mystical_triangle_values_image("29-10-2001")) + cell_values(
+        mystical_triangle_values_image("17-12-1988"))
+    assert [t.text for t in values] == [str(v) for v in expected]
+    assert rs.yearly_svg("29-10-2001", 2034) != rs.yearly_svg("29-10-2001", 2035)
+
+
+def test_svg_endpoints():
+    from fastapi.testclient import TestClient
+    from app import app
+
+    c = TestClient(app)
+    for path, params in [
+        ("mystical-triangle.svg", {"dob": "29-10-2001"}),
+        ("mystical-triangle-triptych.svg", {"left": "29-10-2001", "right": "17-12-1988"}),
+        ("yearly-triptych.svg", {"dob": "29-10-2001", "year": 2034}),
+        ("monthly-triptych.svg", {"dob": "29-10-2001", "year": 2034, "month": 3}),
+        ("daily-triptych.svg", {"dob": "29-10-2001", "day": "01-02-2020"}),
+    ]:
+        r = c.get(f"/api/numerology/{path}", params=params)
+        assert r.status_code == 200 and r.headers["content-type"] == "image/svg+xml"
+        assert r.content.startswith(b"<svg") and r.headers["etag"]
@@ -0,0 +1,71 @@
+# tests/test_report_store.py
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app
+from numerology import report_store
+from numerology.core import parse_dob, _dob_abcd
+
+DOBS = ["29-10-2001", "1990-05-17", "04-07-1984", "09/12/1975"]
+
+
+@pytest.fixture()
+def store(tmp_path, monkeypatch):
+    """A store holding just the ABCD keys of DOBS (plus 2025/2026 drivers)."""
+    wanted = {_dob_abcd(parse_dob(d)) for d in DOBS}
+    full = report_store._representative_dobs
+    monkeypatch.setattr(report_store, "_representative_dobs", lambda: (x for x in full() if x[0] in wanted))
+    path = tmp_path / "reports.sqlite"
+    n = report_store.build_store(path, [2025, 2026])
+    # single, profession, mulank_bhagyank + 2 health + 2 yearly + 2 monthly per key
+    assert n == 9 * len(wanted)
+    monkeypatch.setenv("NUMEROLOGY_REPORT_STORE", str(path))
+    return path
+
+
+ROUTES = [
+    ("single", "/api/numerology/mystical-triangle.report.json", {}),
+    ("profession", "/api/numerology/profession.report.json", {}),
+    ("mulank_bhagyank", "/api/numerology/mulank-bhagyank.profile.json", {}),
+    ("health", "/api/numerology/health-triangle.report.json", {}),
+    ("health", "/api/numerology/health-triangle.report.json", {"gender": "Female"}),
+    ("yearly", "/api/numerology/yearly-triangle.report.json", {"year": 2025}),
+    ("monthly", "/api/numerology/monthly.report.json", {"year": 2026}),
+]
+
+
+@pytest.mark.parametrize("kind,url,extra", ROUTES)
+def test_store_serves_same_bytes_as_live(store, monkeypatch, kind, url, extra):
+    from numerology import num_api
+
+    c = TestClient(app)
+    for dob in DOBS:
+        params = {"dob": dob, **extra}
+        assert report_store.stored_report(kind, dob, extra.get("year"), gender=extra.get("gender")) is not None
+        num_api._template.cache_clear()   # served from the store, not a template cached earlier
+        served = c.get(url, params=params)
+        monkeypatch.setenv("NUMEROLOGY_REPORT_STORE", "off")
+        num_api._template.cache_clear()   # built live, not the stored template just cached
+        live = c.get(url, params=params)
+        monkeypatch.setenv("NUMEROLOGY_REPORT_STORE", str(store))
+        assert served.status_code == live.status_code == 200
+        assert served.content == live.content
+        assert json.loads(served.content)["dob"] == dob
+
+
+def test_store_misses_fall_back(store):
+    # 2031 has a different year C/D than the stored 2025/2026 drivers; 1887 a different ABCD
+    assert report_store.stored_report("yearly", DOBS[0], 2031) is None
+    assert report_store.stored_report("single", "01-01-1887") is None
+    r = TestClient(app).get("/api/numerology/yearly-triangle.report.json", params={"dob": DOBS[0], "year": 2031})
+    assert r.status_code == 200 and r.json()["year"] == 2031
+
+
+def test_store_invalidated_by_source_change(store, monkeypatch):
+    assert report_store.stored_report("single", DOBS[0]) is not None
+    monkeypatch.setattr(report_store, "source_version", lambda: "edited")
+    monkeypatch.setattr(report_store, "_local", type(report_store._local)())
+    assert report_store.stored_report("single", DOBS[0]) is None
+    assert report_store.store_status(store)["current"] is False
@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+
+from numerology.core import dob_triangle
+from numerology.reads import build_reads
+from numerology.features.special_numbers import scan_special_signals, _scan_triples
+from numerology.reverse_index import get_reverse_index, expand_abcd_dates, parse_criteria
+
+
+def _brute(pred, start=date(1990, 1, 1), end=date(1992, 12, 31)):
+    out, d = [], start
+    while d <= end:
+        if pred(dob_triangle(d.isoformat())):
+            out.append(d)
+        d += timedelta(days=1)
+    return out
+
+
+def test_reads_and_sandwich_triple_query_matches_brute_force():
+    idx = get_reverse_index()
+    keys = idx.query(reads={"EF(CORE)": [18, 81]}, triples={"AEG": "sandwich"})
+    got = expand_abcd_dates(keys, "01-01-1990", "31-12-1992").tolist()
+
+    def pred(t):
+        s = _scan_triples(t.flat)["AEG"]
+        return build_reads(t)["EF(CORE)"] in (18, 81) and s[0] == s[2]
+    assert got == _brute(pred)
+
+
+def test_cells_and_tags_query():
+    idx = get_reverse_index()
+    keys = idx.query(cells={"G": 5}, tags=["dual_personality"], feature="person")
+    assert keys
+    for k in list(keys)[:50]:
+        t = idx.triangles[k]
+        notes = scan_special_signals(feature_type="person", final_values=t)
+        assert t.G == 5 and "dual_personality" in notes["tags"]
+    got = expand_abcd_dates(keys, "01-01-1990", "31-12-1992").tolist()
+    assert got == _brute(lambda t: t.G == 5 and "dual_personality" in (
+        (scan_special_signals(feature_type="person", final_values=t) or {}).get("tags", [])))
+
+
+def test_parse_criteria():
+    assert parse_criteria("EF(CORE)=18|81, G=5") == {"EF(CORE)": ["18", "81"], "G": ["5"]}
+    assert parse_criteria(None) == {}
+
+
+def test_unknown_tags_and_long_ranges_are_rejected():
+    import pytest
+    from fastapi.testclient import TestClient
+    from app import app
+
+    idx = get_reverse_index()
+    with pytest.raises(ValueError, match="Unknown tags"):
+        idx.query(tags=["bogus"], feature="person")
+    with pytest.raises(ValueError, match="Unknown tags"):
+        idx.query(tags=["accident_risk"], feature="person")   # a daily/monthly tag
+    assert idx.query(tags=["downfall_18"], feature="yearly") is not None
+    with pytest.raises(ValueError, match="Range too long"):
+        expand_abcd_dates({2121}, "01-01-0001", "31-12-9999")
+
+    c = TestClient(app)
+    url = "/api/numerology/reverse-index.json"
+    assert c.get(url, params={"tags": "bogus"}).status_code == 400
+    assert c.get(url, params={"cells": "G=5", "start": "01-01-0001", "end": "31-12-9999"}).status_code == 400
+    ok = c.get(url, params={"cells": "G=5", "start": "01-01-1990", "end": "31-12-2009", "limit": 5})
+    assert ok.status_code == 200 and len(ok.json()["dates"]) == 5
@@ -0,0 +1,64 @@
+# tests/test_shared_tables.py
+import pytest
+
+from numerology import shared_tables
+from numerology.core import CELLS, Triangle
+from numerology.reads import build_reads
+from numerology.reverse_index import ReverseIndex
+from numerology.features.special_numbers import scan_special_signals
+
+
+@pytest.fixture(scope="module")
+def tables(tmp_path_factory):
+    path = tmp_path_factory.mktemp("tables") / "shared_tables.bin"
+    mp = pytest.MonkeyPatch()
+    mp.setattr(shared_tables, "_features", lambda: ["person", "daily"])
+    try:
+        shared_tables.build_tables(path)
+    finally:
+        mp.undo()
+    return shared_tables.SharedTables(path)
+
+
+def test_tables_match_live_computation(tables):
+    assert tables.version == shared_tables.source_version()
+    assert tables.cells.shape == (10_000, len(CELLS)) and not tables.cells.flags.writeable
+    for key in range(0, 10_000, 37):
+        tri = Triangle.from_abcd(key // 1000, key // 100 % 10, key // 10 % 10, key % 10)
+        assert tables.cells[key].tobytes() == tri.cells
+        reads = build_reads(tri)
+        assert dict(zip(tables.read_names, tables.reads[key].tolist())) == reads
+        for feature in ("person", "daily"):
+            notes = scan_special_signals(feature_type=feature, final_values=tri)
+            assert set(tables.tags_of(feature, key)) == set(notes["tags"] if notes else ())
+    with pytest.raises(ValueError):
+        tables.signals("nope")
+
+
+def test_reverse_index_from_shared_tables(tables):
+    shared, live = ReverseIndex(tables), ReverseIndex()
+    assert shared.cells == live.cells
+    assert shared.reads == live.reads
+    assert shared.triples == live.triples
+    assert shared.tags("person") == live.tags("person")
+    assert shared.query(cells={"G": [1, 9]}, triples={"AEG": "sandwich"}) == \
+        live.query(cells={"G": [1, 9]}, triples={"AEG": "sandwich"})
+
+
+def test_stale_or_missing_tables_are_ignored(tables, tmp_path, monkeypatch):
+    bad = tmp_path / "bad.bin"
+    bad.write_bytes(b"not a tables file" * 8)
+    cases = [
+        (tmp_path / "missing.bin", None),
+        (bad, None),
+        (tables.path, "edited"),   # built from other sources
+    ]
+    try:
+        for path, version in cases:
+            monkeypatch.setenv("NUMEROLOGY_SHARED_TABLES", str(path))
+            if version:
+                monkeypatch.setattr(shared_tables, "source_version", lambda: version)
+            shared_tables.get_shared_tables.cache_clear()
+            assert shared_tables.get_shared_tables() is None
+    finally:
+        shared_tables.get_shared_tables.cache_clear()
@@ -56,3 +56,77 @@ def test_aeg_same_triple_triggers_daily():
     assert ("accident_risk" in notes["tags"]) or ("negative_cycle" in notes["tags"]), (
         f"Expected accident/negative tags when AEG/DFG is same-number. Got tags={notes['tags']} aeg={aeg} dfg={dfg}"
     )
+
+
+def test_compiled_rules_match_reference_loop():
+    from numerology.core import Triangle, combine_two_triangles, mystical_triangle_values_image
+    from numerology.features.special_numbers import (
+        SPECIAL_RULES,
+        _scan_special_signals_reference,
+    )
+    features = sorted({f for r in SPECIAL_RULES for f in r["feature"]}) + ["unknown"]
+    tris = [Triangle.from_abcd(k // 1000, k // 100 % 10, k // 10 % 10, k % 10) for k in range(0, 10000, 7)]
+    for ft in features:
+        for t in tris:
+            assert scan_special_signals(feature_type=ft, final_values=t) == \
+                _scan_special_signals_reference(feature_type=ft, final_values=t)
+    # dict inputs, combined (non-pipeline) triangles and caller-supplied reads
+    combo = combine_two_triangles(mystical_triangle_values_image("29-10-2001"),
+                                  mystical_triangle_values_image("18-08-2025"))
+    for ft in features:
+        for reads in (None, {"X": 18, "Y": 81, "Z": 42, "W": "n/a"}):
+            assert scan_special_signals(feature_type=ft, final_values=combo, final_reads=reads) == \
+                _scan_special_signals_reference(feature_type=ft, final_values=combo, final_reads=reads)
+    partial = {"inputs": combo["inputs"], "layer1": combo["layer1"]}
+    for ft in features:
+        assert scan_special_signals(feature_type=ft, final_values=partial, final_reads={"EF": 18}) == \
+            _scan_special_signals_reference(feature_type=ft, final_values=partial, final_reads={"EF": 18})
+
+
+def test_signal_and_polarity_cache_return_copies():
+    from numerology.core import Triangle
+    from numerology.features.special_numbers import _scan_special_signals_reference
+    t = Triangle.from_abcd(1, 1, 1, 5)
+    first = scan_special_signals(feature_type="daily", final_values=t)
+    assert first is not None
+    first["tags"].append("bogus")
+    first["triples_seen"].clear()
+    assert scan_special_signals(feature_type="daily", final_values=t) == \
+        _scan_special_signals_reference(feature_type="daily", final_values=t)
+
+    pol = summarize_polarity(t)
+    pol["detail"]["positive"].clear()
+    assert summarize_polarity(t)["detail"]["positive"]
+    assert summarize_polarity(t) == summarize_polarity(t.to_dict())
+
+
+def test_signal_cache_bypass_and_rule_changes(monkeypatch):
+    from numerology.core import Triangle
+    import numerology.features.special_numbers as sn
+    t = Triangle.from_abcd(2, 4, 6, 8)
+    custom = {"X": 15}   # reads that differ from the triangle's own
+    assert sn.scan_special_signals(feature_type="yearly", final_values=t, final_reads=custom) == \
+        sn._scan_special_signals_reference(feature_type="yearly", final_values=t, final_reads=custom)
+
+    before = sn.scan_special_signals(feature_type="person", final_values=t)
+    monkeypatch.setattr(sn, "SPECIAL_RULES", sn.SPECIAL_RULES + [
+        {"feature": ["person"], "left_digits_any": [2], "tags": ["extra_tag"], "note": "extra"},
+    ])
+    after = sn.scan_special_signals(feature_type="person", final_values=t)
+    assert "extra_tag" in after["tags"] and (before is None or "extra_tag" not in before["tags"])
+
+
+def test_recompile_rules_picks_up_in_place_edits(monkeypatch):
+    from numerology.core import Triangle
+    import numerology.features.special_numbers as sn
+    t = Triangle.from_abcd(2, 4, 6, 8)
+    rule = {"feature": ["person"], "left_digits_any": [], "tags": ["edited_tag"], "note": "edited"}
+    monkeypatch.setattr(sn, "SPECIAL_RULES", sn.SPECIAL_RULES + [rule])
+    before = sn.scan_special_signals(feature_type="person", final_values=t)
+    assert before is None or "edited_tag" not in before["tags"]
+
+    rule["left_digits_any"] = [2]   # same list, same length: not detected on its own
+    sn.recompile_rules()
+    after = sn.scan_special_signals(feature_type="person", final_values=t)
+    assert "edited_tag" in after["tags"]
+    assert after == sn._scan_special_signals_reference(feature_type="person", final_values=t)
@@ -89,3 +89,33 @@ def test_plot_three_triangles(tmp_path):
     assert "right" in result
     assert "combined" in result
     assert (tmp_path / "triptych.png").exists()
+
+
+def test_triangle_object_matches_dict_shape():
+    from numerology.core import as_triangle, dob_triangle
+    t = dob_triangle("29-10-2001")
+    vals = mystical_triangle_values_image("29-10-2001")
+    assert t.to_dict() == vals
+    assert as_triangle(vals) == t
+    assert t.G == t[6] == t["G"] == vals["layer1"]["G"]
+    assert t["inputs"] == vals["inputs"] and t["core"] == vals["core"]
+    assert list(t.flat) == list("ABCDEFGHIJKLMNOPQR")
+    with pytest.raises(AttributeError):
+        t.G = 1
+    with pytest.raises(TypeError):
+        t.flat["G"] = 1
+
+
+def test_triangle_combine_and_helpers_accept_triangle():
+    from numerology.core import dob_triangle
+    from numerology.traits import summarize_polarity
+    from numerology.features.special_numbers import scan_special_signals
+    left, right = dob_triangle("29-10-2001"), dob_triangle("28-01-2005")
+    combo = left.combine(right)
+    combo_dict = combine_two_triangles(left.to_dict(), right.to_dict())
+    assert combo.to_dict() == combo_dict
+    assert build_reads(combo) == build_reads(combo_dict)
+    assert summarize_polarity(combo) == summarize_polarity(combo_dict)
+    for ft in ("daily", "monthly", "yearly", "relationship", "person"):
+        assert scan_special_signals(feature_type=ft, final_values=combo) == \
+            scan_special_signals(feature_type=ft, final_values=combo_dict)